@@ -15,7 +15,7 @@ between all peers.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from ipaddress import ip_address
 
 from .constants import *
@@ -488,6 +488,7 @@ class BGPAgent:
 
         # Run decision process for each prefix
         changed_prefixes = []
+        kernel_routes = []  # (prefix, next_hop, metric) installed in one batch
 
         for prefix in all_prefixes:
             # Collect all candidate routes for this prefix
@@ -529,11 +530,8 @@ class BGPAgent:
                 changed_prefixes.append(prefix)
                 self.logger.debug(f"Installed new best path for {prefix} via {best_route.peer_id}")
 
-                # Install route into kernel
-                if self.kernel_route_manager and best_route.next_hop:
-                    self.kernel_route_manager.install_route(
-                        prefix, best_route.next_hop, protocol="bgp"
-                    )
+                if best_route.next_hop:
+                    kernel_routes.append((prefix, best_route.next_hop, 100))
 
             elif current_best.peer_id != best_route.peer_id:
                 # Best path changed
@@ -541,11 +539,12 @@ class BGPAgent:
                 changed_prefixes.append(prefix)
                 self.logger.info(f"Best path changed for {prefix}: {current_best.peer_id} → {best_route.peer_id}")
 
-                # Install route into kernel
-                if self.kernel_route_manager and best_route.next_hop:
-                    self.kernel_route_manager.install_route(
-                        prefix, best_route.next_hop, protocol="bgp"
-                    )
+                if best_route.next_hop:
+                    kernel_routes.append((prefix, best_route.next_hop, 100))
+
+        # Install new best paths into the kernel with a single batch
+        if self.kernel_route_manager and kernel_routes:
+            await self.kernel_route_manager.install_routes_async(kernel_routes, protocol="bgp")
 
         # If best paths changed, trigger route advertisement
         if changed_prefixes:
@@ -556,9 +555,16 @@ class BGPAgent:
         """
         Advertise routes to peers
 
+        Peers that would receive identical UPDATEs (same NLRI, same local
+        address and same iBGP/eBGP treatment - typically a reflector's
+        clients) share one encoded message instead of each encoding its own.
+
         Args:
             changed_prefixes: List of prefixes that changed
         """
+        # (nlri, withdrawn, local_ip, is_ibgp) -> (UPDATE, encoded bytes)
+        encoded_updates: Dict[Tuple, Tuple[BGPUpdate, bytes]] = {}
+
         for session in self.sessions.values():
             if not session.is_established():
                 continue
@@ -594,29 +600,37 @@ class BGPAgent:
 
             # Send UPDATE if there are changes
             if nlri or withdrawn:
-                # Get path attributes from best route
-                path_attrs_dict = {}
-                if nlri and changed_prefixes:
-                    best_route = self.loc_rib.lookup(nlri[0])
-                    if best_route:
-                        path_attrs_list = list(best_route.path_attributes.values())
-
-                        # Modify attributes for advertisement
-                        path_attrs_list = self._prepare_attributes_for_advertisement(
-                            path_attrs_list, session
-                        )
-
-                        # Convert list back to dict
-                        path_attrs_dict = {attr.type_code: attr for attr in path_attrs_list}
-
-                # Create and send UPDATE
-                update = BGPUpdate(
-                    withdrawn_routes=withdrawn,
-                    path_attributes=path_attrs_dict,
-                    nlri=nlri
-                )
+                # Attributes only depend on the session through its local
+                # address (NEXT_HOP) and whether it is iBGP
+                key = (tuple(nlri), tuple(withdrawn), session.config.local_ip,
+                       session.config.peer_as == self.local_as)
+                cached = encoded_updates.get(key)
+                if cached is None:
+                    # Get path attributes from best route
+                    path_attrs_dict = {}
+                    if nlri and changed_prefixes:
+                        best_route = self.loc_rib.lookup(nlri[0])
+                        if best_route:
+                            path_attrs_list = list(best_route.path_attributes.values())
+
+                            # Modify attributes for advertisement
+                            path_attrs_list = self._prepare_attributes_for_advertisement(
+                                path_attrs_list, session
+                            )
+
+                            # Convert list back to dict
+                            path_attrs_dict = {attr.type_code: attr for attr in path_attrs_list}
+
+                    # Create UPDATE
+                    update = BGPUpdate(
+                        withdrawn_routes=withdrawn,
+                        path_attributes=path_attrs_dict,
+                        nlri=nlri
+                    )
+                    cached = encoded_updates[key] = (update, update.encode())
 
-                await session._send_message(update)
+                update, data = cached
+                await session._send_message(update, data)
 
                 session.stats['routes_advertised'] += len(nlri)
                 self.logger.debug(f"Advertised {len(nlri)} routes, withdrew {len(withdrawn)} to {session.peer_id}")
@@ -43,6 +43,15 @@ class PathAttribute(ABC):
         """Decode attribute-specific value, return True if successful"""
         pass
 
+    def to_display_str(self) -> str:
+        """
+        Render attribute value for show/monitor output
+
+        Returns:
+            Display string (the repr unless a subclass overrides it)
+        """
+        return repr(self)
+
     def encode(self) -> bytes:
         """
         Encode attribute to wire format
@@ -144,6 +153,7 @@ class ASPathAttribute(PathAttribute):
         super().__init__(ATTR_AS_PATH, flags)
         # segments: List of (segment_type, [ASNs])
         self.segments = segments or []
+        self._display_str: Optional[str] = None  # Cleared by decode_value/prepend
 
     def encode_value(self, four_byte_as: bool = True) -> bytes:
         """
@@ -172,6 +182,7 @@ class ASPathAttribute(PathAttribute):
             four_byte_as: Expect 4-byte AS numbers (RFC 6793). Default True.
         """
         self.segments = []
+        self._display_str = None
         offset = 0
         as_size = 4 if four_byte_as else 2
 
@@ -206,6 +217,7 @@ class ASPathAttribute(PathAttribute):
 
         Adds ASN to beginning of first AS_SEQUENCE, or creates new AS_SEQUENCE
         """
+        self._display_str = None
         if self.segments and self.segments[0][0] == AS_SEQUENCE:
             # Prepend to existing AS_SEQUENCE
             seg_type, as_list = self.segments[0]
@@ -248,6 +260,19 @@ class ASPathAttribute(PathAttribute):
             path.extend(as_list)
         return path
 
+    def to_display_str(self) -> str:
+        """
+        Render AS_PATH as space-separated ASNs, memoized until the path changes
+
+        Returns:
+            AS path string (e.g. "65001 65002"), "" for an empty path
+        """
+        if self._display_str is None:
+            self._display_str = " ".join(
+                str(asn) for _, as_list in self.segments for asn in as_list
+            )
+        return self._display_str
+
     def __repr__(self) -> str:
         parts = []
         for seg_type, as_list in self.segments:
@@ -281,6 +306,9 @@ class NextHopAttribute(PathAttribute):
         self.next_hop = socket.inet_ntoa(data)
         return True
 
+    def to_display_str(self) -> str:
+        return self.next_hop
+
     def __repr__(self) -> str:
         return f"NEXT_HOP({self.next_hop})"
 
@@ -9,8 +9,9 @@ Implements three RIBs per RFC 4271 Section 3.2:
 Each RIB stores BGPRoute objects containing prefix and path attributes.
 """
 
+import heapq
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from ipaddress import IPv4Network, IPv6Network, ip_network
 
@@ -45,6 +46,9 @@ class BGPRoute:
     # RPKI validation state (0=Valid, 1=Invalid, 2=NotFound)
     validation_state: Optional[int] = None
 
+    # AS_PATH rendered for display, filled in when installed in the Loc-RIB
+    as_path_str: str = field(default="", repr=False)
+
     def __post_init__(self):
         """Post-initialization to parse prefix length"""
         if '/' in self.prefix:
@@ -124,6 +128,25 @@ class BGPRoute:
         return None
 
 
+def format_as_path(route: BGPRoute) -> str:
+    """
+    Render a route's AS_PATH as space-separated ASNs
+
+    Args:
+        route: BGP route
+
+    Returns:
+        AS path string ("" without AS_PATH, "?" if it cannot be read)
+    """
+    path_attr = route.path_attributes.get(2)  # ATTR_AS_PATH
+    if path_attr is None:
+        return ""
+    try:
+        return path_attr.to_display_str()
+    except Exception:
+        return "?"
+
+
 class AdjRIBIn:
     """
     Adjacency RIB In (RFC 4271 Section 3.2)
@@ -264,6 +287,10 @@ class LocRIB:
     def __init__(self):
         # routes[prefix] = best_route
         self._routes: Dict[str, BGPRoute] = {}
+        # Bumped on every install/removal so readers can cache derived views
+        self.version = 0
+        # (version, count, routes) of the last get_first_routes() call
+        self._first_routes: Tuple[int, int, List[BGPRoute]] = (-1, 0, [])
 
     def install_route(self, route: BGPRoute) -> Optional[BGPRoute]:
         """
@@ -280,9 +307,11 @@ class LocRIB:
 
         # Mark as best
         route.best = True
+        route.as_path_str = format_as_path(route)
 
         # Install
         self._routes[prefix] = route
+        self.version += 1
 
         return old_route
 
@@ -299,6 +328,7 @@ class LocRIB:
         if prefix in self._routes:
             route = self._routes.pop(prefix)
             route.best = False
+            self.version += 1
             return route
         return None
 
@@ -323,6 +353,25 @@ class LocRIB:
         """
         return list(self._routes.values())
 
+    def get_first_routes(self, count: int) -> List[BGPRoute]:
+        """
+        Get the first routes in prefix order (e.g. for a table display)
+
+        Selects with a bounded heap instead of sorting the whole Loc-RIB,
+        and reuses the result until the Loc-RIB changes.
+
+        Args:
+            count: Maximum number of routes
+
+        Returns:
+            Up to count routes sorted by prefix
+        """
+        version, cached_count, routes = self._first_routes
+        if version != self.version or cached_count != count:
+            routes = [self._routes[prefix] for prefix in heapq.nsmallest(count, self._routes)]
+            self._first_routes = (self.version, count, routes)
+        return routes
+
     def get_prefixes(self) -> List[str]:
         """Get list of all prefixes"""
         return list(self._routes.keys())
@@ -334,6 +383,7 @@ class LocRIB:
     def clear(self) -> None:
         """Clear all routes"""
         self._routes.clear()
+        self.version += 1
 
 
 class AdjRIBOut:
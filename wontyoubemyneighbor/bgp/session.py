@@ -348,12 +348,14 @@ class BGPSession:
                 self.writer = None
                 self.reader = None
 
-    async def _send_message(self, message: BGPMessage) -> None:
+    async def _send_message(self, message: BGPMessage, data: Optional[bytes] = None) -> None:
         """
         Send BGP message over TCP
 
         Args:
             message: BGP message to send
+            data: message already encoded (e.g. one UPDATE shared by several
+                  peers); encoded here if None
         """
         msg_name = MESSAGE_TYPE_NAMES.get(message.msg_type, f"UNKNOWN({message.msg_type})")
 
@@ -368,7 +370,8 @@ class BGPSession:
                 return
 
             # Encode message
-            data = message.encode()
+            if data is None:
+                data = message.encode()
 
             # Enhanced debug logging
             self.logger.debug(f"Sending {msg_name} ({len(data)} bytes)")
@@ -24,7 +24,7 @@ Example usage:
 
 import asyncio
 import logging
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List, Sequence
 
 from .agent import BGPAgent
 from .session import BGPSessionConfig
@@ -153,6 +153,20 @@ class BGPSpeaker:
                         f"({'passive' if passive else 'active'}, "
                         f"{'iBGP' if peer_as == self.local_as else 'eBGP'})")
 
+    def add_peers(self, peers: Sequence[Dict[str, Any]]) -> None:
+        """
+        Add several BGP peers
+
+        Peers added before start() have their sessions started together,
+        in a single gather, when the speaker starts.
+
+        Args:
+            peers: Sequence of keyword-argument dicts, one per peer, as
+                accepted by add_peer()
+        """
+        for peer in peers:
+            self.add_peer(**peer)
+
     def remove_peer(self, peer_ip: str) -> None:
         """
         Remove BGP peer
@@ -184,9 +198,9 @@ class BGPSpeaker:
         # Start agent
         await self.agent.start()
 
-        # Start all peer sessions
-        for peer_ip in self.peer_configs.keys():
-            await self.agent.start_peer(peer_ip)
+        # Start all peer sessions concurrently
+        await asyncio.gather(*(self.agent.start_peer(peer_ip)
+                               for peer_ip in self.peer_configs))
 
         self.logger.info("BGP speaker started")
 
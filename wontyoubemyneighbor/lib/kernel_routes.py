@@ -6,9 +6,26 @@ routing table for actual packet forwarding.
 """
 
 import subprocess
+import functools
 import logging
 import asyncio
-from typing import Optional, List
+import re
+import threading
+from typing import Optional, List, Sequence, Tuple
+
+# "ip -batch" reports each failing input line as "Command failed -:<line>"
+_BATCH_FAILED_RE = re.compile(r"Command failed -:(\d+)")
+
+
+def _serialized(method):
+    """
+    Run a route-mutating method with the manager's route lock held
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._route_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class KernelRouteManager:
@@ -21,7 +38,16 @@ class KernelRouteManager:
         self.installed_routes = {}  # prefix -> next_hop
         self.forwarding_enabled = False
         self.last_forward_stats = {}  # Track forwarding counters
-
+        # Every route change (single, batched or removal, from the event loop
+        # or a worker thread) holds this lock, so installed_routes always
+        # matches the order commands reached the kernel. Re-entrant because
+        # install_route() and clear_all_routes() call remove_route().
+        self._route_lock = threading.RLock()
+        # Queues async batch callers (OSPF SPF, BGP decision process) in
+        # order without tying up a worker thread each
+        self._install_lock = asyncio.Lock()
+
+    @_serialized
     def install_route(self, prefix: str, next_hop: str, metric: int = 100,
                      protocol: str = "static") -> bool:
         """
@@ -86,6 +112,92 @@ class KernelRouteManager:
             self.logger.error(f"Error installing route {prefix}: {e}")
             return False
 
+    @_serialized
+    def install_routes(self, routes: Sequence[Tuple[str, str, int]],
+                       protocol: str = "static") -> int:
+        """
+        Install several routes with a single "ip -batch" invocation
+
+        Routes already installed with the same next-hop are skipped, so
+        re-installing an unchanged routing table runs no command at all.
+        Only new or changed prefixes are sent to the kernel.
+
+        Args:
+            routes: Sequence of (prefix, next_hop, metric)
+            protocol: Source protocol (ospf, bgp, static)
+
+        Returns:
+            Number of routes now installed (including unchanged ones)
+        """
+        installed = 0
+        commands = []
+        pending = []  # (batch line number, prefix, next_hop)
+
+        for prefix, next_hop, metric in routes:
+            # IPv4-mapped next hops (::ffff:a.b.c.d) are installed via the IPv4 address
+            if ':' in prefix and next_hop.startswith('::ffff:'):
+                next_hop = next_hop[7:]
+
+            current = self.installed_routes.get(prefix)
+            if current == next_hop:
+                installed += 1
+                continue
+            if current is not None:
+                # Next-hop changed, remove old route first
+                commands.append(f"route del {prefix}")
+            # "ip route" infers the address family from the prefix
+            commands.append(f"route replace {prefix} via {next_hop} metric {metric}")
+            pending.append((len(commands), prefix, next_hop))
+
+        if not commands:
+            return installed
+
+        try:
+            result = subprocess.run(["ip", "-force", "-batch", "-"],
+                                    input="\n".join(commands) + "\n",
+                                    capture_output=True, text=True, timeout=10)
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"Timeout installing {len(pending)} routes")
+            return installed
+        except Exception as e:
+            self.logger.error(f"Error installing {len(pending)} routes: {e}")
+            return installed
+
+        failed = set(int(line) for line in _BATCH_FAILED_RE.findall(result.stderr))
+        for line, prefix, next_hop in pending:
+            if line in failed:
+                self.installed_routes.pop(prefix, None)
+                self.logger.warning(f"Failed to install route {prefix} via {next_hop}")
+            else:
+                self.installed_routes[prefix] = next_hop
+                installed += 1
+                self.logger.info(f"✓ Installed kernel route: {prefix} via {next_hop} ({protocol})")
+
+        if failed:
+            self.logger.debug(f"ip -batch errors: {result.stderr.strip()}")
+        return installed
+
+    async def install_routes_async(self, routes: Sequence[Tuple[str, str, int]],
+                                   protocol: str = "static") -> int:
+        """
+        Install several routes without blocking the event loop
+
+        Runs install_routes() in a worker thread. Concurrent callers are
+        serialized, so each batch is diffed against the routes the previous
+        one actually installed; the route lock taken by install_routes()
+        also keeps install_route()/remove_route() from interleaving with it.
+
+        Args:
+            routes: Sequence of (prefix, next_hop, metric)
+            protocol: Source protocol (ospf, bgp, static)
+
+        Returns:
+            Number of routes now installed (including unchanged ones)
+        """
+        async with self._install_lock:
+            return await asyncio.to_thread(self.install_routes, list(routes), protocol)
+
+    @_serialized
     def remove_route(self, prefix: str) -> bool:
         """
         Remove route from kernel routing table
@@ -131,6 +243,7 @@ class KernelRouteManager:
         """Get list of prefixes installed in kernel"""
         return list(self.installed_routes.keys())
 
+    @_serialized
     def clear_all_routes(self):
         """Remove all routes managed by this instance"""
         prefixes = list(self.installed_routes.keys())
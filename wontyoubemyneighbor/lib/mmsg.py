@@ -0,0 +1,196 @@
+"""
+Batched datagram I/O - sendmmsg(2)/recvmmsg(2) bindings via ctypes
+
+Lets a raw socket push several datagrams (e.g. one LSU to every Full
+neighbor) or drain several received datagrams in a single system call.
+Callers must be prepared for SENDMMSG_AVAILABLE / RECVMMSG_AVAILABLE to
+be False on non-Linux platforms or old libcs.
+"""
+
+import ctypes
+import errno
+import os
+import socket
+import sys
+from typing import List, Sequence, Tuple
+
+SENDMMSG_AVAILABLE = False
+RECVMMSG_AVAILABLE = False
+
+MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0x40)
+MSG_TRUNC = getattr(socket, "MSG_TRUNC", 0x20)
+
+
+class _SockaddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_uint8 * 4),
+        ("sin_zero", ctypes.c_char * 8),
+    ]
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _sendmmsg = _libc.sendmmsg
+        _sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+        _sendmmsg.restype = ctypes.c_int
+        SENDMMSG_AVAILABLE = True
+    except (OSError, AttributeError):
+        pass
+
+    try:
+        _recvmmsg = _libc.recvmmsg
+        _recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+                              ctypes.c_int, ctypes.c_void_p]
+        _recvmmsg.restype = ctypes.c_int
+        RECVMMSG_AVAILABLE = True
+    except (NameError, AttributeError):
+        pass
+
+
+def sendmmsg(fd: int, messages: Sequence[Tuple[bytes, bytes]]) -> int:
+    """
+    Send several IPv4 datagrams with one sendmmsg() call
+
+    Identical payload objects share a single iovec, so flooding one LSU
+    to N neighbors references the packet buffer only once.
+
+    Args:
+        fd: Socket file descriptor
+        messages: Sequence of (payload, packed 4-byte destination address)
+
+    Returns:
+        Number of datagrams the kernel accepted (may be fewer than requested)
+
+    Raises:
+        OSError: If the system call fails
+    """
+    count = len(messages)
+    addrs = (_SockaddrIn * count)()
+    msgs = (_MMsgHdr * count)()
+    iovecs = {}
+    keepalive = []
+
+    for i, (payload, dest) in enumerate(messages):
+        iov = iovecs.get(id(payload))
+        if iov is None:
+            buf = ctypes.c_char_p(payload)
+            keepalive.append(buf)
+            iov = _IOVec(ctypes.cast(buf, ctypes.c_void_p), len(payload))
+            iovecs[id(payload)] = iov
+
+        addr = addrs[i]
+        addr.sin_family = socket.AF_INET
+        addr.sin_addr[:] = dest  # Byte-wise: a c_char array would stop at a zero octet
+
+        hdr = msgs[i].msg_hdr
+        hdr.msg_name = ctypes.addressof(addr)
+        hdr.msg_namelen = ctypes.sizeof(_SockaddrIn)
+        hdr.msg_iov = ctypes.pointer(iov)
+        hdr.msg_iovlen = 1
+
+    # Never block the event loop, even if the socket was left blocking
+    sent = _sendmmsg(fd, msgs, count, MSG_DONTWAIT)
+    if sent < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return sent
+
+
+class MMsgReceiver:
+    """
+    Ring of pre-allocated receive buffers drained with one recvmmsg() call
+
+    The message headers and iovecs are built once; each receive() only
+    resets the per-message lengths and flags before the system call.
+    """
+
+    def __init__(self, count: int = 32, size: int = 65535):
+        """
+        Initialize the receive ring
+
+        Args:
+            count: Maximum datagrams read per system call
+            size: Size of each buffer (a datagram larger than this is dropped)
+        """
+        self.count = count
+        self.size = size
+        # Datagrams dropped because they did not fit in a buffer
+        self.truncated = 0
+        self.buffers = [bytearray(size) for _ in range(count)]
+        self.views = [memoryview(buf) for buf in self.buffers]
+        self._iovecs = (_IOVec * count)()
+        self._msgs = (_MMsgHdr * count)()
+        self._c_buffers = []
+
+        for i, buf in enumerate(self.buffers):
+            c_buf = (ctypes.c_char * size).from_buffer(buf)
+            self._c_buffers.append(c_buf)
+            self._iovecs[i].iov_base = ctypes.addressof(c_buf)
+            self._iovecs[i].iov_len = size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def receive(self, fd: int) -> List[Tuple[memoryview, int]]:
+        """
+        Read every queued datagram (up to count) without blocking
+
+        Args:
+            fd: Socket file descriptor
+
+        Returns:
+            List of (buffer view, datagram length), empty if nothing is
+            queued. Views are only valid until the next receive().
+            Truncated datagrams are left out and counted in truncated.
+
+        Raises:
+            OSError: If the system call fails for a reason other than EAGAIN
+        """
+        msgs = self._msgs
+        for i in range(self.count):
+            msgs[i].msg_len = 0
+            msgs[i].msg_hdr.msg_flags = 0
+
+        received = _recvmmsg(fd, msgs, self.count, MSG_DONTWAIT, None)
+        if received < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        batch = []
+        for i in range(received):
+            if msgs[i].msg_hdr.msg_flags & MSG_TRUNC:
+                self.truncated += 1
+                continue
+            batch.append((self.views[i], msgs[i].msg_len))
+        return batch
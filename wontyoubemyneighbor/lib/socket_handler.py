@@ -3,14 +3,42 @@ OSPF Socket Handler - Raw socket management for OSPF protocol
 Handles multicast, send/receive of OSPF packets
 """
 
+import asyncio
+import ctypes
 import socket
 import struct
 import logging
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
+from lib.mmsg import SENDMMSG_AVAILABLE, RECVMMSG_AVAILABLE, MMsgReceiver, sendmmsg
 from ospf.constants import OSPF_PROTOCOL_NUMBER, ALLSPFROUTERS, OSPF_MULTICAST_TTL, OSPF_UNICAST_TTL
 
 logger = logging.getLogger(__name__)
 
+# Receive buffer size - large enough for any IP datagram
+RX_BUFFER_SIZE = 65535
+
+# recvmmsg() ring: datagrams per system call and per-buffer size. Slots
+# hold a maximum-size IP datagram so a large (fragmented) LS Update is
+# never truncated; the ring costs RX_BATCH_SIZE * 64 KiB per socket.
+RX_BATCH_SIZE = 64
+RX_BATCH_BUFFER_SIZE = RX_BUFFER_SIZE
+
+# Source address field of the IPv4 header (offset 12)
+_IP_SRC = struct.Struct("!I")
+
+# Default SO_SNDBUF/SO_RCVBUF request - absorbs LSU flooding bursts
+DEFAULT_SOCK_BUFSIZE = 8 * 1024 * 1024
+
+# Linux socket options not exported by every Python build
+IP_MULTICAST_ALL = getattr(socket, "IP_MULTICAST_ALL", 49)
+SO_ATTACH_FILTER = getattr(socket, "SO_ATTACH_FILTER", 26)
+SO_SNDBUFFORCE = getattr(socket, "SO_SNDBUFFORCE", 32)
+SO_RCVBUFFORCE = getattr(socket, "SO_RCVBUFFORCE", 33)
+
+# Classic BPF instruction (struct sock_filter) and program (struct sock_fprog)
+_BPF_INSN = struct.Struct("HBBI")
+_SOCK_FPROG = struct.Struct("HL")
+
 
 class OSPFSocket:
     """
@@ -18,18 +46,31 @@ class OSPFSocket:
     Uses IP protocol 89 (OSPF)
     """
 
-    def __init__(self, interface: str, source_ip: str):
+    def __init__(self, interface: str, source_ip: str, bufsize: int = DEFAULT_SOCK_BUFSIZE):
         """
         Initialize OSPF socket handler
 
         Args:
             interface: Network interface name (e.g., 'eth0')
             source_ip: Source IP address for this interface
+            bufsize: Requested send/receive buffer size in bytes
+                (0 keeps the kernel default)
         """
         self.interface = interface
         self.source_ip = source_ip
+        self.bufsize = bufsize
         self.sock: Optional[socket.socket] = None
         self.multicast_groups = []
+        # True once the kernel drops our own packets (see _attach_source_filter)
+        self.source_filtered = False
+        self._bpf_program = None
+        # Reusable receive buffer for the asyncio receive path
+        self._rx_buf = bytearray(RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
+        # recvmmsg() ring and readiness event for the async receive paths
+        self._rx_ring: Optional[MMsgReceiver] = None
+        self._readable: Optional[asyncio.Event] = None
+        self._reader_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def open(self) -> bool:
         """
@@ -79,6 +120,19 @@ class OSPFSocket:
             # Disable multicast loopback - don't receive our own packets
             self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
 
+            # Only deliver multicast for groups joined on this socket
+            try:
+                self.sock.setsockopt(socket.IPPROTO_IP, IP_MULTICAST_ALL, 0)
+            except OSError as e:
+                logger.debug(f"IP_MULTICAST_ALL not supported: {e}")
+
+            # Drop packets sourced from our own address in the kernel
+            self._attach_source_filter()
+
+            # Enlarge the socket buffers so flooding bursts don't hit ENOBUFS
+            if self.bufsize:
+                self._set_buffer_sizes(self.bufsize)
+
             # Set DSCP for OSPF traffic - RFC 4594 Network Control (CS6)
             # DSCP CS6 = 48, TOS byte = DSCP << 2 = 192 (0xC0)
             try:
@@ -88,6 +142,10 @@ class OSPFSocket:
             except Exception as tos_err:
                 logger.warning(f"[QoS] Could not set TOS on OSPF socket: {tos_err}")
 
+            # Non-blocking so the event loop can await readability instead of
+            # polling with a timeout (see _wait_readable)
+            self.sock.setblocking(False)
+
             logger.info(f"Opened OSPF socket on {self.interface} ({self.source_ip})")
             return True
 
@@ -98,6 +156,62 @@ class OSPFSocket:
             logger.error(f"Failed to open OSPF socket: {e}")
             return False
 
+    def _set_buffer_sizes(self, bufsize: int):
+        """
+        Set SO_SNDBUF and SO_RCVBUF on the socket
+
+        The *BUFFORCE variants bypass net.core.wmem_max/rmem_max and need
+        CAP_NET_ADMIN; without it the plain options are used and the
+        kernel silently caps the request.
+
+        Args:
+            bufsize: Requested buffer size in bytes
+        """
+        for force_opt, opt in ((SO_SNDBUFFORCE, socket.SO_SNDBUF),
+                               (SO_RCVBUFFORCE, socket.SO_RCVBUF)):
+            try:
+                self.sock.setsockopt(socket.SOL_SOCKET, force_opt, bufsize)
+            except OSError:
+                try:
+                    self.sock.setsockopt(socket.SOL_SOCKET, opt, bufsize)
+                except OSError as e:
+                    logger.warning("Could not set socket buffer size on %s: %s", self.interface, e)
+                    return
+
+        # Linux reports double the requested size (bookkeeping overhead)
+        logger.info("OSPF socket buffers on %s: sndbuf=%d rcvbuf=%d (requested %d)",
+                    self.interface,
+                    self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+                    self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+                    bufsize)
+
+    def _attach_source_filter(self):
+        """
+        Attach a classic BPF filter rejecting packets from our own IP
+
+        Raw sockets see the IP header, so the program loads the source
+        address at offset 12 and drops the packet if it equals source_ip.
+        Failure is not fatal - the agent still filters in user space while
+        source_filtered is False.
+        """
+        source_ip_i = _IP_SRC.unpack(socket.inet_aton(self.source_ip))[0]
+        insns = [
+            (0x20, 0, 0, 12),           # ld  [12]          (IP source)
+            (0x15, 0, 1, source_ip_i),  # jeq #source_ip, drop, accept
+            (0x06, 0, 0, 0),            # ret #0            (drop)
+            (0x06, 0, 0, 0xFFFFFFFF),   # ret #-1           (accept)
+        ]
+        program = ctypes.create_string_buffer(b"".join(_BPF_INSN.pack(*insn) for insn in insns))
+        fprog = _SOCK_FPROG.pack(len(insns), ctypes.addressof(program))
+
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+            self._bpf_program = program
+            self.source_filtered = True
+            logger.debug(f"Attached own-source BPF filter on {self.interface}")
+        except OSError as e:
+            logger.debug(f"Could not attach BPF filter on {self.interface}: {e}")
+
     def join_multicast(self, group: str = ALLSPFROUTERS) -> bool:
         """
         Join OSPF multicast group
@@ -166,13 +280,14 @@ class OSPFSocket:
             logger.error(f"Failed to leave multicast group {group}: {e}")
             return False
 
-    def send(self, packet: bytes, dest: str = ALLSPFROUTERS) -> bool:
+    def send(self, packet: bytes, dest: Union[str, Tuple[str, int]] = ALLSPFROUTERS) -> bool:
         """
         Send OSPF packet
 
         Args:
             packet: OSPF packet as bytes
-            dest: Destination IP (default: multicast AllSPFRouters)
+            dest: Destination IP (default: multicast AllSPFRouters), or a
+                  pre-built (ip, 0) sockaddr such as OSPFNeighbor.sockaddr
 
         Returns:
             True if successful
@@ -183,10 +298,11 @@ class OSPFSocket:
                 return False
 
             # Send packet
-            bytes_sent = self.sock.sendto(packet, (dest, 0))
+            sockaddr = dest if isinstance(dest, tuple) else (dest, 0)
+            bytes_sent = self.sock.sendto(packet, sockaddr)
 
             if bytes_sent == len(packet):
-                logger.debug(f"Sent {bytes_sent} bytes to {dest}")
+                logger.debug("Sent %d bytes to %s", bytes_sent, sockaddr[0])
                 return True
             else:
                 logger.warning(f"Partial send: {bytes_sent}/{len(packet)} bytes")
@@ -196,74 +312,157 @@ class OSPFSocket:
             logger.error(f"Failed to send packet to {dest}: {e}")
             return False
 
-    def receive(self, timeout: float = 1.0) -> Optional[Tuple[bytes, str]]:
+    def send_many(self, messages: Sequence[Tuple[bytes, Union[str, bytes]]]) -> int:
         """
-        Receive OSPF packet with timeout
+        Send several OSPF packets, batching them into one sendmmsg() call
+
+        Falls back to one sendto() per packet for whatever the kernel did
+        not accept, or when sendmmsg() is unavailable.
 
         Args:
-            timeout: Receive timeout in seconds
+            messages: Sequence of (packet_bytes, destination), where the
+                      destination is an IP string or a packed 4-byte address
+                      (e.g. OSPFNeighbor.ip_packed)
 
         Returns:
-            Tuple of (packet_bytes, source_ip) or None if timeout/error
+            Number of packets sent
         """
-        result = self.receive_with_dscp(timeout)
-        if result:
-            return (result[0], result[1])
-        return None
-
-    def receive_with_dscp(self, timeout: float = 1.0) -> Optional[Tuple[bytes, str, int]]:
+        if not self.sock:
+            logger.error("Socket not open")
+            return 0
+        if not messages:
+            return 0
+
+        sent = 0
+        if SENDMMSG_AVAILABLE and len(messages) > 1:
+            try:
+                batch = [
+                    (packet, dest if isinstance(dest, bytes) else socket.inet_aton(dest))
+                    for packet, dest in messages
+                ]
+                sent = sendmmsg(self.sock.fileno(), batch)
+                logger.debug("Sent %d/%d packets with sendmmsg", sent, len(messages))
+            except OSError as e:
+                logger.debug("sendmmsg failed (%s), falling back to sendto", e)
+                sent = 0
+
+        for packet, dest in messages[sent:]:
+            if isinstance(dest, bytes):
+                dest = socket.inet_ntoa(dest)
+            if self.send(packet, dest=dest):
+                sent += 1
+        return sent
+
+    async def receive_async(self) -> Optional[Tuple[memoryview, str, int, int]]:
         """
-        Receive OSPF packet with timeout and extract DSCP value from IP header.
+        Wait for the next OSPF packet without blocking the event loop.
 
-        Args:
-            timeout: Receive timeout in seconds
+        The datagram is read into a pre-allocated buffer and the OSPF payload
+        is returned as a memoryview into it, so no copy is made. The view is
+        only valid until the next receive on this socket.
 
         Returns:
-            Tuple of (packet_bytes, source_ip, dscp_value) or None if timeout/error
+            Tuple of (packet_view, source_ip, dscp_value, source_ip as int),
+            or None for a runt packet
         """
-        try:
-            if not self.sock:
-                logger.error("Socket not open")
-                return None
-
-            # Set timeout
-            self.sock.settimeout(timeout)
-
-            # Receive packet
-            data, addr = self.sock.recvfrom(65535)
-            source_ip = addr[0]
-
-            # Strip IP header (SOCK_RAW includes IP header in received data)
-            # IP header length is in first byte: IHL field (lower 4 bits) * 4 bytes
-            dscp_value = 0
-            if len(data) > 1:
-                ip_header_len = (data[0] & 0x0F) * 4
-                # Extract DSCP from TOS byte (byte 1 of IP header)
-                # TOS byte format: DSCP (6 bits) + ECN (2 bits)
-                # DSCP = TOS >> 2
-                tos_byte = data[1]
-                dscp_value = tos_byte >> 2
-                ospf_data = data[ip_header_len:]
-                logger.debug(f"Received {len(data)} bytes from {source_ip}, "
-                           f"TOS={tos_byte:#04x} DSCP={dscp_value}, "
-                           f"stripped {ip_header_len} byte IP header, "
-                           f"OSPF data: {len(ospf_data)} bytes")
-                return (ospf_data, source_ip, dscp_value)
-
-            return (data, source_ip, dscp_value)
-
-        except socket.timeout:
-            # Timeout is normal, not an error
-            return None
-        except Exception as e:
-            logger.error(f"Failed to receive packet: {e}")
+        if not self.sock:
+            raise OSPFSocketError("Socket not open")
+
+        while True:
+            try:
+                nbytes, addr = self.sock.recvfrom_into(self._rx_buf)
+                break
+            except (BlockingIOError, InterruptedError):
+                await self._wait_readable()
+
+        if nbytes < 20:
             return None
 
+        # Strip IP header (IHL * 4) and extract DSCP from the TOS byte
+        buf = self._rx_buf
+        ip_header_len = (buf[0] & 0x0F) * 4
+        dscp_value = buf[1] >> 2
+        source_ip_i = _IP_SRC.unpack_from(buf, 12)[0]
+        return (self._rx_view[ip_header_len:nbytes], addr[0], dscp_value, source_ip_i)
+
+    async def _wait_readable(self):
+        """
+        Wait until the socket has data queued
+
+        Readiness comes from a persistent add_reader() callback, which every
+        event loop implementation (including uvloop) supports.
+
+        Raises:
+            OSPFSocketError: If the socket is closed while waiting
+        """
+        if self._readable is None:
+            self._readable = asyncio.Event()
+            self._reader_loop = asyncio.get_running_loop()
+            self._reader_loop.add_reader(self.sock.fileno(), self._readable.set)
+
+        readable = self._readable
+        readable.clear()
+        await readable.wait()
+        if not self.sock:
+            raise OSPFSocketError("Socket closed")
+
+    async def receive_many_async(self) -> List[Tuple[memoryview, str, int, int]]:
+        """
+        Wait for OSPF packets and return every datagram already queued
+
+        With recvmmsg() available, up to RX_BATCH_SIZE datagrams are read
+        in one system call once the socket becomes readable; otherwise this
+        falls back to a single receive_async(). Views are only valid until
+        the next receive on this socket.
+
+        Returns:
+            List of (packet_view, source_ip, dscp_value, source_ip as int)
+        """
+        if not self.sock:
+            raise OSPFSocketError("Socket not open")
+
+        if not RECVMMSG_AVAILABLE:
+            result = await self.receive_async()
+            return [result] if result else []
+
+        if self._rx_ring is None:
+            self._rx_ring = MMsgReceiver(RX_BATCH_SIZE, RX_BATCH_BUFFER_SIZE)
+
+        ring = self._rx_ring
+        while True:
+            truncated = ring.truncated
+            batch = ring.receive(self.sock.fileno())
+            if ring.truncated != truncated:
+                logger.warning("Dropped %d truncated OSPF datagram(s) larger than %d bytes "
+                               "on %s (%d total)", ring.truncated - truncated, ring.size,
+                               self.interface, ring.truncated)
+            if batch:
+                break
+            await self._wait_readable()
+
+        packets = []
+        for view, nbytes in batch:
+            if nbytes < 20:
+                continue
+            # Strip IP header (IHL * 4) and extract DSCP from the TOS byte
+            ip_header_len = (view[0] & 0x0F) * 4
+            source_ip_i = _IP_SRC.unpack_from(view, 12)[0]
+            packets.append((view[ip_header_len:nbytes], socket.inet_ntoa(view[12:16]),
+                            view[1] >> 2, source_ip_i))
+        return packets
+
     def close(self):
         """
         Close socket and leave all multicast groups
         """
         try:
+            # Stop watching the socket before its descriptor goes away
+            if self._reader_loop is not None and self.sock:
+                self._reader_loop.remove_reader(self.sock.fileno())
+                self._reader_loop = None
+                self._readable.set()
+                self._readable = None
+
             # Leave all multicast groups
             for group in list(self.multicast_groups):
                 self.leave_multicast(group)
@@ -27,6 +27,7 @@ class StateMachine:
         self.transitions: Dict[Any, Dict[str, Any]] = {}
         self.on_enter_callbacks: Dict[Any, list] = {}
         self.on_exit_callbacks: Dict[Any, list] = {}
+        self.on_transition_callbacks: list = []
         self.state_names: Dict[Any, str] = {}
 
         logger.debug(f"{self.name}: Initial state = {initial_state}")
@@ -72,6 +73,15 @@ class StateMachine:
 
         self.on_exit_callbacks[state].append(callback)
 
+    def add_on_transition(self, callback: Callable):
+        """
+        Add callback to execute on every state change
+
+        Args:
+            callback: Callable taking (old_state, new_state, event)
+        """
+        self.on_transition_callbacks.append(callback)
+
     def set_state_name(self, state: Any, name: str):
         """
         Set human-readable name for state
@@ -135,6 +145,14 @@ class StateMachine:
         # Log transition
         logger.info(f"{self.name}: {self.get_state_name(old_state)} --[{event}]--> {self.get_state_name(new_state)}")
 
+        # Execute transition callbacks
+        if old_state != new_state:
+            for callback in self.on_transition_callbacks:
+                try:
+                    callback(old_state, new_state, event)
+                except Exception as e:
+                    logger.error(f"{self.name}: Transition callback error: {e}")
+
         # Execute enter callbacks
         if new_state in self.on_enter_callbacks:
             for callback in self.on_enter_callbacks[new_state]:
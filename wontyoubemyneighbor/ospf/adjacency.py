@@ -4,11 +4,12 @@ RFC 2328 Section 10.6 - Receiving Database Description Packets
 RFC 2328 Section 10.8 - Sending Database Description Packets
 """
 
+import struct
 import time
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from ospf.packets import (
-    OSPFHeader, OSPFDBDescription, LSAHeader, parse_ospf_packet
+    OSPFHeader, OSPFDBDescription, LSAHeader, parse_ospf_packet, ospf_checksum, ipv4_to_int
 )
 from ospf.neighbor import OSPFNeighbor
 from ospf.lsdb import LinkStateDatabase
@@ -19,6 +20,17 @@ from ospf.constants import (
 
 logger = logging.getLogger(__name__)
 
+# DBD layout: 24-byte OSPF header + 8-byte fixed body, then LSA headers
+_DBD_HEADERS_OFFSET = 32
+_DBD_FIXED_OFFSET = 24
+_DBD_FIXED = struct.Struct("!HBBI")  # Interface MTU, options, flags, DD sequence
+_LENGTH_OFFSET = 2
+_CHECKSUM_OFFSET = 12
+_U16 = struct.Struct("!H")
+
+# Largest OSPF packet we build (maximum IPv4 datagram payload)
+DBD_SCRATCH_SIZE = 65535
+
 
 class AdjacencyManager:
     """
@@ -34,9 +46,14 @@ class AdjacencyManager:
             lsdb: Link State Database
         """
         self.router_id = router_id
+        self._router_id_i = ipv4_to_int(router_id)  # For master/slave comparison
         self.lsdb = lsdb
         self.interface_mtu = 1500
         self._iface_mtu_cache: dict = {}
+        # Serialized OSPF header + empty DBD body, keyed by area ID
+        self._dbd_templates: Dict[str, bytes] = {}
+        # Reusable buffer DBDs are serialized into by _pack_dbd()
+        self._dbd_scratch = bytearray(DBD_SCRATCH_SIZE)
 
         logger.info(f"Initialized AdjacencyManager for {router_id}")
 
@@ -71,10 +88,6 @@ class AdjacencyManager:
         Returns:
             DBD packet as bytes
         """
-        import struct
-        import socket as sock
-        import time
-
         # In ExStart, ALWAYS claim to be master with our own sequence number
         # The actual master/slave determination happens in process_dbd when we
         # compare router IDs and one side backs down
@@ -83,28 +96,13 @@ class AdjacencyManager:
 
         dd_sequence = neighbor.dd_sequence_number
 
-        # Build DBD packet - in ExStart, ALWAYS use I=1, M=1, MS=1
-        header = OSPFHeader(
-            version=2,
-            type=DATABASE_DESCRIPTION,
-            router_id=self.router_id,
-            area_id=area_id,
-            auth_type=0
-        )
-
-        dbd = OSPFDBDescription(
-            interface_mtu=self.get_interface_mtu(iface_name),
-            options=0x02,  # E-bit
-            flags=0x07,    # I=1, M=1, MS=1 - claim master in ExStart
-            dd_sequence=dd_sequence
-        )
-
-        packet = header / dbd
+        # In ExStart, ALWAYS use I=1, M=1, MS=1 - claim master
+        packet = self._pack_dbd(area_id, self.get_interface_mtu(iface_name), 0x07, dd_sequence)
 
-        logger.debug(f"Built initial DBD for {neighbor.router_id}, "
-                    f"flags=0x07 (I=1,M=1,MS=1), seq={dd_sequence}")
+        logger.debug("Built initial DBD for %s, flags=0x07 (I=1,M=1,MS=1), seq=%s",
+                     neighbor.router_id, dd_sequence)
 
-        return bytes(packet)
+        return packet
 
     def build_slave_ack_dbd_packet(self, neighbor: OSPFNeighbor, area_id: str, iface_name: str = None) -> bytes:
         """
@@ -121,31 +119,17 @@ class AdjacencyManager:
         Returns:
             DBD packet as bytes
         """
-        header = OSPFHeader(
-            version=2,
-            type=DATABASE_DESCRIPTION,
-            router_id=self.router_id,
-            area_id=area_id,
-            auth_type=0
-        )
+        # Slave ack: I=0, M=1 (we have more), MS=0 (slave) = 0x02
+        packet = self._pack_dbd(area_id, self.get_interface_mtu(iface_name), 0x02,
+                                neighbor.dd_sequence_number)
 
-        # Slave ack: I=0, M=1, MS=0 = 0x02
-        dbd = OSPFDBDescription(
-            interface_mtu=self.get_interface_mtu(iface_name),
-            options=0x02,  # E-bit
-            flags=0x02,    # I=0, M=1 (we have more), MS=0 (slave)
-            dd_sequence=neighbor.dd_sequence_number
-        )
-
-        packet = header / dbd
-
-        logger.info(f"Built slave ack DBD for {neighbor.router_id}, "
-                   f"flags=0x02 (I=0,M=1,MS=0), seq={neighbor.dd_sequence_number}")
+        logger.info("Built slave ack DBD for %s, flags=0x02 (I=0,M=1,MS=0), seq=%s",
+                    neighbor.router_id, neighbor.dd_sequence_number)
 
-        return bytes(packet)
+        return packet
 
     def build_dbd_packet(self, neighbor: OSPFNeighbor, area_id: str,
-                        lsa_headers: Optional[List[LSAHeader]] = None,
+                        lsa_headers: Optional[Sequence[Union[bytes, LSAHeader]]] = None,
                         is_more: bool = False, iface_name: str = None) -> bytes:
         """
         Build Database Description packet (Exchange state)
@@ -153,7 +137,7 @@ class AdjacencyManager:
         Args:
             neighbor: Target neighbor
             area_id: OSPF area ID
-            lsa_headers: List of LSA headers to include
+            lsa_headers: LSA headers to include (serialized or Scapy)
             is_more: True if more DBD packets follow
 
         Returns:
@@ -172,7 +156,67 @@ class AdjacencyManager:
         if is_master:
             flags |= 0x01  # MS-bit (Master)
 
-        # Build packet
+        logger.info("Building DBD with neighbor.dd_sequence_number = %s", neighbor.dd_sequence_number)
+
+        packet = self._pack_dbd(area_id, self.get_interface_mtu(iface_name), flags,
+                                neighbor.dd_sequence_number, lsa_headers)
+
+        logger.debug("Built DBD for %s, seq=%s, more=%s, lsa_count=%d, lsa_payload_size=%d",
+                     neighbor.router_id, neighbor.dd_sequence_number, is_more,
+                     len(lsa_headers), len(packet) - _DBD_HEADERS_OFFSET)
+
+        return packet
+
+    def _pack_dbd(self, area_id: str, mtu: int, flags: int, dd_sequence: int,
+                  lsa_headers: Sequence[Union[bytes, LSAHeader]] = ()) -> bytes:
+        """
+        Serialize a DBD packet from the cached per-area template
+
+        Copies the cached header + DBD body into the scratch buffer, appends
+        the LSA headers, then patches MTU, flags, sequence, length and
+        checksum (computed with the field zeroed).
+
+        Args:
+            area_id: OSPF area ID
+            mtu: Interface MTU
+            flags: I/M/MS flag bits
+            dd_sequence: DD sequence number
+            lsa_headers: LSA headers to describe, as 20-byte strings
+                (Scapy headers are serialized first)
+
+        Returns:
+            DBD packet as bytes
+        """
+        template = self._dbd_templates.get(area_id)
+        if template is None:
+            template = self._build_dbd_template(area_id)
+
+        scratch = self._dbd_scratch
+        scratch[:_DBD_HEADERS_OFFSET] = template
+        headers = b"".join(header if isinstance(header, bytes) else bytes(header)
+                           for header in lsa_headers)
+        end = _DBD_HEADERS_OFFSET + len(headers)
+        scratch[_DBD_HEADERS_OFFSET:end] = headers
+
+        _DBD_FIXED.pack_into(scratch, _DBD_FIXED_OFFSET, mtu, 0x02, flags, dd_sequence)
+        _U16.pack_into(scratch, _LENGTH_OFFSET, end)
+        _U16.pack_into(scratch, _CHECKSUM_OFFSET, 0)
+        _U16.pack_into(scratch, _CHECKSUM_OFFSET, ospf_checksum(memoryview(scratch)[:end]))
+
+        # DBDs wait in the TX queue, so hand out an immutable copy rather
+        # than a view of the scratch buffer
+        return bytes(scratch[:end])
+
+    def _build_dbd_template(self, area_id: str) -> bytes:
+        """
+        Serialize our OSPF header and an empty DBD body for an area
+
+        Args:
+            area_id: OSPF area ID
+
+        Returns:
+            First 32 bytes of a DBD packet
+        """
         header = OSPFHeader(
             version=2,
             type=DATABASE_DESCRIPTION,
@@ -180,34 +224,9 @@ class AdjacencyManager:
             area_id=area_id,
             auth_type=0
         )
-
-        logger.info(f"Building DBD with neighbor.dd_sequence_number = {neighbor.dd_sequence_number}")
-
-        dbd = OSPFDBDescription(
-            interface_mtu=self.get_interface_mtu(iface_name),
-            options=0x02,
-            flags=flags,
-            dd_sequence=neighbor.dd_sequence_number
-        )
-
-        # Build LSA headers payload (20 bytes each)
-        lsa_payload = b''
-        for lsa_header in lsa_headers:
-            # Serialize LSA header (20 bytes)
-            lsa_payload += bytes(lsa_header)
-
-        # Combine header, DBD, and LSA headers
-        packet = header / dbd
-        if lsa_payload:
-            packet = packet / lsa_payload
-
-        logger.debug(f"Built DBD for {neighbor.router_id}, "
-                    f"seq={neighbor.dd_sequence_number}, "
-                    f"more={is_more}, "
-                    f"lsa_count={len(lsa_headers)}, "
-                    f"lsa_payload_size={len(lsa_payload)}")
-
-        return bytes(packet)
+        template = bytes(header / OSPFDBDescription(options=0x02))[:_DBD_HEADERS_OFFSET]
+        self._dbd_templates[area_id] = template
+        return template
 
     def process_dbd(self, packet_data: bytes, neighbor: OSPFNeighbor) -> Tuple[bool, List, bool]:
         """
@@ -231,10 +250,10 @@ class AdjacencyManager:
             dbd = packet[OSPFDBDescription]
             current_state = neighbor.get_state()
 
-            logger.debug(f"Processing DBD from {neighbor.router_id}, "
-                        f"state={neighbor.get_state_name()}, "
-                        f"seq={dbd.dd_sequence}, "
-                        f"flags={dbd.flags:#04x}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing DBD from %s, state=%s, seq=%s, flags=%#04x",
+                             neighbor.router_id, neighbor.get_state_name(),
+                             dbd.dd_sequence, dbd.flags)
 
             # Handle ExStart state
             if current_state == STATE_EXSTART:
@@ -254,11 +273,14 @@ class AdjacencyManager:
                                f"responding to retransmission")
                     return (True, [], False)  # Signal to send response
                 else:
-                    logger.debug(f"Ignoring DBD from {neighbor.router_id} in {neighbor.get_state_name()}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Ignoring DBD from %s in %s",
+                                     neighbor.router_id, neighbor.get_state_name())
                     return (False, [], False)
 
             else:
-                logger.debug(f"Received DBD in unexpected state: {neighbor.get_state_name()}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received DBD in unexpected state: %s", neighbor.get_state_name())
                 return (False, [], False)
 
         except Exception as e:
@@ -283,10 +305,8 @@ class AdjacencyManager:
         is_master_bit = bool(dbd.flags & 0x01)
 
         # Determine master/slave based on router IDs (numerical comparison)
-        import struct
-        import socket as sock
-        our_id_int = struct.unpack("!I", sock.inet_aton(self.router_id))[0]
-        neighbor_id_int = struct.unpack("!I", sock.inet_aton(neighbor.router_id))[0]
+        our_id_int = self._router_id_i
+        neighbor_id_int = ipv4_to_int(neighbor.router_id)
 
         # RFC 2328: In ExStart, if slave receives DBD from master, it responds with I=0, MS=0
         # So we need to accept DBDs without I-bit if we're master and they're acknowledging as slave
@@ -309,7 +329,7 @@ class AdjacencyManager:
                 # Other cases
                 logger.info(f"We are MASTER, {neighbor.router_id} is SLAVE (I={is_init}, MS={is_master_bit})")
 
-            logger.debug(f"Our sequence number: {neighbor.dd_sequence_number}")
+            logger.debug("Our sequence number: %s", neighbor.dd_sequence_number)
         else:
             # We are slave (neighbor has higher Router ID)
             neighbor.is_master = False
@@ -361,16 +381,15 @@ class AdjacencyManager:
         # Extract LSA headers from DBD packet payload
         lsa_headers = self._extract_lsa_headers_from_dbd(packet_data)
 
-        logger.debug(f"Received {len(lsa_headers)} LSA headers from {neighbor.router_id}")
+        logger.debug("Received %d LSA headers from %s", len(lsa_headers), neighbor.router_id)
 
         # Compare with our LSDB and determine which LSAs we need
         lsa_headers_needed = []
         for lsa_header in lsa_headers:
             if self._need_lsa(lsa_header):
                 lsa_headers_needed.append(lsa_header)
-                logger.debug(f"Need LSA: Type {lsa_header.ls_type}, "
-                           f"ID {lsa_header.link_state_id}, "
-                           f"AdvRouter {lsa_header.advertising_router}")
+                logger.debug("Need LSA: Type %s, ID %s, AdvRouter %s", lsa_header.ls_type,
+                             lsa_header.link_state_id, lsa_header.advertising_router)
 
         # Check if exchange is complete
         exchange_complete = not is_more
@@ -403,7 +422,7 @@ class AdjacencyManager:
             logger.info(f"Starting adjacency with {neighbor.router_id} (we are SLAVE)")
 
     def get_lsa_headers_to_send(self, neighbor: OSPFNeighbor,
-                               max_count: int = 10) -> Tuple[List[LSAHeader], bool]:
+                               max_count: int = 10) -> Tuple[List[bytes], bool]:
         """
         Get LSA headers to send in DBD packet
 
@@ -412,15 +431,12 @@ class AdjacencyManager:
             max_count: Maximum number of headers to return
 
         Returns:
-            Tuple of (list of LSA headers, has_more)
+            Tuple of (list of serialized 20-byte LSA headers, has_more)
         """
-        # Get all LSA headers from LSDB
-        all_headers = self.lsdb.get_lsa_headers()
-
         # Check if neighbor already has db_summary_list
         if not hasattr(neighbor, 'db_summary_list') or not neighbor.db_summary_list:
-            # Initialize with all our LSA headers
-            neighbor.db_summary_list = all_headers.copy()
+            # Initialize with all our LSA headers, already serialized
+            neighbor.db_summary_list = self.lsdb.get_lsa_header_bytes()
 
         # Get next batch
         headers_to_send = neighbor.db_summary_list[:max_count]
@@ -428,8 +444,8 @@ class AdjacencyManager:
 
         has_more = len(neighbor.db_summary_list) > 0
 
-        logger.debug(f"Sending {len(headers_to_send)} LSA headers to {neighbor.router_id}, "
-                    f"remaining: {len(neighbor.db_summary_list)}")
+        logger.debug("Sending %d LSA headers to %s, remaining: %d",
+                     len(headers_to_send), neighbor.router_id, len(neighbor.db_summary_list))
 
         return (headers_to_send, has_more)
 
@@ -497,8 +513,8 @@ class AdjacencyManager:
 
         if our_lsa is None:
             # We don't have this LSA
-            logger.debug(f"Need LSA (not in LSDB): type={lsa_header.ls_type}, "
-                        f"id={lsa_header.link_state_id}, adv={lsa_header.advertising_router}")
+            logger.debug("Need LSA (not in LSDB): type=%s, id=%s, adv=%s", lsa_header.ls_type,
+                         lsa_header.link_state_id, lsa_header.advertising_router)
             return True
 
         # Compare sequence numbers (RFC 2328 Section 13.1)
@@ -515,15 +531,15 @@ class AdjacencyManager:
 
         # Higher sequence number = newer (accounting for wraparound)
         if neighbor_seq > our_seq:
-            logger.debug(f"Need LSA (newer seq): type={lsa_header.ls_type}, "
-                        f"neighbor_seq={hex(neighbor_seq)}, our_seq={hex(our_seq)}")
+            logger.debug("Need LSA (newer seq): type=%s, neighbor_seq=%#x, our_seq=%#x",
+                         lsa_header.ls_type, neighbor_seq, our_seq)
             return True
         elif neighbor_seq == our_seq:
             # Same sequence, compare checksum
             neighbor_cksum = lsa_header.ls_checksum or 0
             our_cksum = our_lsa.header.ls_checksum or 0
             if neighbor_cksum > our_cksum:
-                logger.debug(f"Need LSA (higher checksum): type={lsa_header.ls_type}")
+                logger.debug("Need LSA (higher checksum): type=%s", lsa_header.ls_type)
                 return True
 
         return False
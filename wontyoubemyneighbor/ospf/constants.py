@@ -122,6 +122,11 @@ INF_TRANS_DELAY = 1              # Estimated seconds to transmit LSA
 LS_REFRESH_TIME = 1800           # 30 minutes - refresh LSAs
 MAX_AGE = 3600                   # 1 hour - maximum LSA age
 MAX_AGE_DIFF = 900               # 15 minutes - MaxAgeDiff
+SPF_DELAY = 0.2                  # Debounce between an LSDB change and SPF
+SPF_HOLD = 1.0                   # Minimum gap between consecutive SPF runs
+FLOOD_DELAY = 0.1                # Debounce between a Full transition and flooding our LSAs
+TX_BATCH_MAX = 64                # Most queued unicast packets sent per sendmmsg() batch
+TX_QUEUE_MAX = 4096              # Queued unicast packets before new ones are dropped
 
 # LSA Sequence Numbers (RFC 2328 Section 12.1.6)
 INITIAL_SEQUENCE_NUMBER = 0x80000001
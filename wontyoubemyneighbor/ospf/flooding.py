@@ -4,26 +4,38 @@ RFC 2328 Section 13 - The Flooding Procedure
 RFC 2328 Section 13.3 - Next step in the flooding procedure
 """
 
+import heapq
+import struct
 import time
 import logging
 from typing import List, Dict, Optional, Tuple
 from scapy.packet import Raw
 from ospf.packets import (
-    OSPFHeader, OSPFLSUpdate, OSPFLSAck, OSPFLSRequest, LSRequest,
+    OSPFHeader, OSPFLSUpdate, OSPFLSAck, OSPFLSRequest,
     LSAHeader, RouterLSA, NetworkLSA, ASExternalLSA, NSSAExternalLSA,
-    SummaryLSA, parse_ospf_packet
+    SummaryLSA, parse_ospf_packet, ospf_checksum, ipv4_to_int, OSPF_HEADER_STRUCT
 )
 from ospf.neighbor import OSPFNeighbor
 from ospf.lsdb import LinkStateDatabase, LSA
 from ospf.constants import (
     LINK_STATE_REQUEST, LINK_STATE_UPDATE, LINK_STATE_ACK,
-    STATE_FULL, STATE_LOADING, EVENT_LOADING_DONE,
+    STATE_EXCHANGE, STATE_FULL, STATE_LOADING, EVENT_LOADING_DONE,
     ROUTER_LSA, NETWORK_LSA, AS_EXTERNAL_LSA, NSSA_EXTERNAL_LSA,
     SUMMARY_LSA_NETWORK, SUMMARY_LSA_ASBR
 )
 
 logger = logging.getLogger(__name__)
 
+# Largest OSPF packet we build (maximum IPv4 datagram payload)
+LSU_SCRATCH_SIZE = 65535
+
+# Most LSAs requested per Link State Request packet
+LSR_MAX_ENTRIES = 10
+
+_U16 = struct.Struct("!H")
+_U32 = struct.Struct("!I")
+_LSR_ENTRY = struct.Struct("!III")  # LS type, Link State ID, Advertising Router
+
 
 class LSAFloodingManager:
     """
@@ -39,6 +51,7 @@ class LSAFloodingManager:
             lsdb: Link State Database
         """
         self.router_id = router_id
+        self._router_id_i = ipv4_to_int(router_id)  # Packed into every LSR/LSU header
         self.lsdb = lsdb
 
         # Track pending LSA requests
@@ -50,6 +63,16 @@ class LSAFloodingManager:
         # Retransmission interval (RFC 2328: RxmtInterval)
         self.retransmit_interval = 5  # seconds
 
+        # Retransmission deadlines: heap of (due_time, neighbor_id, lsa_key).
+        # Entries are invalidated lazily - an entry whose LSA was acked or
+        # re-sent since it was pushed is simply discarded when popped.
+        self._rxmt_heap: List[Tuple[float, str, Tuple]] = []
+        self._rxmt_neighbors: Dict[str, OSPFNeighbor] = {}
+
+        # Reusable buffer LSUs and LSRs are serialized into by
+        # build_ls_update() and build_ls_request()
+        self._lsu_scratch = bytearray(LSU_SCRATCH_SIZE)
+
         logger.info(f"Initialized LSAFloodingManager for {router_id}")
 
     def build_ls_request(self, neighbor: OSPFNeighbor, area_id: str) -> Optional[bytes]:
@@ -64,34 +87,30 @@ class LSAFloodingManager:
             LSR packet as bytes, or None if no requests needed
         """
         if not neighbor.ls_request_list:
-            logger.debug(f"No LSA requests needed for {neighbor.router_id}")
+            logger.debug("No LSA requests needed for %s", neighbor.router_id)
             return None
 
-        # Build LSR packet
-        header = OSPFHeader(
-            version=2,
-            type=LINK_STATE_REQUEST,
-            router_id=self.router_id,
-            area_id=area_id,
-            auth_type=0
+        # Request entries (12 bytes each) after the 24-byte OSPF header
+        requests = neighbor.ls_request_list[:LSR_MAX_ENTRIES]
+        length = 24 + _LSR_ENTRY.size * len(requests)
+        packet = self._lsu_scratch
+        offset = 24
+        for lsa_header in requests:
+            _LSR_ENTRY.pack_into(packet, offset, lsa_header.ls_type,
+                                 ipv4_to_int(lsa_header.link_state_id),
+                                 ipv4_to_int(lsa_header.advertising_router))
+            offset += _LSR_ENTRY.size
+
+        # OSPF header with zero checksum, then patch in the checksum
+        OSPF_HEADER_STRUCT.pack_into(
+            packet, 0, 2, LINK_STATE_REQUEST, length,
+            self._router_id_i, ipv4_to_int(area_id), 0, 0, 0
         )
+        _U16.pack_into(packet, 12, ospf_checksum(memoryview(packet)[:length]))
 
-        # Build request entries
-        requests = []
-        for lsa_header in neighbor.ls_request_list[:10]:  # Limit to 10 per packet
-            request = LSRequest(
-                ls_type=lsa_header.ls_type,
-                link_state_id=lsa_header.link_state_id,
-                advertising_router=lsa_header.advertising_router
-            )
-            requests.append(request)
-
-        lsr = OSPFLSRequest(requests=requests)
-        packet = header / lsr
+        logger.info("Built LSR for %s with %d requests", neighbor.router_id, len(requests))
 
-        logger.info(f"Built LSR for {neighbor.router_id} with {len(requests)} requests")
-
-        return bytes(packet)
+        return bytes(packet[:length])
 
     def process_ls_request(self, packet_data: bytes, neighbor: OSPFNeighbor,
                           area_id: str) -> Optional[bytes]:
@@ -126,7 +145,7 @@ class LSAFloodingManager:
 
                 if lsa:
                     lsas_to_send.append(lsa)
-                    logger.debug(f"Found requested LSA: {lsa}")
+                    logger.debug("Found requested LSA: %s", lsa)
                 else:
                     logger.warning(f"Requested LSA not found: type={request.ls_type}, "
                                  f"id={request.link_state_id}, adv={request.advertising_router}")
@@ -185,8 +204,8 @@ class LSAFloodingManager:
                     if is_newer:
                         # Install in LSDB (header and body)
                         self.lsdb.add_lsa(lsa.header, lsa_body=lsa.body)
-                        logger.debug(f"Installed LSA: Type {lsa.header.ls_type}, "
-                                   f"ID {lsa.header.link_state_id}")
+                        logger.debug("Installed LSA: Type %s, ID %s",
+                                     lsa.header.ls_type, lsa.header.link_state_id)
                         updated_lsas.append(lsa)
 
                     # Add to acknowledgment list
@@ -258,7 +277,7 @@ class LSAFloodingManager:
             # 2. Remove from neighbor's ls_retransmission_list
             # 3. Update retransmission timers
 
-            logger.debug(f"Processed LSAck from {neighbor.router_id}")
+            logger.debug("Processed LSAck from %s", neighbor.router_id)
 
             return True
 
@@ -277,80 +296,48 @@ class LSAFloodingManager:
         Returns:
             LSU packet as bytes
         """
-        header = OSPFHeader(
-            version=2,
-            type=LINK_STATE_UPDATE,
-            router_id=self.router_id,
-            area_id=area_id,
-            auth_type=0
-        )
+        scratch = self._lsu_scratch
 
-        lsu = OSPFLSUpdate(
-            num_lsas=len(lsas)
-        )
-
-        # Attach each LSA (header + body) as raw payload
-        lsa_bytes = b''
+        # LSU body: number of LSAs, then each LSA (header + body) serialized
+        # straight into the scratch buffer after the 24-byte OSPF header
+        _U32.pack_into(scratch, 24, len(lsas))
+        offset = 28
         for lsa in lsas:
             # Build complete LSA packet (header / body) so Scapy can auto-calculate length/checksum
             if lsa.body:
                 # Force recalculation of length and checksum
                 lsa.header.length = None
                 lsa.header.ls_checksum = None
-                # Build complete packet
-                complete_lsa_packet = lsa.header / lsa.body
-                # Serialize the complete packet (Scapy will auto-calculate length/checksum in post_build)
-                complete_lsa_bytes = bytes(complete_lsa_packet)
+                complete_lsa_bytes = bytes(lsa.header / lsa.body)
             else:
                 # Just header, no body
                 lsa.header.length = 20
                 lsa.header.ls_checksum = None
                 complete_lsa_bytes = bytes(lsa.header)
 
-            # Add to LSU payload
-            lsa_bytes += complete_lsa_bytes
-
-        # Build packet: OSPF header / LSU header / LSA payload
-        # CRITICAL: Build in correct order so OSPF header checksum includes everything
-        header.len = None  # Will be auto-calculated
-        header.chksum = None  # Will be auto-calculated
-
-        if lsa_bytes:
-            # Build with LSAs attached
-            packet = header / lsu / Raw(load=lsa_bytes)
-        else:
-            # Just header + LSU
-            packet = header / lsu
-
-        # Debug: Show OSPF packet header details
-        final_packet_bytes = bytes(packet)
-        logger.debug(f"Built LSU with {len(lsas)} LSAs, total {len(lsa_bytes)} bytes of LSA data")
-        logger.debug(f"Final LSU packet length: {len(final_packet_bytes)} bytes")
-        logger.debug(f"OSPF header (24 bytes): {final_packet_bytes[:24].hex()}")
-        logger.debug(f"LSU header: {final_packet_bytes[24:28].hex() if len(final_packet_bytes) > 28 else 'N/A'}")
-
-        # Debug: Show details of each LSA being sent
-        offset = 0
-        for i, lsa in enumerate(lsas):
-            # Calculate the size of this LSA in the payload
-            if lsa.body:
-                lsa_size = 20 + len(bytes(lsa.body))
-            else:
-                lsa_size = 20
+            end = offset + len(complete_lsa_bytes)
+            scratch[offset:end] = complete_lsa_bytes
+            offset = end
 
-            logger.debug(f"  LSA {i}: type={lsa.header.ls_type}, "
-                       f"adv={lsa.header.advertising_router}, "
-                       f"size={lsa_size} bytes, "
-                       f"has_body={lsa.body is not None}")
-            if lsa.body and hasattr(lsa.body, 'links'):
-                logger.debug(f"    Body has {len(lsa.body.links)} links")
+        # OSPF header with zero checksum, then patch in the checksum over
+        # the finished packet
+        OSPF_HEADER_STRUCT.pack_into(
+            scratch, 0, 2, LINK_STATE_UPDATE, offset,
+            self._router_id_i, ipv4_to_int(area_id), 0, 0, 0
+        )
+        _U16.pack_into(scratch, 12, ospf_checksum(scratch[:offset]))
 
-            # Show hex of this LSA
-            lsa_hex = lsa_bytes[offset:offset+min(lsa_size, 48)].hex()
-            logger.debug(f"    Hex (first 48 bytes): {lsa_hex}")
-            offset += lsa_size
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Built LSU with %d LSAs, total %d bytes of LSA data",
+                         len(lsas), offset - 28)
+            logger.debug("OSPF header (24 bytes): %s", scratch[:24].hex())
+            for i, lsa in enumerate(lsas):
+                logger.debug("  LSA %d: type=%s, adv=%s, has_body=%s", i, lsa.header.ls_type,
+                             lsa.header.advertising_router, lsa.body is not None)
 
-        return bytes(packet)
+        # LSUs are cached and shared between sends, so hand out an
+        # immutable copy rather than a view of the scratch buffer
+        return bytes(scratch[:offset])
 
     def build_ls_ack(self, lsa_headers: List[LSAHeader], area_id: str) -> bytes:
         """
@@ -395,7 +382,7 @@ class LSAFloodingManager:
         else:
             packet = header / ack
 
-        logger.debug(f"Built LSAck with {len(lsa_headers)} headers, {len(lsa_headers) * 20} bytes")
+        logger.debug("Built LSAck with %d headers, %d bytes", len(lsa_headers), len(lsa_headers) * 20)
 
         return bytes(packet)
 
@@ -493,9 +480,11 @@ class LSAFloodingManager:
                 self.retransmit_timestamps[neighbor.router_id] = {}
 
             lsa_key = lsa.get_key()
-            self.retransmit_timestamps[neighbor.router_id][lsa_key] = time.time()
+            now = time.time()
+            self.retransmit_timestamps[neighbor.router_id][lsa_key] = now
+            self.schedule_retransmit(neighbor, lsa, now + self.retransmit_interval)
 
-            logger.debug(f"Added LSA to retransmission list for {neighbor.router_id}: {lsa}")
+            logger.debug("Added LSA to retransmission list for %s: %s", neighbor.router_id, lsa)
 
     def remove_from_retransmission_list(self, lsa_header: LSAHeader, neighbor: OSPFNeighbor):
         """
@@ -519,7 +508,7 @@ class LSAFloodingManager:
             if lsa_key in self.retransmit_timestamps[neighbor.router_id]:
                 del self.retransmit_timestamps[neighbor.router_id][lsa_key]
 
-        logger.debug(f"Removed LSA from retransmission list for {neighbor.router_id}")
+        logger.debug("Removed LSA from retransmission list for %s", neighbor.router_id)
 
     def _extract_lsas_from_lsu(self, packet_data: bytes) -> List[LSA]:
         """
@@ -545,6 +534,7 @@ class LSAFloodingManager:
             # Note: In production, would properly parse each LSA type
             # For now, we extract LSA headers and create basic LSA objects
             payload = bytes(lsu.payload) if lsu.payload else b''
+            debug = logger.isEnabledFor(logging.DEBUG)
 
             offset = 0
             while offset + 20 <= len(payload):  # At least LSA header (20 bytes)
@@ -566,39 +556,44 @@ class LSAFloodingManager:
 
                         try:
                             if lsa_header.ls_type == ROUTER_LSA:
-                                logger.debug(f"Parsing Router LSA: lsa_length={lsa_length}, "
-                                           f"body_bytes length={len(body_bytes)}, "
-                                           f"body_hex={body_bytes[:32].hex() if len(body_bytes) <= 32 else body_bytes[:32].hex() + '...'}")
+                                if debug:
+                                    logger.debug("Parsing Router LSA: lsa_length=%d, body_bytes length=%d, body_hex=%s%s",
+                                                 lsa_length, len(body_bytes), body_bytes[:32].hex(),
+                                                 '' if len(body_bytes) <= 32 else '...')
 
                                 # Manual parsing due to Scapy bug with RouterLSA links
                                 body = self._parse_router_lsa_body(body_bytes)
 
-                                num_links = body.num_links if hasattr(body, 'num_links') else 0
-                                actual_links = len(body.links) if hasattr(body, 'links') else 0
-                                logger.debug(f"Parsed Router LSA from {lsa_header.advertising_router}, "
-                                           f"num_links field={num_links}, actual links parsed={actual_links}")
-                                if num_links != actual_links:
-                                    logger.debug(f"Link count mismatch: header says {num_links}, parsed {actual_links}")
-                                if actual_links > 0:
-                                    for i, link in enumerate(body.links):
-                                        logger.debug(f"  Link {i}: type={link.link_type}, id={link.link_id}, "
-                                                   f"data={link.link_data}, metric={link.metric}")
+                                if debug:
+                                    num_links = body.num_links if hasattr(body, 'num_links') else 0
+                                    actual_links = len(body.links) if hasattr(body, 'links') else 0
+                                    logger.debug("Parsed Router LSA from %s, num_links field=%s, actual links parsed=%d",
+                                                 lsa_header.advertising_router, num_links, actual_links)
+                                    if num_links != actual_links:
+                                        logger.debug("Link count mismatch: header says %s, parsed %d",
+                                                     num_links, actual_links)
+                                    for i, link in enumerate(body.links if actual_links else ()):
+                                        logger.debug("  Link %d: type=%s, id=%s, data=%s, metric=%s",
+                                                     i, link.link_type, link.link_id, link.link_data, link.metric)
                             elif lsa_header.ls_type == NETWORK_LSA:
                                 body = NetworkLSA(body_bytes)
-                                logger.debug(f"Parsed Network LSA from {lsa_header.advertising_router}")
+                                logger.debug("Parsed Network LSA from %s", lsa_header.advertising_router)
                             elif lsa_header.ls_type == AS_EXTERNAL_LSA:
                                 body = ASExternalLSA(body_bytes)
-                                logger.debug(f"Parsed External LSA from {lsa_header.advertising_router}: "
-                                           f"network={lsa_header.link_state_id}, "
-                                           f"mask={body.network_mask}, metric={body.metric}")
+                                if debug:
+                                    logger.debug("Parsed External LSA from %s: network=%s, mask=%s, metric=%s",
+                                                 lsa_header.advertising_router, lsa_header.link_state_id,
+                                                 body.network_mask, body.metric)
                             elif lsa_header.ls_type == NSSA_EXTERNAL_LSA:
                                 body = NSSAExternalLSA(body_bytes)
-                                logger.debug(f"Parsed NSSA External LSA from {lsa_header.advertising_router}: "
-                                           f"network={lsa_header.link_state_id}, "
-                                           f"mask={body.network_mask}, metric={body.metric}")
+                                if debug:
+                                    logger.debug("Parsed NSSA External LSA from %s: network=%s, mask=%s, metric=%s",
+                                                 lsa_header.advertising_router, lsa_header.link_state_id,
+                                                 body.network_mask, body.metric)
                             elif lsa_header.ls_type in (SUMMARY_LSA_NETWORK, SUMMARY_LSA_ASBR):
                                 body = SummaryLSA(body_bytes)
-                                logger.debug(f"Parsed Summary LSA Type {lsa_header.ls_type} from {lsa_header.advertising_router}")
+                                logger.debug("Parsed Summary LSA Type %s from %s",
+                                             lsa_header.ls_type, lsa_header.advertising_router)
                         except (ValueError, struct.error, AttributeError) as e:
                             logger.warning(f"Could not parse LSA body type {lsa_header.ls_type} from {lsa_header.advertising_router}: {e}")
                             # Continue with body=None - callers must handle None body gracefully
@@ -649,8 +644,110 @@ class LSAFloodingManager:
 
         return lsas_to_retransmit
 
+    def schedule_retransmit(self, neighbor: OSPFNeighbor, lsa: LSA, when: float):
+        """
+        Schedule a retransmission check for an LSA sent to a neighbor
+
+        Args:
+            neighbor: Neighbor the LSA was sent to
+            lsa: LSA awaiting acknowledgment
+            when: Time (time.time() based) the retransmission falls due
+        """
+        self._rxmt_neighbors[neighbor.router_id] = neighbor
+        heapq.heappush(self._rxmt_heap, (when, neighbor.router_id, lsa.get_key()))
+
+    def forget_neighbor(self, neighbor: OSPFNeighbor):
+        """
+        Drop all retransmission state for a neighbor that fell below Exchange
+
+        RFC 2328 Section 10.3 clears the retransmission list on KillNbr,
+        SeqNumberMismatch and similar events. The neighbor's heap entries
+        become stale and are discarded when popped.
+
+        Args:
+            neighbor: Neighbor whose adjacency went down or was reset
+        """
+        neighbor.ls_retransmission_list = []
+        self.retransmit_timestamps.pop(neighbor.router_id, None)
+        if self._rxmt_neighbors.get(neighbor.router_id) is neighbor:
+            del self._rxmt_neighbors[neighbor.router_id]
+
+    def next_retransmit_time(self) -> Optional[float]:
+        """
+        Get the earliest pending retransmission deadline
+
+        Returns:
+            Deadline (time.time() based), or None if nothing is scheduled
+        """
+        return self._rxmt_heap[0][0] if self._rxmt_heap else None
+
+    def pop_due_retransmissions(self, now: Optional[float] = None) -> List[Tuple[OSPFNeighbor, List[LSA]]]:
+        """
+        Collect LSAs whose retransmission deadline has passed
+
+        Only heap entries that are due are visited, so the cost tracks the
+        number of expired timers rather than neighbors x retransmission list.
+        Due LSAs for neighbors in Exchange or Loading are pushed back one
+        RxmtInterval, and neighbors below Exchange are forgotten; returned
+        LSAs are re-armed for their next interval.
+
+        Args:
+            now: Current time (defaults to time.time())
+
+        Returns:
+            List of (neighbor, LSAs to retransmit) tuples
+        """
+        if now is None:
+            now = time.time()
+
+        heap = self._rxmt_heap
+        due: Dict[str, List[LSA]] = {}
+        deferred = []
+        lsa_maps: Dict[str, Dict[Tuple, LSA]] = {}
+
+        while heap and heap[0][0] <= now:
+            _, neighbor_id, lsa_key = heapq.heappop(heap)
+
+            # Stale entry: acked, or re-sent with a later deadline
+            sent_at = self.retransmit_timestamps.get(neighbor_id, {}).get(lsa_key)
+            if sent_at is None or sent_at + self.retransmit_interval > now:
+                continue
+
+            neighbor = self._rxmt_neighbors.get(neighbor_id)
+            if neighbor is None:
+                continue
+
+            lsa_map = lsa_maps.get(neighbor_id)
+            if lsa_map is None:
+                lsa_map = {item.get_key(): item for item in neighbor.ls_retransmission_list}
+                lsa_maps[neighbor_id] = lsa_map
+
+            lsa = lsa_map.get(lsa_key)
+            if lsa is None:
+                # No longer on the retransmission list
+                del self.retransmit_timestamps[neighbor_id][lsa_key]
+                continue
+
+            state = neighbor.get_state()
+            if state < STATE_EXCHANGE:
+                self.forget_neighbor(neighbor)
+                continue
+            if state != STATE_FULL:
+                deferred.append((now + self.retransmit_interval, neighbor_id, lsa_key))
+                continue
+
+            self.retransmit_timestamps[neighbor_id][lsa_key] = now
+            deferred.append((now + self.retransmit_interval, neighbor_id, lsa_key))
+            due.setdefault(neighbor_id, []).append(lsa)
+
+        for entry in deferred:
+            heapq.heappush(heap, entry)
+
+        return [(self._rxmt_neighbors[neighbor_id], lsas) for neighbor_id, lsas in due.items()]
+
     def flood_lsa_to_neighbors(self, lsa: LSA, neighbors: List[OSPFNeighbor],
-                               area_id: str, exclude_neighbor: Optional[OSPFNeighbor] = None) -> List[bytes]:
+                               area_id: str, exclude_neighbor: Optional[OSPFNeighbor] = None,
+                               lsu_cache: Optional[Dict[Tuple, bytes]] = None) -> List[bytes]:
         """
         Flood LSA to all neighbors except specified one
 
@@ -659,11 +756,43 @@ class LSAFloodingManager:
             neighbors: List of all neighbors
             area_id: OSPF area ID
             exclude_neighbor: Neighbor to exclude from flooding (sender)
+            lsu_cache: Optional dict of serialized LSUs keyed by LSA instances
+
+        Returns:
+            List of (neighbor, LSU packet) tuples to send
+        """
+        return self.flood_lsas_to_neighbors([lsa], neighbors, area_id,
+                                            exclude_neighbor, lsu_cache)
+
+    def flood_lsas_to_neighbors(self, lsas: List[LSA], neighbors: List[OSPFNeighbor],
+                                area_id: str, exclude_neighbor: Optional[OSPFNeighbor] = None,
+                                lsu_cache: Optional[Dict[Tuple, bytes]] = None) -> List[bytes]:
+        """
+        Flood several LSAs in one LSU to all neighbors except specified one
+
+        The LSU is serialized once and shared by every neighbor. Passing the
+        same lsu_cache across calls also shares it between interfaces.
+
+        Args:
+            lsas: LSAs to flood
+            neighbors: List of all neighbors
+            area_id: OSPF area ID
+            exclude_neighbor: Neighbor to exclude from flooding (sender)
+            lsu_cache: Optional dict of serialized LSUs keyed by LSA instances
 
         Returns:
-            List of LSU packets to send (one per neighbor)
+            List of (neighbor, LSU packet) tuples to send
         """
         lsu_packets = []
+        if not lsas:
+            return lsu_packets
+        if lsu_cache is None:
+            lsu_cache = {}
+        cache_key = tuple(
+            (lsa.header.ls_type, lsa.header.link_state_id,
+             lsa.header.advertising_router, lsa.header.ls_sequence_number)
+            for lsa in lsas
+        )
 
         for neighbor in neighbors:
             # Skip excluded neighbor and neighbors not in Full state
@@ -673,16 +802,21 @@ class LSAFloodingManager:
             if neighbor.get_state() != STATE_FULL:
                 continue
 
-            # Build LSU packet with this LSA
-            lsu_packet = self.build_ls_update([lsa], area_id)
+            # Build LSU packet with these LSAs (once per set of LSA instances)
+            lsu_packet = lsu_cache.get(cache_key)
+            if lsu_packet is None:
+                lsu_packet = self.build_ls_update(lsas, area_id)
+                lsu_cache[cache_key] = lsu_packet
 
             if lsu_packet:
                 lsu_packets.append((neighbor, lsu_packet))
 
                 # Add to retransmission list
-                self.add_lsa_to_retransmission_list(lsa, neighbor)
+                for lsa in lsas:
+                    self.add_lsa_to_retransmission_list(lsa, neighbor)
 
-                logger.debug(f"Flooding LSA to {neighbor.router_id}: {lsa}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Flooding %d LSAs to %s", len(lsas), neighbor.router_id)
 
         return lsu_packets
 
@@ -753,7 +887,7 @@ class LSAFloodingManager:
             links=links
         )
 
-        logger.debug(f"Manual parse: num_links={num_links}, parsed {len(links)} links")
+        logger.debug("Manual parse: num_links=%s, parsed %d links", num_links, len(links))
 
         return lsa_body
 
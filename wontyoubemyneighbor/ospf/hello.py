@@ -4,10 +4,12 @@ RFC 2328 Section 9.5 - Sending Hello packets
 RFC 2328 Section 10.5 - Receiving Hello packets
 """
 
+import socket
+import struct
 import time
 import logging
 from typing import Dict, Optional, Callable
-from ospf.packets import OSPFHeader, OSPFHello, parse_ospf_packet
+from ospf.packets import OSPFHeader, OSPFHello, parse_ospf_hello, ospf_checksum
 from ospf.constants import (
     HELLO_PACKET, HELLO_INTERVAL, ROUTER_DEAD_INTERVAL,
     ALLSPFROUTERS, NETWORK_TYPE_BROADCAST, NETWORK_TYPE_POINT_TO_MULTIPOINT,
@@ -16,6 +18,12 @@ from ospf.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Hello layout: 24-byte OSPF header + 20-byte fixed body, then neighbor IDs
+_HELLO_NEIGHBORS_OFFSET = 44
+_LENGTH_OFFSET = 2
+_CHECKSUM_OFFSET = 12
+_U16 = struct.Struct("!H")
+
 
 class HelloHandler:
     """
@@ -62,9 +70,17 @@ class HelloHandler:
         self.designated_router = "0.0.0.0"
         self.backup_designated_router = "0.0.0.0"
 
+        # Serialized Hello without neighbors, rebuilt when a fixed field changes
+        self._hello_template: bytes = b""
+        self._hello_template_key: Optional[tuple] = None
+
+        # Last Hello sent, reused while neither the fixed fields nor the
+        # neighbor list change (the steady state)
+        self._last_hello: bytes = b""
+        self._last_hello_key: Optional[tuple] = None
+
         # Callbacks
         self.on_neighbor_discovered: Optional[Callable] = None
-        self.on_neighbor_dead: Optional[Callable] = None
         self.on_hello_received: Optional[Callable] = None
 
         # Message statistics
@@ -98,6 +114,41 @@ class HelloHandler:
         if active_neighbors is None:
             active_neighbors = list(self.neighbors.keys())
 
+        # Fixed fields only change on DR election or reconfiguration, so
+        # reuse the serialized prefix and just append the neighbor list
+        key = (self.router_id, self.area_id, self.network_mask, self.hello_interval,
+               self.priority, self.dead_interval, self.designated_router,
+               self.backup_designated_router)
+        # Increment send counter
+        self.stats['hello_sent'] += 1
+
+        hello_key = (key, tuple(active_neighbors))
+        if hello_key == self._last_hello_key:
+            return self._last_hello
+
+        if key != self._hello_template_key:
+            self._hello_template = self._build_hello_template()
+            self._hello_template_key = key
+
+        packet = bytearray(self._hello_template)
+        packet += b"".join(map(socket.inet_aton, active_neighbors))
+
+        # Patch length, then checksum (computed with the field zeroed)
+        _U16.pack_into(packet, _LENGTH_OFFSET, len(packet))
+        _U16.pack_into(packet, _CHECKSUM_OFFSET, 0)
+        _U16.pack_into(packet, _CHECKSUM_OFFSET, ospf_checksum(packet))
+
+        self._last_hello = bytes(packet)
+        self._last_hello_key = hello_key
+        return self._last_hello
+
+    def _build_hello_template(self) -> bytes:
+        """
+        Serialize the fixed part of our Hello (header + body, no neighbors)
+
+        Returns:
+            First 44 bytes of the Hello packet
+        """
         # Build OSPF header
         header = OSPFHeader(
             version=2,
@@ -116,16 +167,10 @@ class HelloHandler:
             router_dead_interval=self.dead_interval,
             designated_router=self.designated_router,
             backup_designated_router=self.backup_designated_router,
-            neighbors=active_neighbors  # Use provided or internal neighbor list
+            neighbors=[]
         )
 
-        # Combine and serialize
-        packet = header / hello
-
-        # Increment send counter
-        self.stats['hello_sent'] += 1
-
-        return bytes(packet)
+        return bytes(header / hello)[:_HELLO_NEIGHBORS_OFFSET]
 
     def process_hello(self, packet_data: bytes, source_ip: str) -> Optional[str]:
         """
@@ -139,23 +184,20 @@ class HelloHandler:
             Neighbor router ID if valid, None otherwise
         """
         try:
-            # Parse packet
-            packet = parse_ospf_packet(packet_data)
-            if not packet or packet.type != HELLO_PACKET:
+            # Parse packet (header and Hello body in one pass)
+            hello = parse_ospf_hello(packet_data)
+            if not hello:
                 logger.warning(f"Invalid Hello packet from {source_ip}")
                 return None
 
             # Validate area
-            if packet.area_id != self.area_id:
-                logger.warning(f"Hello from {source_ip} with mismatched area: {packet.area_id} != {self.area_id}")
+            if hello.area_id != self.area_id:
+                logger.warning(f"Hello from {source_ip} with mismatched area: {hello.area_id} != {self.area_id}")
                 return None
 
-            # Extract Hello fields
-            hello = packet[OSPFHello]
-
             # Validate Hello parameters (RFC 2328 Section 10.5)
             # Per RFC 2328 Section 9.1, network mask is ignored on point-to-point networks
-            logger.debug(f"[{self.interface}] Checking network mask: self.network_type={self.network_type}, constant={NETWORK_TYPE_POINT_TO_POINT}, equal={self.network_type == NETWORK_TYPE_POINT_TO_POINT}")
+            logger.debug("[%s] Checking network mask: network_type=%s", self.interface, self.network_type)
             if self.network_type != NETWORK_TYPE_POINT_TO_POINT:
                 if hello.network_mask != self.network_mask:
                     logger.warning(f"Hello from {source_ip} with mismatched network mask")
@@ -170,8 +212,8 @@ class HelloHandler:
                 return None
 
             # Extract neighbor router ID
-            neighbor_id = packet.router_id
-            logger.debug(f"Received valid Hello from {neighbor_id} ({source_ip})")
+            neighbor_id = hello.router_id
+            logger.debug("Received valid Hello from %s (%s)", neighbor_id, source_ip)
 
             # Increment receive counter
             self.stats['hello_recv'] += 1
@@ -201,28 +243,6 @@ class HelloHandler:
             logger.error(f"Error processing Hello from {source_ip}: {e}")
             return None
 
-    def check_dead_neighbors(self) -> list:
-        """
-        Check for dead neighbors (no Hello in dead_interval)
-
-        Returns:
-            List of dead neighbor router IDs
-        """
-        now = time.time()
-        dead_neighbors = []
-
-        for neighbor_id, last_seen in list(self.neighbors.items()):
-            if now - last_seen > self.dead_interval:
-                logger.warning(f"Neighbor {neighbor_id} declared dead (timeout)")
-                dead_neighbors.append(neighbor_id)
-                del self.neighbors[neighbor_id]
-
-                # Trigger callback
-                if self.on_neighbor_dead:
-                    self.on_neighbor_dead(neighbor_id)
-
-        return dead_neighbors
-
     def get_neighbors(self) -> Dict[str, float]:
         """
         Get current neighbors
@@ -3,23 +3,42 @@ OSPF Link State Database
 RFC 2328 Section 12 - The Link State Advertisement
 """
 
+import heapq
+import itertools
+import struct
 import time
 import logging
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 from ospf.packets import LSAHeader, RouterLSA, NetworkLSA, RouterLink, ASExternalLSA, SummaryLSA, NSSAExternalLSA
 from ospf.constants import (
-    ROUTER_LSA, INITIAL_SEQUENCE_NUMBER, MAX_AGE,
+    ROUTER_LSA, NETWORK_LSA, INITIAL_SEQUENCE_NUMBER, MAX_AGE,
     LINK_TYPE_STUB, AS_EXTERNAL_LSA, SUMMARY_LSA_NETWORK, SUMMARY_LSA_ASBR, NSSA_EXTERNAL_LSA
 )
 
 logger = logging.getLogger(__name__)
 
+_U16 = struct.Struct("!H")
+
+# LSA types that describe the intra-area graph (everything else hangs off it)
+TOPOLOGY_LSA_TYPES = frozenset((ROUTER_LSA, NETWORK_LSA))
+
+
+class RouterLSALink(NamedTuple):
+    """One link of a Router LSA being originated (addresses as dotted quads)"""
+    link_id: str
+    link_data: str
+    link_type: int = LINK_TYPE_STUB
+    metric: int = 1
+
 
 class LSA:
     """
     Link State Advertisement container
     """
 
+    __slots__ = ('header', 'body', 'install_time', '_age_base', '_age_time', '_lsdb')
+
     def __init__(self, header: LSAHeader, body: Optional[object] = None):
         """
         Initialize LSA
@@ -31,7 +50,37 @@ class LSA:
         self.header = header
         self.body = body
         self.install_time = time.time()
-        self.age = header.ls_age
+        # Age is derived lazily from the age at a reference time, so the
+        # database never has to walk every LSA to bump counters
+        self._age_base = header.ls_age or 0
+        self._age_time = self.install_time
+        # Database holding this LSA, told when the age changes so its MaxAge
+        # deadline follows
+        self._lsdb: Optional['LinkStateDatabase'] = None
+
+    @property
+    def age(self) -> int:
+        """
+        Current LSA age in seconds, capped at MAX_AGE
+        """
+        age = self._age_base + int(time.time() - self._age_time)
+        return age if age < MAX_AGE else MAX_AGE
+
+    @age.setter
+    def age(self, value: int):
+        self._age_base = value
+        self._age_time = time.time()
+        if self._lsdb is not None:
+            self._lsdb._push_expiry(self.get_key(), self)
+
+    def expires_at(self) -> float:
+        """
+        Get the wall-clock time at which this LSA reaches MaxAge
+
+        Returns:
+            Timestamp (time.time() scale)
+        """
+        return self._age_time + (MAX_AGE - self._age_base)
 
     def get_key(self) -> Tuple[int, str, str]:
         """
@@ -53,9 +102,7 @@ class LSA:
         Args:
             seconds: Seconds to increment
         """
-        self.age += seconds
-        if self.age > MAX_AGE:
-            self.age = MAX_AGE
+        self.age = min(self.age + seconds, MAX_AGE)
 
     def is_maxage(self) -> bool:
         """
@@ -88,7 +135,21 @@ class LinkStateDatabase:
         """
         self.area_id = area_id
         self.database: Dict[Tuple[int, str, str], LSA] = {}
-        self.last_age_time = time.time()
+        # Index: advertising router -> keys of the LSAs it originated
+        self._by_adv_router: Dict[str, Set[Tuple[int, str, str]]] = defaultdict(set)
+        # MaxAge deadlines as (expires_at, seq, key, lsa); entries whose LSA
+        # was replaced, removed or re-aged (which queues a new deadline) are
+        # skipped when popped
+        self._expiry: List[Tuple[float, int, Tuple[int, str, str], LSA]] = []
+        self._expiry_seq = itertools.count()
+        # (version, [(lsa, serialized 20-byte header)]) for get_lsa_header_bytes()
+        self._header_cache: Tuple[int, List[Tuple[LSA, bytes]]] = (-1, [])
+        # Bumped on every install/removal, so consumers (SPF) can tell
+        # whether the contents changed since they last looked
+        self.version = 0
+        # Bumped only when a Router or Network LSA changes, i.e. when the
+        # graph SPF runs Dijkstra over may have changed
+        self.topology_version = 0
 
         logger.info(f"Initialized LSDB for area {area_id}")
 
@@ -112,7 +173,7 @@ class LinkStateDatabase:
             # Compare sequence numbers (RFC 2328 Section 13.1)
             if self._is_newer(lsa_header, existing.header):
                 # New LSA is newer, replace
-                self.database[key] = LSA(lsa_header, lsa_body)
+                self._store(key, LSA(lsa_header, lsa_body))
                 logger.info(f"Updated LSA in LSDB: {key}")
                 return True
             else:
@@ -121,10 +182,42 @@ class LinkStateDatabase:
                 return False
         else:
             # New LSA
-            self.database[key] = LSA(lsa_header, lsa_body)
+            self._store(key, LSA(lsa_header, lsa_body))
             logger.info(f"Added new LSA to LSDB: {key}")
             return True
 
+    def _store(self, key: Tuple[int, str, str], lsa: LSA):
+        """
+        Store LSA under key and index it by advertising router
+        """
+        self.database[key] = lsa
+        self._by_adv_router[key[2]].add(key)
+        self.version += 1
+        if key[0] in TOPOLOGY_LSA_TYPES:
+            self.topology_version += 1
+        lsa._lsdb = self
+        self._push_expiry(key, lsa)
+
+    def _push_expiry(self, key: Tuple[int, str, str], lsa: LSA):
+        """
+        Queue the LSA's current MaxAge deadline for age_lsas()
+        """
+        heapq.heappush(self._expiry, (lsa.expires_at(), next(self._expiry_seq), key, lsa))
+
+    def _remove(self, key: Tuple[int, str, str]):
+        """
+        Remove LSA stored under key and drop it from the index
+        """
+        self.database.pop(key)._lsdb = None
+        self.version += 1
+        if key[0] in TOPOLOGY_LSA_TYPES:
+            self.topology_version += 1
+        keys = self._by_adv_router.get(key[2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_adv_router[key[2]]
+
     def get_lsa(self, ls_type: int, ls_id: str, adv_router: str) -> Optional[LSA]:
         """
         Retrieve specific LSA from database
@@ -149,6 +242,21 @@ class LinkStateDatabase:
         """
         return list(self.database.values())
 
+    def get_lsas_by_adv_router(self, adv_router: str) -> List[LSA]:
+        """
+        Get all LSAs originated by a router
+
+        Args:
+            adv_router: Advertising router ID
+
+        Returns:
+            List of LSA objects
+        """
+        keys = self._by_adv_router.get(adv_router)
+        if not keys:
+            return []
+        return [self.database[key] for key in keys]
+
     def get_lsa_headers(self) -> List[LSAHeader]:
         """
         Get headers of all LSAs (for DBD exchange)
@@ -159,56 +267,69 @@ class LinkStateDatabase:
         Returns:
             List of LSA headers with correct length values
         """
-        headers = []
-        for lsa in self.database.values():
-            # Build a complete LSA to get correct length
-            full_lsa = lsa.header / lsa.body
-            full_lsa_bytes = bytes(full_lsa)
-            lsa_length = len(full_lsa_bytes)
-
-            # Create a new header with the correct length
-            header = LSAHeader(
-                ls_age=lsa.age,
-                options=lsa.header.options,
-                ls_type=lsa.header.ls_type,
-                link_state_id=lsa.header.link_state_id,
-                advertising_router=lsa.header.advertising_router,
-                ls_sequence_number=lsa.header.ls_sequence_number,
-                ls_checksum=lsa.header.ls_checksum,  # Keep original checksum
-                length=lsa_length
-            )
-            headers.append(header)
-        return headers
+        return [LSAHeader(header) for header in self.get_lsa_header_bytes()]
+
+    def get_lsa_header_bytes(self) -> List[bytes]:
+        """
+        Get the serialized 20-byte headers of all LSAs (for DBD exchange)
+
+        The serialized headers are cached until the LSDB changes; only the
+        age is patched in on each call, so DBDs copy them without going
+        through Scapy.
+
+        Returns:
+            List of serialized LSA headers with correct length values
+        """
+        version, cached = self._header_cache
+        if version != self.version:
+            cached = []
+            for lsa in self.database.values():
+                # Build a complete LSA to get correct length
+                full_lsa = lsa.header / lsa.body
+                full_lsa_bytes = bytes(full_lsa)
+                lsa_length = len(full_lsa_bytes)
+
+                # Create a new header with the correct length
+                header = LSAHeader(
+                    ls_age=0,
+                    options=lsa.header.options,
+                    ls_type=lsa.header.ls_type,
+                    link_state_id=lsa.header.link_state_id,
+                    advertising_router=lsa.header.advertising_router,
+                    ls_sequence_number=lsa.header.ls_sequence_number,
+                    ls_checksum=lsa.header.ls_checksum,  # Keep original checksum
+                    length=lsa_length
+                )
+                cached.append((lsa, bytes(header)))
+            self._header_cache = (self.version, cached)
+
+        # LS age is the first field (and outside the LSA checksum)
+        return [_U16.pack(lsa.age) + header[2:] for lsa, header in cached]
 
     def age_lsas(self) -> int:
         """
-        Age all LSAs, remove MaxAge LSAs
+        Remove LSAs that have reached MaxAge
+
+        Ages are computed lazily, so only LSAs whose MaxAge deadline has
+        passed are visited; with nothing due this is a single heap peek.
 
         Returns:
             Number of LSAs aged out
         """
+        expiry = self._expiry
         now = time.time()
-        elapsed = int(now - self.last_age_time)
-
-        if elapsed < 1:
-            return 0
-
-        self.last_age_time = now
-        max_age_lsas = []
-
-        # Age all LSAs
-        for key, lsa in self.database.items():
-            lsa.increment_age(elapsed)
+        aged_out = 0
 
-            if lsa.is_maxage():
-                max_age_lsas.append(key)
+        while expiry and expiry[0][0] <= now:
+            deadline, _, key, lsa = heapq.heappop(expiry)
+            if self.database.get(key) is not lsa or deadline != lsa.expires_at():
+                continue  # Replaced, removed or re-aged (and re-queued) meanwhile
 
-        # Remove MaxAge LSAs
-        for key in max_age_lsas:
-            logger.info(f"Removing MaxAge LSA: {key}")
-            del self.database[key]
+            logger.info("Removing MaxAge LSA: %s", key)
+            self._remove(key)
+            aged_out += 1
 
-        return len(max_age_lsas)
+        return aged_out
 
     def is_lsa_newer(self, lsa_header: LSAHeader) -> bool:
         """
@@ -263,14 +384,14 @@ class LinkStateDatabase:
             ck2 = lsa2_header.ls_checksum or 0
             return ck1 > ck2
 
-    def create_router_lsa(self, router_id: str, links: List[dict],
+    def create_router_lsa(self, router_id: str, links: List[Union[RouterLSALink, dict]],
                          sequence_number: Optional[int] = None) -> Tuple[LSAHeader, RouterLSA]:
         """
         Generate Router LSA for this router
 
         Args:
             router_id: Router ID
-            links: List of link dictionaries
+            links: List of RouterLSALink (or link dictionaries)
             sequence_number: LSA sequence number (or None for initial)
 
         Returns:
@@ -287,11 +408,18 @@ class LinkStateDatabase:
         # Build router links
         router_links = []
         for link in links:
+            if isinstance(link, dict):
+                link = RouterLSALink(
+                    link.get('link_id', '0.0.0.0'),
+                    link.get('link_data', '0.0.0.0'),
+                    link.get('link_type', LINK_TYPE_STUB),
+                    link.get('metric', 1)
+                )
             router_link = RouterLink(
-                link_id=link.get('link_id', '0.0.0.0'),
-                link_data=link.get('link_data', '0.0.0.0'),
-                link_type=link.get('link_type', LINK_TYPE_STUB),
-                metric=link.get('metric', 1)
+                link_id=link.link_id,
+                link_data=link.link_data,
+                link_type=link.link_type,
+                metric=link.metric
             )
             router_links.append(router_link)
 
@@ -318,13 +446,13 @@ class LinkStateDatabase:
 
         return (lsa_header, lsa_body)
 
-    def install_router_lsa(self, router_id: str, links: List[dict]) -> bool:
+    def install_router_lsa(self, router_id: str, links: List[Union[RouterLSALink, dict]]) -> bool:
         """
         Create and install Router LSA in LSDB
 
         Args:
             router_id: Router ID
-            links: List of link dictionaries
+            links: List of RouterLSALink (or link dictionaries)
 
         Returns:
             True if installed successfully
@@ -520,6 +648,10 @@ class LinkStateDatabase:
         """
         count = len(self.database)
         self.database.clear()
+        self._by_adv_router.clear()
+        self._expiry.clear()
+        self.version += 1
+        self.topology_version += 1
         logger.info(f"Cleared {count} LSAs from LSDB")
 
     def __repr__(self) -> str:
@@ -4,9 +4,10 @@ RFC 2328 Section 10 - The Neighbor Data Structure
 RFC 2328 Section 10.3 - The Neighbor state machine
 """
 
+import socket
 import time
 import logging
-from typing import List, Optional
+from typing import Callable, List, Optional
 from lib.state_machine import StateMachine
 from ospf.constants import (
     STATE_DOWN, STATE_ATTEMPT, STATE_INIT, STATE_2WAY,
@@ -24,6 +25,15 @@ class OSPFNeighbor:
     OSPF Neighbor with RFC 2328 compliant state machine
     """
 
+    __slots__ = (
+        'router_id', 'ip_address', 'sockaddr', 'ip_packed', 'priority', 'network_type',
+        'last_hello', 'created_at',
+        'dd_sequence_number', 'last_received_dbd_packet', 'is_master',
+        'neighbor_dbd_complete', 'our_dbd_complete',
+        'ls_request_list', 'ls_retransmission_list', 'db_summary_list',
+        'on_state_change', 'dead_timer', 'fsm',
+    )
+
     def __init__(self, router_id: str, ip_address: str, priority: int = 1, network_type: str = "broadcast"):
         """
         Initialize OSPF neighbor
@@ -36,6 +46,9 @@ class OSPFNeighbor:
         """
         self.router_id = router_id
         self.ip_address = ip_address
+        # Pre-built destination forms for the send paths
+        self.sockaddr = (ip_address, 0)
+        self.ip_packed = socket.inet_aton(ip_address)
         self.priority = priority
         self.network_type = network_type
 
@@ -57,6 +70,12 @@ class OSPFNeighbor:
         self.ls_retransmission_list: List = []   # LSAs awaiting ack
         self.db_summary_list: List = []          # LSAs to send in DBD
 
+        # Optional observer called as on_state_change(neighbor, old_state, new_state)
+        self.on_state_change: Optional[Callable[['OSPFNeighbor', int, int], None]] = None
+
+        # Owner-managed inactivity timer handle (e.g. asyncio.TimerHandle)
+        self.dead_timer = None
+
         # State machine
         self.fsm = StateMachine(STATE_DOWN, name=f"Neighbor-{router_id}")
         self._setup_state_machine()
@@ -104,6 +123,15 @@ class OSPFNeighbor:
             self.fsm.add_transition(state, EVENT_INACTIVITY_TIMER, STATE_DOWN)
             self.fsm.add_transition(state, EVENT_1WAY, STATE_INIT)
 
+        self.fsm.add_on_transition(self._notify_state_change)
+
+    def _notify_state_change(self, old_state: int, new_state: int, event: str):
+        """
+        Forward FSM state changes to the on_state_change observer
+        """
+        if self.on_state_change:
+            self.on_state_change(self, old_state, new_state)
+
     def handle_hello_received(self, bidirectional: bool = False):
         """
         Handle Hello packet reception
@@ -222,12 +250,12 @@ class OSPFNeighbor:
     def mark_neighbor_dbd_complete(self):
         """Mark that neighbor has sent their final DBD (M=0)"""
         self.neighbor_dbd_complete = True
-        logger.debug(f"Neighbor {self.router_id} DBD complete (M=0 received)")
+        logger.debug("Neighbor %s DBD complete (M=0 received)", self.router_id)
 
     def mark_our_dbd_complete(self):
         """Mark that we have sent our final DBD (M=0)"""
         self.our_dbd_complete = True
-        logger.debug(f"Our DBD complete for {self.router_id} (M=0 sent)")
+        logger.debug("Our DBD complete for %s (M=0 sent)", self.router_id)
 
     def is_exchange_complete(self) -> bool:
         """
@@ -9,11 +9,13 @@ from scapy.fields import (
     XShortField, XLongField, FieldListField, PacketListField,
     BitField, X3BytesField, StrFixedLenField
 )
+import socket
 import struct
-from typing import Optional
+from itertools import accumulate
+from typing import NamedTuple, Optional
 
 from .constants import (
-    OSPF_VERSION, PACKET_TYPES, AUTH_TYPE_NAMES,
+    OSPF_VERSION, HELLO_PACKET, PACKET_TYPES, AUTH_TYPE_NAMES,
     LSA_TYPE_NAMES, LINK_TYPE_NAMES
 )
 
@@ -22,6 +24,109 @@ from .constants import (
 # Helper Functions
 # ============================================================================
 
+_U32 = struct.Struct("!I")
+
+# Fixed 24-byte OSPF header: version, type, length, router ID, area ID,
+# checksum, auth type, authentication data
+OSPF_HEADER_STRUCT = struct.Struct("!BBHIIHHQ")
+
+
+class OSPFHeaderFields(NamedTuple):
+    """Decoded fixed OSPF header (addresses kept as 32-bit integers)"""
+    version: int
+    type: int
+    length: int
+    router_id: int
+    area_id: int
+    checksum: int
+    auth_type: int
+    auth_data: int
+
+    @property
+    def router_id_str(self) -> str:
+        """Router ID in dotted-quad notation"""
+        return socket.inet_ntoa(_U32.pack(self.router_id))
+
+
+def ipv4_to_int(ip: str) -> int:
+    """
+    Convert dotted-quad IPv4 address (or Router/Area ID) to a 32-bit integer
+    """
+    return _U32.unpack(socket.inet_aton(ip))[0]
+
+
+def parse_ospf_header(data) -> Optional[OSPFHeaderFields]:
+    """
+    Decode the fixed OSPF header without building a Scapy packet
+
+    Accepts bytes, bytearray or memoryview so callers can parse straight
+    out of a receive buffer without copying.
+
+    Args:
+        data: Raw OSPF packet
+
+    Returns:
+        OSPFHeaderFields or None if data is shorter than an OSPF header
+    """
+    if len(data) < OSPF_HEADER_STRUCT.size:
+        return None
+    return OSPFHeaderFields._make(OSPF_HEADER_STRUCT.unpack_from(data, 0))
+
+
+# Fixed 20-byte Hello body: network mask, hello interval, options,
+# priority, dead interval, DR, BDR (neighbor IDs follow)
+OSPF_HELLO_STRUCT = struct.Struct("!4sHBBI4s4s")
+
+
+class OSPFHelloFields(NamedTuple):
+    """Decoded Hello packet (addresses as dotted-quad strings, like Scapy)"""
+    router_id: str
+    area_id: str
+    network_mask: str
+    hello_interval: int
+    options: int
+    router_priority: int
+    router_dead_interval: int
+    designated_router: str
+    backup_designated_router: str
+    neighbors: tuple
+
+
+def parse_ospf_hello(data) -> Optional[OSPFHelloFields]:
+    """
+    Decode a Hello packet with struct instead of Scapy
+
+    Hellos are the most frequent OSPF packet, so they skip the Scapy
+    dissector. The neighbor list is bounded by the header length field.
+
+    Args:
+        data: Raw OSPF packet (bytes, bytearray or memoryview)
+
+    Returns:
+        OSPFHelloFields, or None if data is not a well-formed Hello
+    """
+    header_size = OSPF_HEADER_STRUCT.size
+    body_end = header_size + OSPF_HELLO_STRUCT.size
+    if len(data) < body_end:
+        return None
+    _, ptype, length, router_id, area_id, _, _, _ = OSPF_HEADER_STRUCT.unpack_from(data, 0)
+    if ptype != HELLO_PACKET or length < body_end or length > len(data):
+        return None
+    mask, hello_interval, options, priority, dead_interval, dr, bdr = \
+        OSPF_HELLO_STRUCT.unpack_from(data, header_size)
+
+    ntoa = socket.inet_ntoa
+    neighbors = tuple(
+        ntoa(data[offset:offset + 4])
+        for offset in range(body_end, length - 3, 4)
+    )
+    return OSPFHelloFields(
+        ntoa(_U32.pack(router_id)), ntoa(_U32.pack(area_id)), ntoa(mask),
+        hello_interval, options, priority, dead_interval,
+        ntoa(dr), ntoa(bdr), neighbors
+    )
+
+
 def ospf_checksum(data: bytes) -> int:
     """
     Calculate OSPF checksum (standard IP checksum, RFC 905)
@@ -32,20 +137,19 @@ def ospf_checksum(data: bytes) -> int:
         return 0
 
     # Header without checksum and without auth
-    checksum_data = data[:12] + b'\x00\x00' + data[14:16]
-
-    # Add payload after header
-    if len(data) > 24:
-        checksum_data += data[24:]
+    checksum_data = bytes(data[:12]) + bytes(data[14:16]) + bytes(data[24:])
 
     # Pad if odd length
     if len(checksum_data) % 2:
         checksum_data += b'\x00'
 
-    # Calculate sum
-    s = sum(struct.unpack('!%dH' % (len(checksum_data) // 2), checksum_data))
-    s = (s >> 16) + (s & 0xffff)
-    s += s >> 16
+    # Since 2**16 == 1 (mod 0xffff), the ones-complement sum of the 16-bit
+    # words is the whole buffer read as one big integer, mod 0xffff - a
+    # single C-level reduction instead of unpacking every word.
+    value = int.from_bytes(checksum_data, 'big')
+    s = value % 0xffff
+    if s == 0 and value:
+        s = 0xffff
 
     return ~s & 0xffff
 
@@ -66,26 +170,20 @@ def fletcher_checksum(data: bytes, offset: int = 2) -> int:
     # Checksum goes at bytes 16-17 (LS Checksum field in LSA header)
     CHECKSUM_OFFSET = 16
 
-    c0 = 0
-    c1 = 0
-
-    # Calculate C0 and C1 over the entire buffer starting from offset
-    for i in range(offset, len(data)):
-        c0 = c0 + data[i]
-        c1 = c1 + c0
-
-    c0 = c0 % 255
-    c1 = c1 % 255
+    # Calculate C0 and C1 over the entire buffer starting from offset.
+    # C1 is the sum of the running C0 values, so both sums run in C via
+    # sum()/accumulate() instead of a per-byte Python loop.
+    segment = bytes(data[offset:])
+    n = len(segment)
+    c0 = sum(segment) % 255
+    c1 = sum(accumulate(segment)) % 255
 
     # Calculate position of checksum in buffer from our starting offset
     # Checksum is at byte 16, we start at byte 2 (offset), so position is 14
     p = CHECKSUM_OFFSET - offset  # Should be 14 for offset=2
 
-    # Number of bytes in the packet from our offset
-    l = len(data) - offset
-
-    # Calculate x and y per ISO 8473
-    x = (((l - p - 1) * c0 - c1) % 255)
+    # Calculate x and y per ISO 8473 (n = bytes in the packet from our offset)
+    x = (((n - p - 1) * c0 - c1) % 255)
     if x <= 0:
         x = x + 255
 
@@ -5,7 +5,7 @@ Uses Dijkstra's algorithm
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import networkx as nx
 from ospf.lsdb import LinkStateDatabase, LSA
 from ospf.constants import (
@@ -61,6 +61,9 @@ class SPFCalculator:
         self.lsdb = lsdb
         self.routing_table: Dict[str, RouteEntry] = {}
         self.graph: Optional[nx.Graph] = None
+        # (LSDB topology_version, intra-area routes, costs) from the last
+        # Dijkstra run, reused while no Router/Network LSA has changed
+        self._intra_area: Optional[Tuple[int, Dict[str, RouteEntry], Dict[str, int]]] = None
 
         logger.info(f"Initialized SPF calculator for {router_id}")
 
@@ -68,32 +71,97 @@ class SPFCalculator:
         """
         Run SPF algorithm and build routing table
 
+        Dijkstra is skipped when no Router or Network LSA changed since the
+        last run; Summary and External routes are then recomputed on top of
+        the cached shortest-path tree.
+
         Returns:
             Dictionary of destination -> RouteEntry
         """
         logger.info(f"Starting SPF calculation for {self.router_id}")
 
+        # Read the topology version before taking the snapshot: the snapshot
+        # is then at least as new as the version the tree is cached under,
+        # so a concurrent change can only cause an extra Dijkstra, never a
+        # stale tree
+        topology_version = self.lsdb.topology_version
+
+        # Take one snapshot of the LSDB so the calculation never iterates the
+        # live database (it may run in a worker thread while LSAs are installed)
+        lsas = self.lsdb.get_all_lsas()
+
+        if self._intra_area is not None and self._intra_area[0] == topology_version:
+            # Only Summary/External LSAs changed: they are leaves of the
+            # shortest-path tree, so the intra-area routes still hold
+            _, intra_routes, shortest_costs = self._intra_area
+            logger.debug("Topology unchanged (version %d), reusing shortest-path tree",
+                         topology_version)
+        else:
+            intra = self._calculate_intra_area(lsas)
+            if intra is None:
+                self._intra_area = None
+                return {}
+            intra_routes, shortest_costs = intra
+            self._intra_area = (topology_version, intra_routes, shortest_costs)
+
+        # A new table is built and swapped in at the end so readers never
+        # see it half-built
+        routing_table: Dict[str, RouteEntry] = dict(intra_routes)
+
+        # Step 4: Process Summary LSAs (Type 3/4) - RFC 2328 Section 16.2/16.3
+        # Inter-area routes from ABRs
+        summary_lsas = [lsa for lsa in lsas
+                        if lsa.header.ls_type in (SUMMARY_LSA_NETWORK, SUMMARY_LSA_ASBR)]
+        self._process_summary_lsas(shortest_costs, routing_table, summary_lsas)
+
+        # Step 5: Process External LSAs (Type 5) - RFC 2328 Section 16.4
+        # External routes are added AFTER SPF tree is computed
+        external_lsas = [lsa for lsa in lsas if lsa.header.ls_type == AS_EXTERNAL_LSA]
+        self._process_external_lsas(shortest_costs, routing_table, external_lsas)
+
+        # Step 6: Process NSSA External LSAs (Type 7) - RFC 3101
+        # NSSA external routes within Not-So-Stubby Areas
+        nssa_lsas = [lsa for lsa in lsas if lsa.header.ls_type == NSSA_EXTERNAL_LSA]
+        self._process_nssa_lsas(shortest_costs, routing_table, nssa_lsas)
+
+        self.routing_table = routing_table
+        logger.info(f"SPF calculation complete: {len(routing_table)} routes")
+        return routing_table
+
+    def _calculate_intra_area(self, lsas: List[LSA]
+                              ) -> Optional[Tuple[Dict[str, RouteEntry], Dict[str, int]]]:
+        """
+        Build the graph from Router/Network LSAs and run Dijkstra over it
+
+        Args:
+            lsas: LSDB snapshot
+
+        Returns:
+            (intra-area routes, router/network -> cost), or None if SPF
+            cannot run
+        """
         # Step 1: Build network graph from LSDB
-        self.graph = self._build_graph()
+        graph = self._build_graph(lsas)
+        self.graph = graph
 
-        if not self.graph or self.router_id not in self.graph:
+        if not graph or self.router_id not in graph:
             logger.warning("Cannot run SPF - router not in graph")
-            return {}
+            return None
 
         # Step 2: Run Dijkstra from our router
         try:
             shortest_paths = nx.single_source_dijkstra_path(
-                self.graph, self.router_id, weight='weight'
+                graph, self.router_id, weight='weight'
             )
             shortest_costs = nx.single_source_dijkstra_path_length(
-                self.graph, self.router_id, weight='weight'
+                graph, self.router_id, weight='weight'
             )
         except (nx.NetworkXError, nx.NodeNotFound, KeyError) as e:
             logger.error(f"Dijkstra calculation failed: {type(e).__name__}: {e}")
-            return {}
+            return None
 
-        # Step 3: Build routing table from shortest paths
-        self.routing_table.clear()
+        # Step 3: Build intra-area routes from shortest paths
+        intra_routes: Dict[str, RouteEntry] = {}
 
         for dest, cost in shortest_costs.items():
             if dest == self.router_id:
@@ -107,29 +175,17 @@ class SPFCalculator:
             else:
                 next_hop = None
 
-            self.routing_table[dest] = RouteEntry(
+            intra_routes[dest] = RouteEntry(
                 destination=dest,
                 cost=cost,
                 next_hop=next_hop,
                 path=path
             )
 
-        # Step 4: Process Summary LSAs (Type 3/4) - RFC 2328 Section 16.2/16.3
-        # Inter-area routes from ABRs
-        self._process_summary_lsas(shortest_costs)
+        return intra_routes, shortest_costs
 
-        # Step 5: Process External LSAs (Type 5) - RFC 2328 Section 16.4
-        # External routes are added AFTER SPF tree is computed
-        self._process_external_lsas(shortest_costs)
-
-        # Step 6: Process NSSA External LSAs (Type 7) - RFC 3101
-        # NSSA external routes within Not-So-Stubby Areas
-        self._process_nssa_lsas(shortest_costs)
-
-        logger.info(f"SPF calculation complete: {len(self.routing_table)} routes")
-        return self.routing_table
-
-    def _process_summary_lsas(self, shortest_costs: Dict[str, int]):
+    def _process_summary_lsas(self, shortest_costs: Dict[str, int],
+                              routing_table: Dict[str, RouteEntry], summary_lsas: List[LSA]):
         """
         Process Summary LSAs (Type 3 and Type 4) for inter-area routes.
 
@@ -142,9 +198,9 @@ class SPFCalculator:
 
         Args:
             shortest_costs: Dictionary of router_id -> cost from SPF
+            routing_table: Routing table being built (updated in place)
+            summary_lsas: Summary LSAs from the LSDB snapshot
         """
-        summary_lsas = self.lsdb.get_summary_lsas()
-
         if not summary_lsas:
             return
 
@@ -195,14 +251,14 @@ class SPFCalculator:
                     continue
 
                 # Determine next hop (same as path to ABR)
-                if abr_id in self.routing_table:
-                    next_hop = self.routing_table[abr_id].next_hop
+                if abr_id in routing_table:
+                    next_hop = routing_table[abr_id].next_hop
                 else:
                     next_hop = abr_id
 
                 # Only add if we don't have a better intra-area route
-                if prefix not in self.routing_table:
-                    self.routing_table[prefix] = RouteEntry(
+                if prefix not in routing_table:
+                    routing_table[prefix] = RouteEntry(
                         destination=prefix,
                         cost=total_cost,
                         next_hop=next_hop,
@@ -214,7 +270,8 @@ class SPFCalculator:
             except Exception as e:
                 logger.warning(f"Error processing Summary LSA: {e}")
 
-    def _process_external_lsas(self, shortest_costs: Dict[str, int]):
+    def _process_external_lsas(self, shortest_costs: Dict[str, int],
+                               routing_table: Dict[str, RouteEntry], external_lsas: List[LSA]):
         """
         Process AS External LSAs (Type 5) and add external routes.
 
@@ -225,9 +282,9 @@ class SPFCalculator:
 
         Args:
             shortest_costs: Dictionary of router_id -> cost from SPF
+            routing_table: Routing table being built (updated in place)
+            external_lsas: External LSAs from the LSDB snapshot
         """
-        external_lsas = self.lsdb.get_external_lsas()
-
         if not external_lsas:
             return
 
@@ -272,15 +329,15 @@ class SPFCalculator:
                 # Determine next hop
                 if asbr_id == self.router_id:
                     next_hop = None  # Local route
-                elif asbr_id in self.routing_table:
-                    next_hop = self.routing_table[asbr_id].next_hop
+                elif asbr_id in routing_table:
+                    next_hop = routing_table[asbr_id].next_hop
                 else:
                     next_hop = asbr_id
 
                 # Add to routing table (external routes have lower preference)
                 # Only add if we don't have a better internal route
-                if prefix not in self.routing_table:
-                    self.routing_table[prefix] = RouteEntry(
+                if prefix not in routing_table:
+                    routing_table[prefix] = RouteEntry(
                         destination=prefix,
                         cost=total_cost,
                         next_hop=next_hop,
@@ -291,7 +348,8 @@ class SPFCalculator:
             except Exception as e:
                 logger.warning(f"Error processing External LSA: {e}")
 
-    def _process_nssa_lsas(self, shortest_costs: Dict[str, int]):
+    def _process_nssa_lsas(self, shortest_costs: Dict[str, int],
+                           routing_table: Dict[str, RouteEntry], nssa_lsas: List[LSA]):
         """
         Process NSSA External LSAs (Type 7) per RFC 3101.
 
@@ -301,9 +359,9 @@ class SPFCalculator:
 
         Args:
             shortest_costs: Dictionary of router_id -> cost from SPF
+            routing_table: Routing table being built (updated in place)
+            nssa_lsas: NSSA LSAs from the LSDB snapshot
         """
-        nssa_lsas = self.lsdb.get_nssa_lsas()
-
         if not nssa_lsas:
             return
 
@@ -348,15 +406,15 @@ class SPFCalculator:
                 # Determine next hop
                 if asbr_id == self.router_id:
                     next_hop = None
-                elif asbr_id in self.routing_table:
-                    next_hop = self.routing_table[asbr_id].next_hop
+                elif asbr_id in routing_table:
+                    next_hop = routing_table[asbr_id].next_hop
                 else:
                     next_hop = asbr_id
 
                 # NSSA routes have lower priority than Type 5 external routes
                 # Only add if we don't have a better route
-                if prefix not in self.routing_table:
-                    self.routing_table[prefix] = RouteEntry(
+                if prefix not in routing_table:
+                    routing_table[prefix] = RouteEntry(
                         destination=prefix,
                         cost=total_cost,
                         next_hop=next_hop,
@@ -387,17 +445,23 @@ class SPFCalculator:
         except Exception:
             return network
 
-    def _build_graph(self) -> nx.Graph:
+    def _build_graph(self, lsas: Optional[List[LSA]] = None) -> nx.Graph:
         """
         Build network graph from LSAs in LSDB
 
+        Args:
+            lsas: LSDB snapshot to use (default: current LSDB contents)
+
         Returns:
             NetworkX graph
         """
         graph = nx.Graph()
 
+        if lsas is None:
+            lsas = self.lsdb.get_all_lsas()
+
         # Process all LSAs
-        for lsa in self.lsdb.get_all_lsas():
+        for lsa in lsas:
             if lsa.header.ls_type == ROUTER_LSA:
                 self._process_router_lsa(graph, lsa)
             elif lsa.header.ls_type == NETWORK_LSA:
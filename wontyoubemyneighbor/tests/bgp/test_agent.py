@@ -0,0 +1,123 @@
+"""
+BGP Agent Tests
+
+Tests for the decision process and kernel route installation
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from bgp.agent import BGPAgent
+from bgp.attributes import NextHopAttribute
+from bgp.constants import ATTR_NEXT_HOP
+from bgp.rib import AdjRIBIn, BGPRoute
+
+
+class _FakeSession:
+    """Established session exposing only an Adj-RIB-In"""
+
+    def __init__(self, peer_id: str):
+        self.peer_id = peer_id
+        self.adj_rib_in = AdjRIBIn()
+
+    def is_established(self) -> bool:
+        return True
+
+
+class _RecordingSession(_FakeSession):
+    """Established session recording the encoded messages sent to it"""
+
+    def __init__(self, peer_id: str, peer_as: int, local_ip: str):
+        super().__init__(peer_id)
+        self.config = SimpleNamespace(peer_as=peer_as, local_ip=local_ip)
+        self.stats = {'routes_advertised': 0}
+        self.sent = []
+
+    async def _send_message(self, message, data=None):
+        self.sent.append(data if data is not None else message.encode())
+
+
+class _RecordingKernelRoutes:
+    """Record install calls made by the decision process"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def install_routes_async(self, routes, protocol="static"):
+        self.batches.append((list(routes), protocol))
+        return len(routes)
+
+    def install_route(self, *args, **kwargs):
+        raise AssertionError("routes should be installed in one batch")
+
+
+class TestDecisionProcess(unittest.TestCase):
+    """Test Loc-RIB and kernel updates from the decision process"""
+
+    def test_kernel_routes_installed_in_one_batch(self):
+        """Test that every new best path goes to the kernel in one batch"""
+        kernel = _RecordingKernelRoutes()
+        agent = BGPAgent(65001, "192.0.2.1", kernel_route_manager=kernel)
+        session = _FakeSession("192.0.2.2")
+        for prefix in ("10.1.0.0/16", "10.2.0.0/16", "10.3.0.0/16"):
+            session.adj_rib_in.add_route(BGPRoute(
+                prefix=prefix,
+                prefix_len=16,
+                path_attributes={ATTR_NEXT_HOP: NextHopAttribute("192.0.2.2")},
+                peer_id="192.0.2.2",
+                peer_ip="192.0.2.2"
+            ))
+        agent.sessions["192.0.2.2"] = session
+
+        asyncio.run(agent._run_decision_process())
+
+        self.assertEqual(len(kernel.batches), 1)
+        routes, protocol = kernel.batches[0]
+        self.assertEqual(protocol, "bgp")
+        self.assertEqual(sorted(routes), [
+            ("10.1.0.0/16", "192.0.2.2", 100),
+            ("10.2.0.0/16", "192.0.2.2", 100),
+            ("10.3.0.0/16", "192.0.2.2", 100),
+        ])
+        self.assertEqual(agent.loc_rib.size(), 3)
+
+
+class TestAdvertiseRoutes(unittest.TestCase):
+    """Test UPDATE generation towards established peers"""
+
+    def test_identical_updates_encoded_once(self):
+        """Test that reflector clients share one encoded UPDATE"""
+        agent = BGPAgent(65001, "192.0.2.1")
+        agent.enable_route_reflection()
+        clients = [_RecordingSession(ip, 65001, "192.0.2.1")
+                   for ip in ("192.0.2.2", "192.0.2.3", "192.0.2.4")]
+        ebgp = _RecordingSession("198.51.100.1", 65002, "198.51.100.2")
+        for session in clients + [ebgp]:
+            agent.sessions[session.peer_id] = session
+            if session.config.peer_as == agent.local_as:
+                agent.route_reflector.add_client(session.peer_id)
+        agent.loc_rib.install_route(BGPRoute(
+            prefix="10.1.0.0/16",
+            prefix_len=16,
+            path_attributes={ATTR_NEXT_HOP: NextHopAttribute("192.0.2.1")},
+            peer_id="192.0.2.1",
+            peer_ip="192.0.2.1",
+            source="local"
+        ))
+
+        asyncio.run(agent._advertise_routes(["10.1.0.0/16"]))
+
+        shared = clients[0].sent[0]
+        for session in clients:
+            self.assertEqual(len(session.sent), 1)
+            self.assertIs(session.sent[0], shared)
+        self.assertIsNot(ebgp.sent[0], shared)
+        self.assertNotEqual(ebgp.sent[0], shared)
+
+
+if __name__ == '__main__':
+    unittest.main()
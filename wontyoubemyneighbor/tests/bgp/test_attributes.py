@@ -92,6 +92,13 @@ class TestASPathAttribute(unittest.TestCase):
         self.assertTrue(attr.contains_as(65002))
         self.assertFalse(attr.contains_as(65999))
 
+    def test_display_str_tracks_prepend(self):
+        attr = ASPathAttribute([(AS_SEQUENCE, [65002]), (AS_SET, [65003, 65004])])
+        self.assertEqual(attr.to_display_str(), "65002 65003 65004")
+
+        attr.prepend(65001)
+        self.assertEqual(attr.to_display_str(), "65001 65002 65003 65004")
+
 
 class TestNextHopAttribute(unittest.TestCase):
     """Test NEXT_HOP attribute"""
@@ -104,6 +111,9 @@ class TestNextHopAttribute(unittest.TestCase):
         self.assertIsNotNone(decoded)
         self.assertEqual(decoded.next_hop, "192.0.2.1")
 
+    def test_display_str(self):
+        self.assertEqual(NextHopAttribute("192.0.2.1").to_display_str(), "192.0.2.1")
+
 
 class TestMEDAttribute(unittest.TestCase):
     """Test MED attribute"""
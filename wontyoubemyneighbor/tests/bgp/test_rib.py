@@ -0,0 +1,67 @@
+"""
+BGP RIB Tests
+
+Tests for Loc-RIB change tracking and ordered views
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+import unittest
+from bgp.attributes import ASPathAttribute
+from bgp.constants import AS_SEQUENCE, AS_SET
+from bgp.rib import BGPRoute, LocRIB
+
+
+def _route(prefix: str) -> BGPRoute:
+    return BGPRoute(
+        prefix=prefix,
+        prefix_len=int(prefix.split('/')[1]),
+        path_attributes={},
+        peer_id="192.0.2.2",
+        peer_ip="192.0.2.2"
+    )
+
+
+class TestLocRIB(unittest.TestCase):
+    """Test Loc-RIB version and first-routes view"""
+
+    def setUp(self):
+        self.rib = LocRIB()
+        for prefix in ("203.0.113.0/24", "10.0.0.0/8", "192.0.2.0/24", "172.16.0.0/12"):
+            self.rib.install_route(_route(prefix))
+
+    def test_version_tracks_changes(self):
+        """Test that installs and removals bump the version"""
+        version = self.rib.version
+        self.rib.remove_route("10.0.0.0/8")
+        self.assertGreater(self.rib.version, version)
+
+        version = self.rib.version
+        self.rib.remove_route("198.51.100.0/24")
+        self.assertEqual(self.rib.version, version)
+
+    def test_first_routes_sorted_and_cached(self):
+        """Test that the first routes come back in prefix order until the RIB changes"""
+        first = self.rib.get_first_routes(2)
+        self.assertEqual([r.prefix for r in first], ["10.0.0.0/8", "172.16.0.0/12"])
+        self.assertIs(self.rib.get_first_routes(2), first)
+
+        self.rib.install_route(_route("1.0.0.0/8"))
+        self.assertEqual([r.prefix for r in self.rib.get_first_routes(2)],
+                         ["1.0.0.0/8", "10.0.0.0/8"])
+        self.assertEqual(len(self.rib.get_first_routes(20)), 5)
+
+    def test_as_path_rendered_on_install(self):
+        """Test that the AS_PATH display string is computed at install time"""
+        route = _route("198.51.100.0/24")
+        route.set_attribute(ASPathAttribute([(AS_SEQUENCE, [65001, 65002]), (AS_SET, [65003])]))
+        self.rib.install_route(route)
+
+        self.assertEqual(self.rib.lookup("198.51.100.0/24").as_path_str, "65001 65002 65003")
+        self.assertEqual(self.rib.lookup("10.0.0.0/8").as_path_str, "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -316,6 +316,17 @@ class TestBGPSpeaker(unittest.TestCase):
 
         self.assertEqual(len(self.speaker.peer_configs), 3)
 
+    def test_add_peers(self):
+        """Test adding peers in bulk"""
+        self.speaker.add_peers([
+            {'peer_ip': "192.0.2.2", 'peer_as': 65002},
+            {'peer_ip': "192.0.2.3", 'peer_as': 65001, 'passive': True},
+        ])
+
+        self.assertEqual(sorted(self.speaker.peer_configs), ["192.0.2.2", "192.0.2.3"])
+        self.assertTrue(self.speaker.peer_configs["192.0.2.3"].passive)
+        self.assertEqual(self.speaker.agent.sessions["192.0.2.2"].config.peer_as, 65002)
+
     def test_remove_peer(self):
         """Test removing peer"""
         self.speaker.add_peer(peer_ip="192.0.2.2", peer_as=65002)
@@ -0,0 +1,88 @@
+"""
+Unit tests for OSPF Database Description construction
+"""
+
+import pytest
+from scapy.packet import Raw
+from ospf.adjacency import AdjacencyManager
+from ospf.lsdb import LinkStateDatabase
+from ospf.neighbor import OSPFNeighbor
+from ospf.packets import OSPFHeader, OSPFDBDescription, validate_ospf_checksum
+from ospf.constants import DATABASE_DESCRIPTION
+
+
+@pytest.fixture
+def adjacency():
+    """Adjacency manager with two LSAs in its LSDB"""
+    lsdb = LinkStateDatabase("0.0.0.0")
+    lsdb.install_router_lsa("1.1.1.1", [])
+    lsdb.install_external_lsa("1.1.1.1", "192.168.1.0", "255.255.255.0")
+    return AdjacencyManager("1.1.1.1", lsdb)
+
+
+class TestBuildDBD:
+    """Test templated DBD serialization"""
+
+    @pytest.mark.parametrize("is_master,is_more", [(True, True), (False, False)])
+    def test_matches_scapy(self, adjacency, is_master, is_more):
+        """Test that the templated DBD is byte-identical to a Scapy build"""
+        neighbor = OSPFNeighbor("2.2.2.2", "10.0.0.2")
+        neighbor.is_master = is_master
+        neighbor.dd_sequence_number = 0x12345678
+        headers = adjacency.lsdb.get_lsa_headers()
+
+        packet = adjacency.build_dbd_packet(neighbor, "0.0.0.1", headers, is_more)
+
+        expected = OSPFHeader(
+            type=DATABASE_DESCRIPTION, router_id="1.1.1.1", area_id="0.0.0.1", auth_type=0
+        ) / OSPFDBDescription(
+            interface_mtu=1500, options=0x02,
+            flags=(0x02 if is_more else 0) | (0x01 if is_master else 0),
+            dd_sequence=0x12345678
+        ) / Raw(load=b"".join(bytes(h) for h in headers))
+        assert packet == bytes(expected)
+        assert validate_ospf_checksum(OSPFHeader(packet)) is True
+
+    @pytest.mark.parametrize("builder,flags", [
+        ("build_initial_dbd_packet", 0x07),
+        ("build_slave_ack_dbd_packet", 0x02),
+    ])
+    def test_empty_dbd_matches_scapy(self, adjacency, builder, flags):
+        """Test that the ExStart and slave-ack DBDs match a Scapy build"""
+        neighbor = OSPFNeighbor("2.2.2.2", "10.0.0.2")
+        neighbor.dd_sequence_number = 0x12345678
+
+        packet = getattr(adjacency, builder)(neighbor, "0.0.0.0")
+
+        expected = OSPFHeader(
+            type=DATABASE_DESCRIPTION, router_id="1.1.1.1", area_id="0.0.0.0", auth_type=0
+        ) / OSPFDBDescription(
+            interface_mtu=1500, options=0x02, flags=flags, dd_sequence=0x12345678
+        )
+        assert packet == bytes(expected)
+
+    def test_scratch_reuse_does_not_alias(self, adjacency):
+        """Test that earlier DBDs survive later builds"""
+        neighbor = OSPFNeighbor("2.2.2.2", "10.0.0.2")
+        neighbor.dd_sequence_number = 1
+        first = adjacency.build_dbd_packet(neighbor, "0.0.0.0", adjacency.lsdb.get_lsa_headers())
+        snapshot = bytes(first)
+
+        neighbor.dd_sequence_number = 2
+        adjacency.build_dbd_packet(neighbor, "0.0.0.0", [])
+
+        assert first == snapshot
+
+    def test_summary_list_carries_raw_headers(self, adjacency):
+        """Test that the DB summary list holds serialized headers for the DBD"""
+        neighbor = OSPFNeighbor("2.2.2.2", "10.0.0.2")
+        neighbor.dd_sequence_number = 1
+
+        headers, has_more = adjacency.get_lsa_headers_to_send(neighbor)
+
+        assert has_more is False
+        assert all(type(h) is bytes and len(h) == 20 for h in headers)
+        assert headers == [bytes(h) for h in adjacency.lsdb.get_lsa_headers()]
+        packet = adjacency.build_dbd_packet(neighbor, "0.0.0.0", headers)
+        assert packet == adjacency.build_dbd_packet(
+            neighbor, "0.0.0.0", adjacency.lsdb.get_lsa_headers())
@@ -0,0 +1,165 @@
+"""
+Unit tests for OSPF LSA flooding and retransmission
+"""
+
+import pytest
+from scapy.packet import Raw
+from ospf.flooding import LSAFloodingManager
+from ospf.lsdb import LinkStateDatabase
+from ospf.neighbor import OSPFNeighbor
+from ospf.packets import (
+    OSPFHeader, OSPFLSUpdate, OSPFLSRequest, LSRequest, validate_ospf_checksum
+)
+from ospf.constants import (
+    ROUTER_LSA, STATE_DOWN, STATE_FULL, STATE_EXCHANGE, LINK_STATE_UPDATE, LINK_STATE_REQUEST
+)
+
+
+@pytest.fixture
+def flooding():
+    """Flooding manager with one router LSA in its LSDB"""
+    lsdb = LinkStateDatabase("0.0.0.0")
+    lsdb.install_router_lsa("1.1.1.1", [])
+    return LSAFloodingManager("1.1.1.1", lsdb)
+
+
+def _full_neighbor(router_id: str) -> OSPFNeighbor:
+    neighbor = OSPFNeighbor(router_id, "10.0.0.2")
+    neighbor.fsm.state = STATE_FULL
+    return neighbor
+
+
+class TestRetransmissionHeap:
+    """Test deadline-driven LSA retransmission"""
+
+    def test_nothing_due_before_interval(self, flooding):
+        """Test that freshly sent LSAs are not retransmitted"""
+        neighbor = _full_neighbor("2.2.2.2")
+        lsa = flooding.lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+        flooding.add_lsa_to_retransmission_list(lsa, neighbor)
+
+        assert flooding.pop_due_retransmissions() == []
+        assert flooding.next_retransmit_time() is not None
+
+    def test_due_lsa_returned_and_rearmed(self, flooding):
+        """Test that a due LSA is returned once per interval"""
+        neighbor = _full_neighbor("2.2.2.2")
+        lsa = flooding.lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+        flooding.add_lsa_to_retransmission_list(lsa, neighbor)
+        due_at = flooding.next_retransmit_time()
+
+        assert flooding.pop_due_retransmissions(due_at) == [(neighbor, [lsa])]
+        assert flooding.pop_due_retransmissions(due_at) == []
+        assert flooding.next_retransmit_time() == due_at + flooding.retransmit_interval
+
+    def test_acked_lsa_not_retransmitted(self, flooding):
+        """Test that acknowledged LSAs are dropped from the heap lazily"""
+        neighbor = _full_neighbor("2.2.2.2")
+        lsa = flooding.lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+        flooding.add_lsa_to_retransmission_list(lsa, neighbor)
+        due_at = flooding.next_retransmit_time()
+        flooding.remove_from_retransmission_list(lsa.header, neighbor)
+
+        assert flooding.pop_due_retransmissions(due_at) == []
+        assert flooding.next_retransmit_time() is None
+
+    def test_non_full_neighbor_deferred(self, flooding):
+        """Test that LSAs for non-Full neighbors are deferred, not dropped"""
+        neighbor = _full_neighbor("2.2.2.2")
+        lsa = flooding.lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+        flooding.add_lsa_to_retransmission_list(lsa, neighbor)
+        due_at = flooding.next_retransmit_time()
+        neighbor.fsm.state = STATE_EXCHANGE
+
+        assert flooding.pop_due_retransmissions(due_at) == []
+        neighbor.fsm.state = STATE_FULL
+        later = flooding.next_retransmit_time()
+        assert flooding.pop_due_retransmissions(later) == [(neighbor, [lsa])]
+
+    def test_down_neighbor_forgotten(self, flooding):
+        """Test that a neighbor below Exchange loses its retransmission state"""
+        neighbor = _full_neighbor("2.2.2.2")
+        lsa = flooding.lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+        flooding.add_lsa_to_retransmission_list(lsa, neighbor)
+        due_at = flooding.next_retransmit_time()
+        neighbor.fsm.state = STATE_DOWN
+
+        assert flooding.pop_due_retransmissions(due_at) == []
+        assert flooding.next_retransmit_time() is None
+        assert neighbor.ls_retransmission_list == []
+        assert "2.2.2.2" not in flooding._rxmt_neighbors
+        assert "2.2.2.2" not in flooding.retransmit_timestamps
+
+
+class TestBuildLSUpdate:
+    """Test Link State Update serialization"""
+
+    def test_matches_scapy(self, flooding):
+        """Test that the LSU is byte-identical to a Scapy build"""
+        flooding.lsdb.install_external_lsa("1.1.1.1", "192.168.1.0", "255.255.255.0")
+        lsas = flooding.lsdb.get_all_lsas()
+
+        packet = flooding.build_ls_update(lsas, "0.0.0.0")
+
+        lsa_bytes = b"".join(bytes(lsa.header / lsa.body) for lsa in lsas)
+        expected = OSPFHeader(
+            type=LINK_STATE_UPDATE, router_id="1.1.1.1", area_id="0.0.0.0"
+        ) / OSPFLSUpdate(num_lsas=len(lsas)) / Raw(load=lsa_bytes)
+        assert packet == bytes(expected)
+        assert validate_ospf_checksum(OSPFHeader(packet)) is True
+
+    def test_scratch_reuse_does_not_alias(self, flooding):
+        """Test that earlier LSUs survive later builds"""
+        lsa = flooding.lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+        first = flooding.build_ls_update([lsa], "0.0.0.0")
+        snapshot = bytes(first)
+        flooding.build_ls_update([], "0.0.0.1")
+
+        assert first == snapshot
+
+
+class TestBuildLSRequest:
+    """Test Link State Request serialization"""
+
+    def test_matches_scapy(self, flooding):
+        """Test that the LSR is byte-identical to a Scapy build"""
+        flooding.lsdb.install_external_lsa("1.1.1.1", "192.168.1.0", "255.255.255.0")
+        neighbor = _full_neighbor("2.2.2.2")
+        neighbor.ls_request_list = flooding.lsdb.get_lsa_headers()
+
+        packet = flooding.build_ls_request(neighbor, "0.0.0.1")
+
+        expected = OSPFHeader(
+            type=LINK_STATE_REQUEST, router_id="1.1.1.1", area_id="0.0.0.1"
+        ) / OSPFLSRequest(requests=[
+            LSRequest(ls_type=h.ls_type, link_state_id=h.link_state_id,
+                      advertising_router=h.advertising_router)
+            for h in neighbor.ls_request_list
+        ])
+        assert packet == bytes(expected)
+        assert validate_ospf_checksum(OSPFHeader(packet)) is True
+
+    def test_nothing_to_request(self, flooding):
+        """Test that an empty request list builds no packet"""
+        assert flooding.build_ls_request(_full_neighbor("2.2.2.2"), "0.0.0.0") is None
+
+
+class TestFloodLSAs:
+    """Test flooding several LSAs in one LSU"""
+
+    def test_one_lsu_shared_by_neighbors(self, flooding):
+        """Test that all LSAs go in one LSU shared by every Full neighbor"""
+        flooding.lsdb.install_external_lsa("1.1.1.1", "192.168.1.0", "255.255.255.0")
+        lsas = flooding.lsdb.get_all_lsas()
+        sender = _full_neighbor("2.2.2.2")
+        first, second = _full_neighbor("3.3.3.3"), _full_neighbor("4.4.4.4")
+
+        lsu_packets = flooding.flood_lsas_to_neighbors(
+            lsas, [sender, first, second], "0.0.0.0", exclude_neighbor=sender
+        )
+
+        assert [target for target, _ in lsu_packets] == [first, second]
+        assert lsu_packets[0][1] is lsu_packets[1][1]
+        assert OSPFHeader(lsu_packets[0][1])[OSPFLSUpdate].num_lsas == len(lsas)
+        due = flooding.pop_due_retransmissions(flooding.next_retransmit_time() + 1)
+        assert sorted((n.router_id, len(l)) for n, l in due) == [("3.3.3.3", 2), ("4.4.4.4", 2)]
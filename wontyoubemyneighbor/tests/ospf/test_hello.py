@@ -0,0 +1,67 @@
+"""
+Unit tests for the OSPF Hello handler
+"""
+
+import pytest
+from ospf.hello import HelloHandler
+from ospf.packets import OSPFHeader, OSPFHello, validate_ospf_checksum
+from ospf.constants import HELLO_PACKET
+
+
+def _scapy_hello(handler: HelloHandler, neighbors: list) -> bytes:
+    """Serialize a Hello the straightforward way, via Scapy"""
+    header = OSPFHeader(
+        version=2,
+        type=HELLO_PACKET,
+        router_id=handler.router_id,
+        area_id=handler.area_id,
+        auth_type=0
+    )
+    hello = OSPFHello(
+        network_mask=handler.network_mask,
+        hello_interval=handler.hello_interval,
+        options=0x02,
+        router_priority=handler.priority,
+        router_dead_interval=handler.dead_interval,
+        designated_router=handler.designated_router,
+        backup_designated_router=handler.backup_designated_router,
+        neighbors=neighbors
+    )
+    return bytes(header / hello)
+
+
+class TestBuildHello:
+    """Test Hello packet construction from the cached template"""
+
+    @pytest.mark.parametrize("neighbors", [
+        [],
+        ["2.2.2.2"],
+        ["2.2.2.2", "3.3.3.3", "10.255.255.1"],
+    ])
+    def test_matches_scapy(self, neighbors):
+        """Test that the templated Hello is byte-identical to Scapy's"""
+        handler = HelloHandler("1.1.1.1", "0.0.0.0", "eth0")
+        assert handler.build_hello_packet(neighbors) == _scapy_hello(handler, neighbors)
+
+    def test_template_tracks_dr_change(self):
+        """Test that a DR/BDR change is reflected in later Hellos"""
+        handler = HelloHandler("1.1.1.1", "0.0.0.0", "eth0")
+        handler.build_hello_packet(["2.2.2.2"])
+
+        handler.designated_router = "10.0.0.1"
+        handler.backup_designated_router = "10.0.0.2"
+        packet = handler.build_hello_packet(["2.2.2.2"])
+
+        assert packet == _scapy_hello(handler, ["2.2.2.2"])
+        assert validate_ospf_checksum(OSPFHeader(packet)) is True
+        assert handler.stats['hello_sent'] == 2
+
+    def test_unchanged_hello_reused(self):
+        """Test that an unchanged Hello is reused and a new neighbor rebuilds it"""
+        handler = HelloHandler("1.1.1.1", "0.0.0.0", "eth0")
+        first = handler.build_hello_packet(["2.2.2.2"])
+
+        assert handler.build_hello_packet(["2.2.2.2"]) is first
+        assert handler.build_hello_packet(["2.2.2.2", "3.3.3.3"]) == \
+            _scapy_hello(handler, ["2.2.2.2", "3.3.3.3"])
+        assert handler.stats['hello_sent'] == 3
@@ -0,0 +1,170 @@
+"""
+Unit tests for the OSPF Link State Database
+"""
+
+import time
+from ospf.lsdb import LinkStateDatabase, RouterLSALink
+from ospf.constants import ROUTER_LSA, AS_EXTERNAL_LSA, MAX_AGE, LINK_TYPE_PTP, LINK_TYPE_STUB
+
+
+class TestAdvertisingRouterIndex:
+    """Test lookup of LSAs by advertising router"""
+
+    def test_get_lsas_by_adv_router(self):
+        """Test that only LSAs from the requested router are returned"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+        lsdb.install_external_lsa("1.1.1.1", "192.168.1.0", "255.255.255.0")
+        lsdb.install_router_lsa("2.2.2.2", [])
+
+        ours = lsdb.get_lsas_by_adv_router("1.1.1.1")
+        assert sorted(lsa.header.ls_type for lsa in ours) == [ROUTER_LSA, AS_EXTERNAL_LSA]
+        assert len(lsdb.get_lsas_by_adv_router("2.2.2.2")) == 1
+        assert lsdb.get_lsas_by_adv_router("3.3.3.3") == []
+
+    def test_index_tracks_replaced_lsa(self):
+        """Test that a newer instance replaces the indexed LSA"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+        lsdb.install_router_lsa("1.1.1.1", [])
+
+        ours = lsdb.get_lsas_by_adv_router("1.1.1.1")
+        assert len(ours) == 1
+        assert ours[0] is lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+
+    def test_index_drops_maxage_lsa(self, monkeypatch):
+        """Test that aged-out LSAs leave the index"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + MAX_AGE)
+
+        assert lsdb.age_lsas() == 1
+        assert lsdb.get_lsas_by_adv_router("1.1.1.1") == []
+
+
+class TestVersion:
+    """Test the LSDB change counter"""
+
+    def test_version_tracks_changes(self):
+        """Test that installs and removals bump the version, duplicates do not"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        start = lsdb.version
+        lsdb.install_router_lsa("1.1.1.1", [])
+        installed = lsdb.version
+        assert installed > start
+
+        header = lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1").header
+        assert lsdb.add_lsa(header) is False
+        assert lsdb.version == installed
+
+        lsdb.clear()
+        assert lsdb.version > installed
+
+    def test_topology_version_ignores_external_lsas(self):
+        """Test that only Router/Network LSA changes bump the topology version"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+        topology = lsdb.topology_version
+
+        lsdb.install_external_lsa("1.1.1.1", "192.0.2.0", "255.255.255.0")
+        assert lsdb.topology_version == topology
+
+        lsdb.install_router_lsa("1.1.1.1", [])
+        assert lsdb.topology_version > topology
+
+
+class TestLazyAging:
+    """Test LSA ages derived from install time and the MaxAge heap"""
+
+    def test_age_derived_from_elapsed_time(self, monkeypatch):
+        """Test that age advances with time and is capped at MaxAge"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+        lsa = lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+        now = time.time()
+
+        monkeypatch.setattr(time, "time", lambda: now + 30)
+        assert lsa.age == 30
+        assert lsdb.age_lsas() == 0
+
+        monkeypatch.setattr(time, "time", lambda: now + 2 * MAX_AGE)
+        assert lsa.age == MAX_AGE
+
+    def test_replaced_lsa_keeps_its_own_deadline(self, monkeypatch):
+        """Test that a refreshed LSA is not expired by its predecessor's entry"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+        now = time.time()
+
+        monkeypatch.setattr(time, "time", lambda: now + MAX_AGE - 10)
+        lsdb.install_router_lsa("1.1.1.1", [])
+        monkeypatch.setattr(time, "time", lambda: now + MAX_AGE)
+
+        assert lsdb.age_lsas() == 0
+        assert lsdb.get_size() == 1
+        assert lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1").age == 10
+
+    def test_reset_age_rearms_deadline(self, monkeypatch):
+        """Test that an LSA whose age was reset is re-queued, not removed"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+        now = time.time()
+
+        monkeypatch.setattr(time, "time", lambda: now + 100)
+        lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1").age = 0
+        monkeypatch.setattr(time, "time", lambda: now + MAX_AGE)
+        assert lsdb.age_lsas() == 0
+
+        monkeypatch.setattr(time, "time", lambda: now + MAX_AGE + 100)
+        assert lsdb.age_lsas() == 1
+
+    def test_premature_maxage_removed_at_once(self):
+        """Test that an LSA aged forward to MaxAge is removed on the next pass"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+
+        lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1").age = MAX_AGE
+
+        assert lsdb.age_lsas() == 1
+        assert lsdb.get_size() == 0
+
+
+class TestRouterLSALinks:
+    """Test Router LSA origination from link descriptions"""
+
+    def test_namedtuple_and_dict_links_match(self):
+        """Test that RouterLSALink and legacy dict links build the same LSA"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        links = [
+            RouterLSALink("2.2.2.2", "10.0.0.1", LINK_TYPE_PTP, 10),
+            RouterLSALink("1.1.1.1", "255.255.255.255"),
+        ]
+        header, body = lsdb.create_router_lsa("1.1.1.1", links, sequence_number=1)
+        _, dict_body = lsdb.create_router_lsa(
+            "1.1.1.1", [link._asdict() for link in links], sequence_number=1
+        )
+
+        assert bytes(body) == bytes(dict_body)
+        assert [(link.link_id, link.link_type, link.metric) for link in body.links] == [
+            ("2.2.2.2", LINK_TYPE_PTP, 10), ("1.1.1.1", LINK_TYPE_STUB, 1)
+        ]
+
+
+class TestLSAHeaders:
+    """Test the cached DBD header list"""
+
+    def test_headers_carry_current_age_and_length(self, monkeypatch):
+        """Test that cached headers keep the full LSA length and a fresh age"""
+        lsdb = LinkStateDatabase("0.0.0.0")
+        lsdb.install_router_lsa("1.1.1.1", [])
+        lsa = lsdb.get_lsa(ROUTER_LSA, "1.1.1.1", "1.1.1.1")
+        first = lsdb.get_lsa_headers()[0]
+        now = time.time()
+
+        monkeypatch.setattr(time, "time", lambda: now + 42)
+        header = lsdb.get_lsa_headers()[0]
+
+        assert header.ls_age == 42
+        assert header.length == first.length == len(bytes(lsa.header / lsa.body))
+        assert header.ls_sequence_number == lsa.header.ls_sequence_number
@@ -8,7 +8,8 @@ from ospf.packets import (
     OSPFHeader, OSPFHello, OSPFDBDescription, OSPFLSRequest,
     OSPFLSUpdate, OSPFLSAck, LSAHeader, RouterLSA, NetworkLSA,
     RouterLink, parse_ospf_packet, build_hello_packet, build_router_lsa,
-    validate_ospf_checksum, validate_lsa_checksum
+    validate_ospf_checksum, validate_lsa_checksum, ipv4_to_int, parse_ospf_header,
+    parse_ospf_hello, fletcher_checksum, ospf_checksum
 )
 from ospf.constants import (
     OSPF_VERSION, HELLO_PACKET, DATABASE_DESCRIPTION,
@@ -393,6 +394,45 @@ class TestChecksums:
         parsed = LSAHeader(data)
         assert validate_lsa_checksum(parsed) is True
 
+    def test_fletcher_checksum_matches_reference(self):
+        """Test Fletcher checksum against a byte-at-a-time reference"""
+        def reference(data, offset=2):
+            c0 = c1 = 0
+            for byte in data[offset:]:
+                c0 += byte
+                c1 += c0
+            c0 %= 255
+            c1 %= 255
+            x = ((len(data) - offset - 15) * c0 - c1) % 255
+            if x <= 0:
+                x += 255
+            y = 510 - c0 - x
+            if y > 255:
+                y -= 255
+            return (x << 8) + y
+
+        for size in (20, 36, 61, 512):
+            data = bytes((i * 37 + 11) & 0xFF for i in range(size))
+            data = data[:16] + b'\x00\x00' + data[18:]
+            assert fletcher_checksum(data) == reference(data)
+
+    def test_ospf_checksum_matches_reference(self):
+        """Test OSPF checksum against a word-at-a-time reference"""
+        def reference(data):
+            words = data[:12] + data[14:16] + data[24:]
+            if len(words) % 2:
+                words += b'\x00'
+            s = sum(struct.unpack('!%dH' % (len(words) // 2), words))
+            while s >> 16:
+                s = (s >> 16) + (s & 0xffff)
+            return ~s & 0xffff
+
+        for size in (24, 25, 44, 61, 1500):
+            data = bytes((i * 37 + 11) & 0xFF for i in range(size))
+            assert ospf_checksum(data) == reference(data)
+            assert ospf_checksum(b'\x00' * size) == reference(b'\x00' * size)
+            assert ospf_checksum(b'\xff' * size) == reference(b'\xff' * size)
+
 
 class TestPacketParsing:
     """Test packet parsing utility"""
@@ -422,6 +462,24 @@ class TestPacketParsing:
         # Should return None for invalid data
         assert parsed is None
 
+    def test_parse_ospf_header(self):
+        """Test fast header decode from a memoryview"""
+        data = bytes(OSPFHeader(type=HELLO_PACKET, router_id="10.1.1.1",
+                                area_id="0.0.0.1") / OSPFHello())
+
+        header = parse_ospf_header(memoryview(data))
+
+        assert header.version == OSPF_VERSION
+        assert header.type == HELLO_PACKET
+        assert header.length == len(data)
+        assert header.router_id == ipv4_to_int("10.1.1.1") == 0x0A010101
+        assert header.router_id_str == "10.1.1.1"
+        assert header.area_id == 1
+
+    def test_parse_ospf_header_short(self):
+        """Test fast header decode rejects truncated data"""
+        assert parse_ospf_header(b"\x02\x01\x00") is None
+
 
 class TestPacketIntegration:
     """Integration tests for complete packet workflows"""
@@ -520,5 +578,33 @@ class TestPacketIntegration:
         assert router_lsa.links[0].link_type == LINK_TYPE_STUB
 
 
+class TestParseOSPFHello:
+    """Test struct-based Hello decoding"""
+
+    def test_matches_scapy(self):
+        """Test that decoded fields match Scapy's dissection"""
+        packet = bytes(OSPFHeader(type=HELLO_PACKET, router_id="10.1.1.1", area_id="0.0.0.1") /
+                       OSPFHello(network_mask="255.255.255.252", router_priority=5,
+                                 designated_router="10.0.0.1", neighbors=["2.2.2.2", "3.3.3.3"]))
+        expected = OSPFHeader(packet)
+
+        hello = parse_ospf_hello(packet + b"\x00" * 4)  # trailing bytes are ignored
+
+        assert hello.router_id == expected.router_id
+        assert hello.area_id == expected.area_id
+        for name in ("network_mask", "hello_interval", "options", "router_priority",
+                     "router_dead_interval", "designated_router", "backup_designated_router"):
+            assert getattr(hello, name) == getattr(expected[OSPFHello], name)
+        assert hello.neighbors == ("2.2.2.2", "3.3.3.3")
+
+    def test_rejects_non_hello(self):
+        """Test that other packet types and truncated Hellos are rejected"""
+        hello = bytes(OSPFHeader(type=HELLO_PACKET, router_id="10.1.1.1") / OSPFHello())
+        dbd = bytes(OSPFHeader(type=DATABASE_DESCRIPTION, router_id="10.1.1.1") / OSPFDBDescription())
+
+        assert parse_ospf_hello(dbd) is None
+        assert parse_ospf_hello(hello[:40]) is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
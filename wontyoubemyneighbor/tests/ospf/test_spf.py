@@ -0,0 +1,51 @@
+"""
+Unit tests for the OSPF SPF calculation
+"""
+
+import networkx as nx
+from ospf.lsdb import LinkStateDatabase, RouterLSALink
+from ospf.spf import SPFCalculator
+from ospf.constants import LINK_TYPE_PTP
+
+
+def _two_router_lsdb() -> LinkStateDatabase:
+    """LSDB with 1.1.1.1 <-> 2.2.2.2 over a point-to-point link"""
+    lsdb = LinkStateDatabase("0.0.0.0")
+    lsdb.install_router_lsa("1.1.1.1", [RouterLSALink("2.2.2.2", "10.0.0.1", LINK_TYPE_PTP, 10)])
+    lsdb.install_router_lsa("2.2.2.2", [RouterLSALink("1.1.1.1", "10.0.0.2", LINK_TYPE_PTP, 10)])
+    return lsdb
+
+
+class TestShortestPathTreeReuse:
+    """Test that Dijkstra only reruns when the topology changes"""
+
+    def test_external_change_reuses_tree(self, monkeypatch):
+        """Test that an External LSA change skips Dijkstra but adds the route"""
+        lsdb = _two_router_lsdb()
+        spf = SPFCalculator("1.1.1.1", lsdb)
+        spf.calculate()
+
+        calls = []
+        original = nx.single_source_dijkstra_path
+        monkeypatch.setattr(nx, "single_source_dijkstra_path",
+                            lambda *a, **kw: calls.append(a) or original(*a, **kw))
+
+        lsdb.install_external_lsa("2.2.2.2", "192.0.2.0", "255.255.255.0", metric=5)
+        routes = spf.calculate()
+
+        assert calls == []
+        assert routes["192.0.2.0/24"].cost == 15
+        assert routes["192.0.2.0/24"].next_hop == "2.2.2.2"
+        assert routes["2.2.2.2"].cost == 10
+
+    def test_router_change_reruns_dijkstra(self):
+        """Test that a Router LSA change recomputes intra-area costs"""
+        lsdb = _two_router_lsdb()
+        spf = SPFCalculator("1.1.1.1", lsdb)
+        spf.calculate()
+
+        lsdb.install_router_lsa("1.1.1.1", [RouterLSALink("2.2.2.2", "10.0.0.1", LINK_TYPE_PTP, 30)])
+        lsdb.install_router_lsa("2.2.2.2", [RouterLSALink("1.1.1.1", "10.0.0.2", LINK_TYPE_PTP, 30)])
+        routes = spf.calculate()
+
+        assert routes["2.2.2.2"].cost == 30
@@ -0,0 +1,88 @@
+"""
+Unit tests for command-line argument parsing and validation
+"""
+
+import pytest
+from wontyoubemyneighbor import _build_parser, DEFAULT_SOCK_BUFSIZE
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return _build_parser()
+
+
+class TestAccepted:
+    """Test that valid arguments are accepted and canonicalized"""
+
+    def test_defaults(self, parser):
+        """Test the defaults with no arguments"""
+        args = parser.parse_args([])
+        assert args.area == "0.0.0.0"
+        assert args.dead_interval == 40
+        assert args.ospf_sock_bufsize == DEFAULT_SOCK_BUFSIZE
+
+    @pytest.mark.parametrize("value,expected", [
+        ("0", "0.0.0.0"),
+        ("1", "0.0.0.1"),
+        ("256", "0.0.1.0"),
+        ("4294967295", "255.255.255.255"),
+        ("0.0.0.1", "0.0.0.1"),
+    ])
+    def test_area(self, parser, value, expected):
+        """Test that decimal area IDs become dotted-quad"""
+        assert parser.parse_args(["--area", value]).area == expected
+
+    @pytest.mark.parametrize("option,dest", [
+        ("--bgp-peer", "bgp_peers"),
+        ("--bgp-passive", "bgp_passive"),
+        ("--bgp-rr-client", "bgp_rr_clients"),
+    ])
+    def test_ipv6_canonicalized(self, parser, option, dest):
+        """Test that IPv6 peer addresses are stored in canonical form"""
+        args = parser.parse_args([option, "2001:DB8:0:0::1", option, "192.0.2.1"])
+        assert getattr(args, dest) == ["2001:db8::1", "192.0.2.1"]
+
+    def test_passive_matches_peer(self, parser):
+        """Test that differently written forms of one address compare equal"""
+        args = parser.parse_args(["--bgp-peer", "2001:db8::0:1",
+                                  "--bgp-passive", "2001:0DB8::1"])
+        assert args.bgp_passive[0] in args.bgp_peers
+
+    @pytest.mark.parametrize("value", ["1", "65536", "4294967295"])
+    def test_dead_interval(self, parser, value):
+        """Test that RouterDeadInterval accepts the full 32-bit range"""
+        assert parser.parse_args(["--dead-interval", value]).dead_interval == int(value)
+
+    @pytest.mark.parametrize("value", ["0", "1048576", str(0x7fffffff // 2)])
+    def test_bufsize(self, parser, value):
+        """Test socket buffer sizes, including 0 for the kernel default"""
+        assert parser.parse_args(["--ospf-sock-bufsize", value]).ospf_sock_bufsize == int(value)
+
+
+class TestRejected:
+    """Test that invalid arguments are rejected"""
+
+    @pytest.mark.parametrize("argv", [
+        ["--router-id", "01.2.3.4"],
+        ["--router-id", "1.2.3"],
+        ["--router-id", "256.0.0.1"],
+        ["--source-ip", "1.2.3.4 "],
+        ["--area", "4294967296"],
+        ["--area", "-1"],
+        ["--area", "0.0.0.01"],
+        ["--bgp-peer", "2001:db8::g"],
+        ["--bgp-passive", "2001:db8:::1"],
+        ["--bgp-rr-client", "010.0.0.1"],
+        ["--dead-interval", "0"],
+        ["--dead-interval", "4294967296"],
+        ["--dead-interval", "forty"],
+        ["--hello-interval", "65536"],
+        ["--ospf-sock-bufsize", "-1"],
+        ["--ospf-sock-bufsize", str(0x7fffffff // 2 + 1)],
+    ])
+    def test_invalid(self, parser, argv, capsys):
+        """Test that argparse exits with a usage error"""
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args(argv)
+        assert exc_info.value.code == 2
+        assert f"error: argument {argv[0]}:" in capsys.readouterr().err
@@ -0,0 +1,129 @@
+"""
+Unit tests for batched kernel route installation
+"""
+
+import asyncio
+import subprocess
+import threading
+import pytest
+from lib.kernel_routes import KernelRouteManager
+
+
+class _FakeRun:
+    """Record "ip -batch" invocations and fail the given input lines"""
+
+    def __init__(self, failed_lines=()):
+        self.failed_lines = failed_lines
+        self.calls = []
+
+    def __call__(self, cmd, input=None, **kwargs):
+        self.calls.append((cmd, input.splitlines()))
+        stderr = "".join(f"Error\nCommand failed -:{line}\n" for line in self.failed_lines)
+        return subprocess.CompletedProcess(cmd, 1 if stderr else 0, "", stderr)
+
+
+@pytest.fixture
+def manager():
+    return KernelRouteManager()
+
+
+class TestInstallRoutes:
+    """Test install_routes diffing and batching"""
+
+    def test_single_batch(self, manager, monkeypatch):
+        """Test that all new routes go out in one ip -batch call"""
+        run = _FakeRun()
+        monkeypatch.setattr(subprocess, "run", run)
+
+        installed = manager.install_routes([
+            ("10.0.1.0/24", "10.0.0.2", 10),
+            ("2001:db8::/32", "::ffff:10.0.0.3", 20),
+        ], protocol="ospf")
+
+        assert installed == 2
+        assert len(run.calls) == 1
+        assert run.calls[0][1] == [
+            "route replace 10.0.1.0/24 via 10.0.0.2 metric 10",
+            "route replace 2001:db8::/32 via 10.0.0.3 metric 20",
+        ]
+        assert manager.installed_routes == {"10.0.1.0/24": "10.0.0.2", "2001:db8::/32": "10.0.0.3"}
+
+    def test_unchanged_routes_skipped(self, manager, monkeypatch):
+        """Test that only changed prefixes are sent to the kernel"""
+        run = _FakeRun()
+        monkeypatch.setattr(subprocess, "run", run)
+        manager.installed_routes = {"10.0.1.0/24": "10.0.0.2", "10.0.2.0/24": "10.0.0.2"}
+
+        assert manager.install_routes([("10.0.1.0/24", "10.0.0.2", 10)]) == 1
+        assert run.calls == []
+
+        assert manager.install_routes([("10.0.2.0/24", "10.0.0.3", 10)]) == 1
+        assert run.calls[0][1] == [
+            "route del 10.0.2.0/24",
+            "route replace 10.0.2.0/24 via 10.0.0.3 metric 10",
+        ]
+        assert manager.installed_routes["10.0.2.0/24"] == "10.0.0.3"
+
+    def test_failed_line_not_recorded(self, manager, monkeypatch):
+        """Test that a route rejected by the kernel is not marked installed"""
+        monkeypatch.setattr(subprocess, "run", _FakeRun(failed_lines=(2,)))
+
+        installed = manager.install_routes([
+            ("10.0.1.0/24", "10.0.0.2", 10),
+            ("10.0.2.0/24", "192.0.2.1", 10),
+        ])
+
+        assert installed == 1
+        assert manager.installed_routes == {"10.0.1.0/24": "10.0.0.2"}
+
+
+class TestInstallRoutesAsync:
+    """Test install_routes_async serialization"""
+
+    def test_concurrent_batches_serialized(self, manager, monkeypatch):
+        """Test that OSPF and BGP batches run one after the other"""
+        run = _FakeRun()
+        monkeypatch.setattr(subprocess, "run", run)
+
+        async def install_both():
+            return await asyncio.gather(
+                manager.install_routes_async([("10.0.1.0/24", "10.0.0.2", 10)], protocol="ospf"),
+                manager.install_routes_async([("10.0.1.0/24", "10.0.0.2", 10),
+                                              ("10.0.2.0/24", "10.0.0.3", 100)], protocol="bgp"),
+            )
+
+        assert asyncio.run(install_both()) == [1, 2]
+        # The second batch saw the first one's route as already installed
+        assert [lines for _, lines in run.calls] == [
+            ["route replace 10.0.1.0/24 via 10.0.0.2 metric 10"],
+            ["route replace 10.0.2.0/24 via 10.0.0.3 metric 100"],
+        ]
+
+    def test_removal_waits_for_batch(self, manager, monkeypatch):
+        """Test that remove_route() does not interleave with a batch in flight"""
+        started, release = threading.Event(), threading.Event()
+        commands = []
+
+        def run(cmd, input=None, **kwargs):
+            if input is not None:
+                started.set()
+                release.wait(5)
+            commands.append(cmd[-1])
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(subprocess, "run", run)
+
+        async def race():
+            batch = asyncio.create_task(
+                manager.install_routes_async([("10.0.1.0/24", "10.0.0.2", 10)]))
+            await asyncio.to_thread(started.wait, 5)
+            removal = asyncio.create_task(asyncio.to_thread(manager.remove_route, "10.0.1.0/24"))
+            await asyncio.sleep(0.05)
+            assert not removal.done()
+            release.set()
+            await asyncio.gather(batch, removal)
+
+        asyncio.run(race())
+
+        assert commands == ["-", "10.0.1.0/24"]
+        assert manager.installed_routes == {}
@@ -0,0 +1,64 @@
+"""
+Unit tests for batched datagram I/O
+"""
+
+import socket
+import pytest
+from lib.mmsg import SENDMMSG_AVAILABLE, RECVMMSG_AVAILABLE, MMsgReceiver, sendmmsg
+
+OSPF_PROTO = 89
+
+
+@pytest.fixture
+def raw_pair():
+    """Raw proto-89 sender and receiver on loopback (needs CAP_NET_RAW)"""
+    if not SENDMMSG_AVAILABLE:
+        pytest.skip("sendmmsg not available")
+    try:
+        tx = socket.socket(socket.AF_INET, socket.SOCK_RAW, OSPF_PROTO)
+        rx = socket.socket(socket.AF_INET, socket.SOCK_RAW, OSPF_PROTO)
+    except PermissionError:
+        pytest.skip("raw sockets need CAP_NET_RAW")
+    rx.bind(("127.0.0.1", 0))
+    rx.settimeout(1)
+    yield tx, rx
+    tx.close()
+    rx.close()
+
+
+class TestSendmmsg:
+    """Test sendmmsg() addressing and payload sharing"""
+
+    def test_zero_octet_destination(self, raw_pair):
+        """Test that a destination containing zero octets is not truncated"""
+        tx, rx = raw_pair
+        shared = b"\x02\x01shared"
+        dest = socket.inet_aton("127.0.0.1")
+
+        assert sendmmsg(tx.fileno(), [(shared, dest), (b"\x02\x02other", dest), (shared, dest)]) == 3
+
+        payloads = [rx.recvfrom(2048)[0][20:] for _ in range(3)]
+        assert payloads == [shared, b"\x02\x02other", shared]
+
+
+class TestMMsgReceiver:
+    """Test recvmmsg() draining"""
+
+    @pytest.mark.skipif(not RECVMMSG_AVAILABLE, reason="recvmmsg not available")
+    def test_truncated_datagrams_counted(self):
+        """Test that datagrams larger than a buffer are dropped and counted"""
+        rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            rx.bind(("127.0.0.1", 0))
+            tx.sendto(b"x" * 64, rx.getsockname())
+            tx.sendto(b"y" * 16, rx.getsockname())
+
+            ring = MMsgReceiver(count=4, size=32)
+            batch = ring.receive(rx.fileno())
+
+            assert [bytes(view[:n]) for view, n in batch] == [b"y" * 16]
+            assert ring.truncated == 1
+        finally:
+            rx.close()
+            tx.close()
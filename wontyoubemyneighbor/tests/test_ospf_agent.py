@@ -0,0 +1,194 @@
+"""
+Unit tests for OSPFAgent neighbor bookkeeping, timers and schedulers
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+import pytest
+import wontyoubemyneighbor as wybmn
+from ospf.constants import (
+    STATE_DOWN, STATE_INIT, STATE_FULL,
+    EVENT_NEGOTIATION_DONE
+)
+
+
+IFACE = "eth0"
+
+
+@pytest.fixture
+def make_agent(monkeypatch):
+    """Build agents on a fake interface (no sockets are opened)"""
+    monkeypatch.setattr(
+        wybmn, "get_interface_info",
+        lambda name, source_ip=None: SimpleNamespace(ip_address="10.0.0.1",
+                                                     netmask="255.255.255.0")
+    )
+
+    def make(**kwargs):
+        return wybmn.OSPFAgent("1.1.1.1", "0.0.0.0", IFACE,
+                               network_type="point-to-point", **kwargs)
+    return make
+
+
+@pytest.fixture
+def agent(make_agent):
+    return make_agent()
+
+
+def _neighbor(agent, router_id="2.2.2.2", ip="10.0.0.2"):
+    """Create a neighbor the way Hello discovery does"""
+    ctx = agent.interfaces_ctx[IFACE]
+    ctx.hello_handler.neighbors[router_id] = time.time()
+    return ctx, agent._create_neighbor(ctx, router_id, ip, 1)
+
+
+def _bring_full(neighbor):
+    """Drive a neighbor's FSM from Down to Full"""
+    neighbor.handle_hello_received(False)
+    neighbor.handle_hello_received(True)
+    neighbor.fsm.trigger(EVENT_NEGOTIATION_DONE)
+    neighbor.exchange_done()
+    assert neighbor.get_state() == STATE_FULL
+
+
+class TestNeighborState:
+    """Test the per-interface indexes kept by _on_neighbor_state_change"""
+
+    def test_buckets_follow_fsm(self, agent):
+        """Test that neighbors_by_state and active_neighbor_ids track the FSM"""
+        ctx, neighbor = _neighbor(agent)
+        assert ctx.neighbors_in_state(STATE_DOWN) == [neighbor]
+        assert "2.2.2.2" not in ctx.active_neighbor_ids
+
+        neighbor.handle_hello_received(False)
+
+        assert ctx.neighbors_in_state(STATE_INIT) == [neighbor]
+        assert ctx.neighbors_in_state(STATE_DOWN) == []
+        assert "2.2.2.2" in ctx.active_neighbor_ids
+
+    def test_full_adds_router_lsa_link(self, agent):
+        """Test that a Full transition adds a P2P link and dirties the Router LSA"""
+        assert agent._generate_router_lsa() is True
+        assert agent._generate_router_lsa() is False
+
+        ctx, neighbor = _neighbor(agent)
+        _bring_full(neighbor)
+
+        link = agent._router_lsa_links[(IFACE, "2.2.2.2")]
+        assert (link.link_id, link.link_data) == ("2.2.2.2", "10.0.0.1")
+        assert agent._router_lsa_dirty is True
+        assert agent._generate_router_lsa() is True
+        assert agent._generate_router_lsa() is False
+
+    def test_kill_forgets_retransmissions(self, agent):
+        """Test that dropping below Exchange clears retransmission state"""
+        ctx, neighbor = _neighbor(agent)
+        _bring_full(neighbor)
+        agent._generate_router_lsa()
+        lsa = agent.lsdb.get_lsas_by_adv_router("1.1.1.1")[0]
+        agent.flooding_mgr.add_lsa_to_retransmission_list(lsa, neighbor)
+        agent.flooding_mgr.schedule_retransmit(neighbor, lsa, time.time())
+
+        neighbor.kill()
+
+        assert neighbor.ls_retransmission_list == []
+        assert agent.flooding_mgr.pop_due_retransmissions() == []
+        assert (IFACE, "2.2.2.2") not in agent._router_lsa_links
+
+
+class TestDeadTimer:
+    """Test the per-neighbor inactivity timer"""
+
+    def test_hello_rearms_timer(self, agent):
+        """Test that a neighbor still sending Hellos is re-armed, not killed"""
+        ctx, neighbor = _neighbor(agent)
+        neighbor.handle_hello_received(False)
+
+        async def fire():
+            agent._dead_timer_expired(ctx, neighbor)
+            rearmed = neighbor.dead_timer
+            rearmed.cancel()
+            return rearmed
+
+        assert asyncio.run(fire()) is not None
+        assert neighbor.get_state() == STATE_INIT
+        assert "2.2.2.2" in ctx.hello_handler.neighbors
+        assert not agent._flood_event.is_set()
+        assert not agent._spf_event.is_set()
+
+    def test_silent_neighbor_killed(self, agent):
+        """Test that a silent neighbor is killed and its link withdrawn"""
+        ctx, neighbor = _neighbor(agent)
+        _bring_full(neighbor)
+        agent._generate_router_lsa()
+        agent._spf_event.clear()
+        neighbor.last_hello = time.time() - ctx.dead_interval - 1
+
+        agent._dead_timer_expired(ctx, neighbor)
+
+        assert neighbor.get_state() == STATE_DOWN
+        assert neighbor.dead_timer is None
+        assert "2.2.2.2" not in ctx.hello_handler.neighbors
+        assert "2.2.2.2" not in ctx.active_neighbor_ids
+        assert (IFACE, "2.2.2.2") not in agent._router_lsa_links
+        assert agent._router_lsa_dirty is True
+        assert agent._flood_event.is_set()
+        assert agent._spf_event.is_set()
+
+    def test_replaced_neighbor_ignored(self, agent):
+        """Test that a timer for a replaced neighbor instance does nothing"""
+        ctx, stale = _neighbor(agent)
+        stale.handle_hello_received(False)
+        _neighbor(agent)
+        stale.last_hello = 0
+
+        agent._dead_timer_expired(ctx, stale)
+
+        assert stale.get_state() == STATE_INIT
+        assert not agent._spf_event.is_set()
+
+
+class TestTxQueue:
+    """Test the bounded unicast TX queue"""
+
+    def test_overflow_counts_drops(self, make_agent, monkeypatch):
+        """Test that packets beyond TX_QUEUE_MAX are dropped and counted"""
+        monkeypatch.setattr(wybmn, "TX_QUEUE_MAX", 2)
+        agent = make_agent()
+        ctx, neighbor = _neighbor(agent)
+
+        for _ in range(5):
+            agent._send_to_neighbor(b"packet", neighbor, IFACE)
+
+        assert agent._tx_queue.qsize() == 2
+        assert agent.tx_dropped == 3
+
+
+class TestSPFLoop:
+    """Test SPF scheduling"""
+
+    def test_burst_runs_spf_once(self, agent, monkeypatch):
+        """Test that a burst of SPF requests collapses into one run"""
+        monkeypatch.setattr(wybmn, "SPF_DELAY", 0.01)
+        monkeypatch.setattr(wybmn, "SPF_HOLD", 0.01)
+        runs = []
+
+        async def run_spf():
+            runs.append(time.time())
+        agent._run_spf = run_spf
+
+        async def burst():
+            agent.running = True
+            loop = asyncio.create_task(agent._spf_loop())
+            for _ in range(5):
+                agent._schedule_spf()
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.1)
+            agent.running = False
+            loop.cancel()
+
+        asyncio.run(burst())
+
+        assert len(runs) == 1
+        assert not agent._spf_event.is_set()
@@ -0,0 +1,20 @@
+"""
+Unit tests for OSPF socket option handling
+"""
+
+import socket
+from lib.socket_handler import OSPFSocket
+
+
+def test_buffer_sizes_applied():
+    """Test that send/receive buffers are set (Linux reports double)"""
+    # Small enough to stay under wmem_max/rmem_max without CAP_NET_ADMIN
+    handler = OSPFSocket("lo", "127.0.0.1", bufsize=64 * 1024)
+    handler.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        handler._set_buffer_sizes(handler.bufsize)
+
+        assert handler.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) == 2 * handler.bufsize
+        assert handler.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) == 2 * handler.bufsize
+    finally:
+        handler.sock.close()
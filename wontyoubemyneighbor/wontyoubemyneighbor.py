@@ -39,30 +39,38 @@ Usage - OSPFv2, OSPFv3, and BGP together:
 
 import asyncio
 import argparse
+import heapq
 import logging
+import logging.handlers
 import os
+import queue
 import signal
+import socket
+import struct
 import sys
 import subprocess
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 
 # OSPF imports
 from ospf.hello import HelloHandler
 from ospf.neighbor import OSPFNeighbor
-from ospf.lsdb import LinkStateDatabase
+from ospf.lsdb import LinkStateDatabase, LSA, RouterLSALink
 from ospf.spf import SPFCalculator
 from ospf.adjacency import AdjacencyManager
 from ospf.flooding import LSAFloodingManager
-from ospf.packets import OSPFHeader, parse_ospf_packet
+from ospf.packets import OSPFHeader, parse_ospf_header, ipv4_to_int
 from ospf.constants import (
     HELLO_PACKET, DATABASE_DESCRIPTION, LINK_STATE_REQUEST,
     LINK_STATE_UPDATE, LINK_STATE_ACK, STATE_NAMES,
     STATE_DOWN, STATE_INIT, STATE_2WAY,
-    STATE_EXSTART, STATE_EXCHANGE, STATE_LOADING, STATE_FULL, LINK_TYPE_STUB,
-    NETWORK_TYPE_POINT_TO_MULTIPOINT, DEFAULT_NETWORK_TYPE
+    STATE_EXSTART, STATE_EXCHANGE, STATE_LOADING, STATE_FULL, LINK_TYPE_STUB, LINK_TYPE_PTP,
+    NETWORK_TYPE_POINT_TO_MULTIPOINT, DEFAULT_NETWORK_TYPE, SPF_DELAY, SPF_HOLD,
+    FLOOD_DELAY, TX_BATCH_MAX, TX_QUEUE_MAX
 )
-from lib.socket_handler import OSPFSocket
+from lib.socket_handler import OSPFSocket, DEFAULT_SOCK_BUFSIZE
 from lib.interface import get_interface_info
 from lib.kernel_routes import KernelRouteManager
 
@@ -559,8 +567,78 @@ class OSPFInterfaceContext:
     unicast_peer: Optional[str]
     socket: 'OSPFSocket'
     hello_handler: 'HelloHandler'
+    source_ip_i: int = 0
     neighbors: Dict[str, 'OSPFNeighbor'] = field(default_factory=dict)
+    # Router IDs of neighbors in Init or higher (listed in our Hellos)
+    active_neighbor_ids: Set[str] = field(default_factory=set)
     enabled: bool = True
+    # Bumped whenever a neighbor is added/removed; neighbor_snapshot() is
+    # rebuilt only when it changes
+    _neighbors_version: int = field(default=0, repr=False)
+    _snapshot_version: int = field(default=-1, repr=False)
+    _snapshot: Tuple['OSPFNeighbor', ...] = field(default=(), repr=False)
+    # Router IDs bucketed by neighbor FSM state, kept current by state callbacks
+    neighbors_by_state: Dict[int, Set[str]] = field(default_factory=lambda: defaultdict(set), repr=False)
+
+    def add_neighbor(self, neighbor_id: str, neighbor: 'OSPFNeighbor'):
+        """
+        Add (or replace) a neighbor on this interface
+
+        Args:
+            neighbor_id: Neighbor router ID
+            neighbor: Neighbor instance
+        """
+        replaced = self.neighbors.get(neighbor_id)
+        if replaced is not None:
+            self.neighbors_by_state[replaced.get_state()].discard(neighbor_id)
+        self.neighbors[neighbor_id] = neighbor
+        self.neighbors_by_state[neighbor.get_state()].add(neighbor_id)
+        self._neighbors_version += 1
+
+    def remove_neighbor(self, neighbor_id: str) -> Optional['OSPFNeighbor']:
+        """
+        Remove a neighbor from this interface
+
+        Args:
+            neighbor_id: Neighbor router ID
+
+        Returns:
+            The removed neighbor, or None if it was not known
+        """
+        neighbor = self.neighbors.pop(neighbor_id, None)
+        if neighbor is not None:
+            self.neighbors_by_state[neighbor.get_state()].discard(neighbor_id)
+            self._neighbors_version += 1
+        return neighbor
+
+    def neighbors_in_state(self, state: int) -> List['OSPFNeighbor']:
+        """
+        Get the neighbors currently in a given FSM state
+
+        Args:
+            state: Neighbor state (e.g. STATE_FULL)
+
+        Returns:
+            List of neighbors in that state
+        """
+        neighbors = self.neighbors
+        return [neighbors[nid] for nid in self.neighbors_by_state.get(state, ())]
+
+    def neighbor_snapshot(self) -> Tuple['OSPFNeighbor', ...]:
+        """
+        Get an immutable snapshot of this interface's neighbors
+
+        The tuple is cached and only rebuilt after add_neighbor() or
+        remove_neighbor(), so periodic loops can iterate it without copying
+        the neighbor dict every tick.
+
+        Returns:
+            Tuple of neighbors
+        """
+        if self._snapshot_version != self._neighbors_version:
+            self._snapshot = tuple(self.neighbors.values())
+            self._snapshot_version = self._neighbors_version
+        return self._snapshot
 
 
 class OSPFAgent:
@@ -577,7 +655,9 @@ class OSPFAgent:
                  kernel_route_manager: Optional[KernelRouteManager] = None,
                  interfaces: Optional[List[str]] = None,
                  interface_unicast_peers: Optional[Dict[str, str]] = None,
-                 interface_ips: Optional[Dict[str, str]] = None):
+                 interface_ips: Optional[Dict[str, str]] = None,
+                 router_id_int: Optional[int] = None,
+                 sock_bufsize: int = DEFAULT_SOCK_BUFSIZE):
         """
         Initialize OSPF agent (now supports multiple interfaces!)
 
@@ -592,10 +672,14 @@ class OSPFAgent:
             unicast_peer: Optional unicast peer IP for point-to-point (bypasses multicast)
             kernel_route_manager: Optional kernel route manager for installing routes
             interfaces: Optional list of interface names for multi-interface OSPF
+            router_id_int: Optional router ID already packed as an integer
+            sock_bufsize: OSPF socket send/receive buffer size in bytes (0 = kernel default)
         """
         self.router_id = router_id
+        self._router_id_i = router_id_int if router_id_int is not None else ipv4_to_int(router_id)
         self.area_id = area_id
         self.kernel_route_manager = kernel_route_manager
+        self.sock_bufsize = sock_bufsize
 
         # GLOBAL COMPONENTS (shared across all interfaces)
         self.lsdb = LinkStateDatabase(area_id)
@@ -661,8 +745,51 @@ class OSPFAgent:
             self.unicast_peer = unicast_peer
             self.interface_info = get_interface_info(interface, source_ip)
 
+        # Non-Hello packet dispatch: type -> (handler, short name for logging)
+        self._packet_handlers = {
+            DATABASE_DESCRIPTION: (self._process_dbd, "DBD"),
+            LINK_STATE_REQUEST: (self._process_lsr, "LSR"),
+            LINK_STATE_UPDATE: (self._process_lsu, "LSU"),
+            LINK_STATE_ACK: (self._process_lsack, "LSAck"),
+        }
+
+        # QoS manager for DSCP ingress trust (resolved in start())
+        self._qos_mgr = None
+
+        # Serialized LSUs for the LSU currently being flooded, keyed by LSA instance
+        self._lsu_cache: Dict[tuple, bytes] = {}
+
+        # Our own LSAs and their LSU, valid while the LSDB version is unchanged
+        self._our_lsas: List[LSA] = []
+        self._our_lsu: Optional[bytes] = None
+        self._our_lsas_version: Optional[int] = None
+
+        # Router LSA P2P links to Full neighbors, keyed by (interface, neighbor ID)
+        # and updated as neighbors enter/leave Full
+        self._router_lsa_links: Dict[Tuple[str, str], RouterLSALink] = {}
+        # Set when the links change; _generate_router_lsa() is a no-op otherwise
+        self._router_lsa_dirty = True
+
+        # SPF runs only from _spf_loop, so calculations never overlap
+        self._spf_event = asyncio.Event()  # Set by every topology change
+        self._spf_lsdb_version: Optional[int] = None  # LSDB version of the last SPF run
+        self._flood_event = asyncio.Event()  # Set when adjacencies reach Full
+
+        # Unicast packets (DBD, LSR, LSU, LSAck) waiting for _tx_loop, as
+        # (interface context, packet, packed neighbor address). Bounded so a
+        # stalled socket drops packets (retransmission recovers them) rather
+        # than growing without limit.
+        self._tx_queue: asyncio.Queue = asyncio.Queue(maxsize=TX_QUEUE_MAX)
+        self.tx_dropped = 0
+
+        # Periodic work heap driven by _tick_loop: (deadline, seq, interval, name, handler)
+        self._timers: List[tuple] = []
+
         # State
         self.running = False
+        # Set by the first stop(); start()'s own cleanup and the caller's
+        # shutdown path may both call it
+        self._stopped = False
 
         self.logger.info(f"Initialized OSPF Agent: {router_id} on {len(self.interfaces_ctx)} interface(s): {', '.join(self.interfaces_ctx.keys())}")
 
@@ -702,7 +829,7 @@ class OSPFAgent:
             neighbor_addr = ipaddress.IPv4Address(neighbor_ip)
             is_in_subnet = neighbor_addr in iface_network
             if not is_in_subnet:
-                self.logger.debug(f"Neighbor {neighbor_ip} NOT in {iface_network}")
+                self.logger.debug("Neighbor %s NOT in %s", neighbor_ip, iface_network)
             return is_in_subnet
         except Exception as e:
             self.logger.warning(f"Error checking subnet for {neighbor_ip}: {e}")
@@ -710,7 +837,10 @@ class OSPFAgent:
 
     def _send_to_neighbor(self, packet: bytes, neighbor: 'OSPFNeighbor', iface_name: str = None):
         """
-        Send packet to neighbor on the correct interface
+        Queue packet for the neighbor on the correct interface
+
+        The packet goes out from _tx_loop, batched with the other unicast
+        packets queued while the current receive batch was processed.
 
         Args:
             packet: OSPF packet to send
@@ -718,17 +848,68 @@ class OSPFAgent:
             iface_name: Optional interface name (for efficiency, avoids lookup)
         """
         # If interface name provided, use it directly
-        if iface_name and iface_name in self.interfaces_ctx:
-            ctx = self.interfaces_ctx[iface_name]
-            ctx.socket.send(packet, dest=neighbor.ip_address)
-            return
+        ctx = self.interfaces_ctx.get(iface_name) if iface_name else None
 
         # Otherwise, find which interface this neighbor is on
-        for iface_name, ctx in self.interfaces_ctx.items():
-            if neighbor.router_id in ctx.neighbors:
-                ctx.socket.send(packet, dest=neighbor.ip_address)
+        if ctx is None:
+            for ctx in self.interfaces_ctx.values():
+                if neighbor.router_id in ctx.neighbors:
+                    break
+            else:
+                self.logger.error(f"Could not find interface for neighbor {neighbor.router_id}")
                 return
-        self.logger.error(f"Could not find interface for neighbor {neighbor.router_id}")
+
+        try:
+            self._tx_queue.put_nowait((ctx, packet, neighbor.ip_packed))
+        except asyncio.QueueFull:
+            self.tx_dropped += 1
+            if self.tx_dropped % 256 == 1:
+                self.logger.warning("TX queue full, dropped packet to %s (%d dropped so far)",
+                                    neighbor.router_id, self.tx_dropped)
+
+    async def _tx_loop(self):
+        """
+        Send queued unicast packets
+
+        Blocks for the first packet, then drains whatever else is queued
+        (up to TX_BATCH_MAX) and sends it with one sendmmsg() per
+        interface socket.
+        """
+        queue = self._tx_queue
+        while self.running:
+            batch = [await queue.get()]
+            while len(batch) < TX_BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                self._send_tx_batch(batch)
+            except Exception as e:
+                self.logger.error("TX batch of %d packets failed: %s", len(batch), e,
+                                  exc_info=True)
+
+    def _send_tx_batch(self, batch: List[Tuple[OSPFInterfaceContext, bytes, bytes]]):
+        """
+        Send a batch of queued unicast packets, grouped by interface
+
+        Args:
+            batch: List of (interface context, packet, packed address)
+        """
+        by_ctx = defaultdict(list)
+        for ctx, packet, dest in batch:
+            by_ctx[ctx.interface_name].append((packet, dest))
+        for iface_name, messages in by_ctx.items():
+            sent = self.interfaces_ctx[iface_name].socket.send_many(messages)
+            self.logger.debug("[%s] Sent %d/%d queued unicast packets",
+                              iface_name, sent, len(messages))
+
+    def _flush_tx_queue(self):
+        """
+        Send everything still queued (on shutdown, before closing sockets)
+        """
+        batch = []
+        while not self._tx_queue.empty():
+            batch.append(self._tx_queue.get_nowait())
+        if batch:
+            self._send_tx_batch(batch)
 
     def _add_interface_context(self, iface_name: str, hello_interval: int, dead_interval: int,
                                 network_type: str, source_ip: Optional[str], unicast_peer: Optional[str]):
@@ -763,7 +944,7 @@ class OSPFAgent:
             self.logger.info(f"  Interface {iface_name} detected as tunnel, using point-to-point network type")
 
         # Create per-interface components (use physical_if_name for socket binding)
-        socket = OSPFSocket(physical_if_name, interface_info.ip_address)
+        socket = OSPFSocket(physical_if_name, interface_info.ip_address, self.sock_bufsize)
         hello_handler = HelloHandler(
             self.router_id, self.area_id, iface_name, interface_info.netmask,
             hello_interval, dead_interval, network_type=effective_network_type
@@ -789,7 +970,8 @@ class OSPFAgent:
             network_type=effective_network_type,
             unicast_peer=unicast_peer,
             socket=socket,
-            hello_handler=hello_handler
+            hello_handler=hello_handler,
+            source_ip_i=ipv4_to_int(interface_info.ip_address)
         )
 
         self.interfaces_ctx[iface_name] = ctx
@@ -836,30 +1018,56 @@ class OSPFAgent:
         # Generate our own Router LSA (includes all interfaces)
         self._generate_router_lsa()
 
+        # Resolve the QoS manager now rather than importing it on the first packet
+        self._qos_mgr = self._load_qos_manager()
+
         # Start running
         self.running = True
 
         # Start async tasks
         try:
             await asyncio.gather(
-                self._hello_loop(),
-                self._receive_loop(),
-                self._aging_loop(),
+                self._tick_loop(),
                 self._spf_loop(),
-                self._monitor_neighbors(),
-                self._retransmission_loop()
+                self._flood_loop(),
+                self._tx_loop(),
+                self._receive_loop()
             )
         except KeyboardInterrupt:
             self.logger.info("Received interrupt signal")
         finally:
             await self.stop()
 
+    def _load_qos_manager(self):
+        """
+        Look up the QoS manager used for DSCP ingress trust
+
+        Returns:
+            QoS manager, or None if the QoS module is not available
+        """
+        try:
+            from agentic.protocols.qos import get_qos_manager
+            return get_qos_manager(os.environ.get("ASI_AGENT_ID", "local"))
+        except ImportError:
+            return None  # QoS module not available
+        except Exception as e:
+            self.logger.debug("[QoS] QoS manager unavailable: %s", e)
+            return None
+
     async def stop(self):
         """
         Stop OSPF agent gracefully on all interfaces
+
+        Only the first call does anything; later calls return at once.
         """
+        if self._stopped:
+            return
+        self._stopped = True
+
         self.logger.info("Stopping OSPF Agent...")
         self.running = False
+        self._cancel_dead_timers()
+        self._flush_tx_queue()
 
         # Close all sockets
         for iface_name, ctx in self.interfaces_ctx.items():
@@ -868,258 +1076,394 @@ class OSPFAgent:
 
         self.logger.info("OSPF Agent stopped")
 
-    async def _hello_loop(self):
+    async def _tick_loop(self):
         """
-        Send Hello packets periodically on ALL interfaces
+        Run all periodic OSPF work from a single timer heap
+
+        Each entry is (deadline, seq, interval, name, handler). The loop
+        sleeps until the earliest deadline, runs every due handler and
+        re-arms it, so periodic work shares one wakeup instead of one
+        sleeping coroutine per job.
         """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        min_hello = min((ctx.hello_interval for ctx in self.interfaces_ctx.values()), default=10)
+
+        # (first run delay, interval, name, handler)
+        jobs = [
+            (0, min_hello, "Hello", self._hello_tick),
+            (1, 1, "Aging", self._aging_tick),
+            (1, 1, "Retransmission", self._retransmission_tick),
+        ]
+        self._timers.clear()
+        for seq, (delay, interval, name, handler) in enumerate(jobs):
+            heapq.heappush(self._timers, (now + delay, seq, interval, name, handler))
+
         while self.running:
+            deadline = self._timers[0][0]
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            _, seq, interval, name, handler = heapq.heappop(self._timers)
             try:
-                # Send hello on each interface
-                for iface_name, ctx in self.interfaces_ctx.items():
-                    if not ctx.enabled:
-                        continue
+                await handler()
+            except Exception as e:
+                self.logger.error(f"{name} loop error: {e}")
 
-                    # Get active neighbors on THIS interface
-                    active_neighbor_ids = [
-                        nid for nid, n in ctx.neighbors.items()
-                        if n.get_state() >= STATE_INIT
-                    ]
+            # Re-arm relative to now so a slow handler cannot cause a burst of catch-up runs
+            heapq.heappush(self._timers, (max(deadline + interval, loop.time()), seq, interval, name, handler))
 
-                    self.logger.debug(f"[{iface_name}] Active neighbors: {active_neighbor_ids}")
+    async def _hello_tick(self):
+        """
+        Send Hello packets on ALL interfaces
+        """
+        for iface_name, ctx in self.interfaces_ctx.items():
+            if not ctx.enabled:
+                continue
 
-                    # Build and send Hello with proper neighbor list
-                    hello_pkt = ctx.hello_handler.build_hello_packet(
-                        active_neighbors=active_neighbor_ids
-                    )
+            # Get active neighbors on THIS interface (maintained on FSM transitions)
+            active_neighbor_ids = list(ctx.active_neighbor_ids)
 
-                    # Send to unicast peer if specified, otherwise multicast
-                    if ctx.unicast_peer:
-                        ctx.socket.send(hello_pkt, dest=ctx.unicast_peer)
-                        self.logger.info(f"[{iface_name}] Sent Hello to {ctx.unicast_peer} with {len(active_neighbor_ids)} neighbors: {active_neighbor_ids}")
-                    else:
-                        ctx.socket.send(hello_pkt)
-                        self.logger.info(f"[{iface_name}] Sent Hello with {len(active_neighbor_ids)} neighbors: {active_neighbor_ids}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("[%s] Active neighbors: %s", iface_name, active_neighbor_ids)
 
-                # Wait for next interval (use shortest interval if different per interface)
-                min_interval = min(ctx.hello_interval for ctx in self.interfaces_ctx.values())
-                await asyncio.sleep(min_interval)
+            # Build and send Hello with proper neighbor list
+            hello_pkt = ctx.hello_handler.build_hello_packet(
+                active_neighbors=active_neighbor_ids
+            )
 
-            except Exception as e:
-                self.logger.error(f"Hello loop error: {e}")
-                await asyncio.sleep(1)
+            # Send to unicast peer if specified, otherwise multicast
+            if ctx.unicast_peer:
+                ctx.socket.send(hello_pkt, dest=ctx.unicast_peer)
+                self.logger.info("[%s] Sent Hello to %s with %d neighbors: %s", iface_name,
+                                 ctx.unicast_peer, len(active_neighbor_ids), active_neighbor_ids)
+            else:
+                ctx.socket.send(hello_pkt)
+                self.logger.info("[%s] Sent Hello with %d neighbors: %s", iface_name,
+                                 len(active_neighbor_ids), active_neighbor_ids)
 
     async def _receive_loop(self):
         """
         Receive and process OSPF packets from ALL interfaces
         """
+        receivers = [
+            self._receive_interface_loop(iface_name, ctx)
+            for iface_name, ctx in self.interfaces_ctx.items()
+            if ctx.enabled
+        ]
+        if receivers:
+            await asyncio.gather(*receivers)
+
+    async def _receive_interface_loop(self, iface_name: str, ctx: OSPFInterfaceContext):
+        """
+        Receive and process OSPF packets from one interface
+
+        Awaits socket readability, so no interface is polled with a timeout
+        and idle interfaces do not delay the other loops. Each wakeup drains
+        all queued datagrams with a single recvmmsg() where available.
+
+        Args:
+            iface_name: Interface name
+            ctx: Interface context
+        """
         while self.running:
             try:
-                # Poll all interface sockets
-                for iface_name, ctx in self.interfaces_ctx.items():
-                    if not ctx.enabled:
-                        continue
-
-                    # Receive packet with DSCP value for QoS ingress trust
-                    result = ctx.socket.receive_with_dscp(timeout=0.1)
-                    if not result:
-                        continue
+                # Drain up to RX_BATCH_SIZE queued packets (with DSCP for QoS
+                # ingress trust) before yielding back to the event loop
+                packets = await ctx.socket.receive_many_async()
 
-                    data, source_ip, dscp_value = result
+                # Resolve QoS trust once per batch rather than per packet
+                qos_mgr = self._qos_mgr
+                if qos_mgr is not None and not qos_mgr.enabled:
+                    qos_mgr = None
 
+                for data, source_ip, dscp_value, source_ip_i in packets:
                     # QoS Ingress Trust - respect DSCP marking from other agents
-                    try:
-                        from agentic.protocols.qos import get_qos_manager
-                        import os
-                        qos_agent_id = os.environ.get("ASI_AGENT_ID", "local")
-                        qos_mgr = get_qos_manager(qos_agent_id)
-                        if qos_mgr and qos_mgr.enabled and dscp_value > 0:
+                    if qos_mgr is not None and dscp_value > 0:
+                        try:
                             service_class, trusted = qos_mgr.trust_ingress(dscp_value, iface_name)
                             if trusted:
-                                self.logger.debug(f"[{iface_name}] [QoS] Ingress trust: DSCP={dscp_value} -> {service_class.value} from {source_ip}")
-                    except ImportError:
-                        pass  # QoS module not available
-                    except Exception as qos_err:
-                        self.logger.debug(f"[{iface_name}] [QoS] Ingress trust error: {qos_err}")
+                                self.logger.debug("[%s] [QoS] Ingress trust: DSCP=%d -> %s from %s",
+                                                  iface_name, dscp_value, service_class.value, source_ip)
+                        except Exception as qos_err:
+                            self.logger.debug("[%s] [QoS] Ingress trust error: %s", iface_name, qos_err)
 
                     # Process packet from this interface
-                    await self._process_packet(data, source_ip, iface_name)
+                    await self._process_packet(data, source_ip, iface_name, source_ip_i)
 
-                # Yield control to event loop after processing all interfaces
+                # A batch that was already queued is returned without
+                # suspending, so yield once per batch to keep a sustained
+                # burst from starving the timers and the other interfaces
                 await asyncio.sleep(0)
 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                self.logger.error(f"Receive loop error: {e}")
+                if not self.running or not ctx.socket.is_open():
+                    break
+                self.logger.error(f"[{iface_name}] Receive loop error: {e}")
                 await asyncio.sleep(0.1)
 
-    async def _process_packet(self, data: bytes, source_ip: str, iface_name: str):
+    async def _process_packet(self, data, source_ip: str, iface_name: str,
+                              source_ip_i: Optional[int] = None):
         """
         Process received OSPF packet
 
         Args:
-            data: Packet bytes
+            data: Packet bytes, or a memoryview into the socket receive buffer
             source_ip: Source IP address
             iface_name: Interface name packet was received on
+            source_ip_i: Source IP address as integer, if already known
         """
         try:
             ctx = self.interfaces_ctx.get(iface_name)
             if not ctx:
                 return
 
-            # Parse packet
-            packet = parse_ospf_packet(data)
-            if not packet:
+            # Decode the fixed header straight from the buffer
+            header = parse_ospf_header(data)
+            if not header:
                 return
 
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if source_ip_i is None:
+                source_ip_i = ipv4_to_int(source_ip)
+
             # Enhanced debugging for Router ID conflicts
-            self.logger.debug(f"[{iface_name}] Received packet: Type={packet.type}, "
-                            f"RouterID={packet.router_id}, "
-                            f"SourceIP={source_ip}, "
-                            f"OurRouterID={self.router_id}, "
-                            f"OurIP={ctx.source_ip}")
+            if debug:
+                self.logger.debug("[%s] Received packet: Type=%s, RouterID=%s, SourceIP=%s, "
+                                  "OurRouterID=%s, OurIP=%s", iface_name, header.type,
+                                  header.router_id_str, source_ip, self.router_id, ctx.source_ip)
 
             # Ignore packets from ourselves (safety check for multicast loopback)
-            if packet.router_id == self.router_id:
+            if header.router_id == self._router_id_i:
                 self.logger.warning(f"[{iface_name}] !!! Router ID CONFLICT: Received packet from {source_ip} "
-                                  f"with same Router ID as us ({packet.router_id})! "
-                                  f"Check if router at {source_ip} is configured with Router ID {packet.router_id}")
+                                  f"with same Router ID as us ({self.router_id})! "
+                                  f"Check if router at {source_ip} is configured with Router ID {self.router_id}")
                 return
 
             # Ignore packets from our own IP address on this interface
-            if source_ip == ctx.source_ip:
-                self.logger.debug(f"[{iface_name}] Ignoring packet from own IP ({source_ip})")
+            # (already dropped in the kernel when the socket filter attached)
+            if not ctx.socket.source_filtered and source_ip_i == ctx.source_ip_i:
+                if debug:
+                    self.logger.debug("[%s] Ignoring packet from own IP (%s)", iface_name, source_ip)
                 return
 
-            # Route by packet type
-            packet_type = packet.type
+            # Handlers parse the full packet with Scapy and may outlive the
+            # receive buffer, so copy it out only now that it is accepted
+            data = bytes(data)
 
+            # Route by packet type - Hellos go to the per-interface handler,
+            # everything else through the dispatch table
+            packet_type = header.type
             if packet_type == HELLO_PACKET:
                 ctx.hello_handler.process_hello(data, source_ip)
+                return
 
-            elif packet_type == DATABASE_DESCRIPTION:
-                self.logger.debug(f"[{iface_name}] Received DBD from {source_ip}")
-                await self._process_dbd(data, packet.router_id, iface_name)
-
-            elif packet_type == LINK_STATE_REQUEST:
-                self.logger.debug(f"[{iface_name}] Received LSR from {source_ip}")
-                await self._process_lsr(data, packet.router_id, iface_name)
-
-            elif packet_type == LINK_STATE_UPDATE:
-                self.logger.debug(f"[{iface_name}] Received LSU from {source_ip}")
-                await self._process_lsu(data, packet.router_id, iface_name)
-
-            elif packet_type == LINK_STATE_ACK:
-                self.logger.debug(f"[{iface_name}] Received LSAck from {source_ip}")
-                await self._process_lsack(data, packet.router_id, iface_name)
+            entry = self._packet_handlers.get(packet_type)
+            if entry:
+                handler, name = entry
+                if debug:
+                    self.logger.debug("[%s] Received %s from %s", iface_name, name, source_ip)
+                await handler(data, header.router_id_str, iface_name)
 
         except Exception as e:
             self.logger.error(f"[{iface_name}] Error processing packet from {source_ip}: {e}")
 
-    async def _aging_loop(self):
+    async def _aging_tick(self):
         """
-        Age LSAs and remove expired ones
+        Remove LSAs that reached MaxAge
+
+        LSA ages are derived lazily from their install time; the LSDB only
+        visits LSAs whose MaxAge deadline has passed, so an idle tick is a
+        single heap peek.
         """
-        while self.running:
-            try:
-                # Age LSAs
-                aged_count = self.lsdb.age_lsas()
+        aged_count = self.lsdb.age_lsas()
 
-                if aged_count > 0:
-                    self.logger.info(f"Aged out {aged_count} LSAs")
-                    # Run SPF after aging out LSAs
-                    await self._run_spf()
+        if aged_count > 0:
+            self.logger.info(f"Aged out {aged_count} LSAs")
+            # Run SPF after aging out LSAs
+            self._schedule_spf()
 
-                await asyncio.sleep(1)
+    def _arm_dead_timer(self, ctx: OSPFInterfaceContext, neighbor: OSPFNeighbor,
+                        delay: Optional[float] = None):
+        """
+        Start a neighbor's inactivity timer if it is not already running
 
-            except Exception as e:
-                self.logger.error(f"Aging loop error: {e}")
-                await asyncio.sleep(1)
+        Hellos only refresh neighbor.last_hello; the timer re-arms itself
+        for the remaining time when it fires early, so a steady neighbor
+        costs one timer wakeup per dead interval and no per-Hello work.
 
-    async def _spf_loop(self):
+        Args:
+            ctx: Interface the neighbor is on
+            neighbor: Neighbor to watch
+            delay: Seconds until the check (default: the dead interval)
         """
-        Periodically recalculate SPF
+        if neighbor.dead_timer is None:
+            neighbor.dead_timer = asyncio.get_running_loop().call_later(
+                ctx.dead_interval if delay is None else delay,
+                self._dead_timer_expired, ctx, neighbor
+            )
+
+    def _dead_timer_expired(self, ctx: OSPFInterfaceContext, neighbor: OSPFNeighbor):
         """
-        # Wait a bit before first calculation
-        await asyncio.sleep(5)
+        Inactivity timer callback: kill the neighbor if no Hello arrived
+        within the dead interval (RFC 2328 Section 10.3, InactivityTimer)
 
-        while self.running:
-            try:
-                await self._run_spf()
-                await asyncio.sleep(30)  # Run every 30 seconds
+        Args:
+            ctx: Interface the neighbor is on
+            neighbor: Neighbor being watched
+        """
+        neighbor.dead_timer = None
+        if ctx.neighbors.get(neighbor.router_id) is not neighbor:
+            return  # Replaced or removed meanwhile
+        if neighbor.get_state() == STATE_DOWN:
+            return
 
-            except Exception as e:
-                self.logger.error(f"SPF loop error: {e}")
-                await asyncio.sleep(5)
+        remaining = neighbor.last_hello + ctx.dead_interval - time.time()
+        if remaining > 0:
+            self._arm_dead_timer(ctx, neighbor, remaining)
+            return
+
+        # Forget the neighbor in the Hello handler too, so its next Hello is
+        # treated as a fresh discovery
+        ctx.hello_handler.remove_neighbor(neighbor.router_id)
+        neighbor.kill()
+        self.logger.warning(f"[{ctx.interface_name}] Neighbor {neighbor.router_id} "
+                            f"killed (inactivity)")
+
+        # Withdraw the dead link from our Router LSA and routing table
+        self._schedule_flood()
+        self._schedule_spf()
 
-    async def _monitor_neighbors(self):
+    def _cancel_dead_timers(self):
         """
-        Monitor neighbors for inactivity across ALL interfaces
+        Cancel every neighbor inactivity timer (on shutdown)
         """
-        while self.running:
-            try:
-                # Check each interface
-                for iface_name, ctx in self.interfaces_ctx.items():
-                    # Check for dead neighbors in this interface's Hello handler
-                    dead = ctx.hello_handler.check_dead_neighbors()
+        for ctx in self.interfaces_ctx.values():
+            for neighbor in ctx.neighbor_snapshot():
+                if neighbor.dead_timer is not None:
+                    neighbor.dead_timer.cancel()
+                    neighbor.dead_timer = None
 
-                    # Kill dead neighbors in this interface's neighbor list
-                    for neighbor_id in dead:
-                        if neighbor_id in ctx.neighbors:
-                            neighbor = ctx.neighbors[neighbor_id]
-                            neighbor.kill()
-                            self.logger.warning(f"[{iface_name}] Neighbor {neighbor_id} killed (inactivity)")
+    async def _retransmission_tick(self):
+        """
+        Retransmit unacknowledged LSAs (RFC 2328 Section 13.7)
 
-                    # Check inactivity for each neighbor on this interface
-                    for neighbor_id, neighbor in list(ctx.neighbors.items()):
-                        if neighbor.check_inactivity(ctx.dead_interval):
-                            self.logger.warning(f"[{iface_name}] Neighbor {neighbor_id} timed out")
+        Only LSAs whose retransmission deadline has passed are visited; an
+        idle tick is a single heap peek. The LSUs due on each interface go
+        out in one batched send.
+        """
+        next_due = self.flooding_mgr.next_retransmit_time()
+        if next_due is None or next_due > time.time():
+            return
 
-                await asyncio.sleep(1)
+        batches = defaultdict(list)
+        # Neighbors that missed the same flood share one LSU
+        lsu_by_lsas: Dict[frozenset, bytes] = {}
+        for neighbor, lsas_to_retransmit in self.flooding_mgr.pop_due_retransmissions():
+            neighbor_id = neighbor.router_id
+            self.logger.info(f"Retransmitting {len(lsas_to_retransmit)} LSAs to {neighbor_id}")
+
+            # Build LSU with LSAs needing retransmission
+            lsas_key = frozenset(map(id, lsas_to_retransmit))
+            lsu_packet = lsu_by_lsas.get(lsas_key)
+            if lsu_packet is None:
+                lsu_packet = self.flooding_mgr.build_ls_update(
+                    lsas_to_retransmit, self.area_id
+                )
+                lsu_by_lsas[lsas_key] = lsu_packet
+            if not lsu_packet:
+                continue
 
-            except Exception as e:
-                self.logger.error(f"Monitor loop error: {e}")
-                await asyncio.sleep(1)
+            for iface_name, ctx in self.interfaces_ctx.items():
+                if ctx.neighbors.get(neighbor_id) is neighbor:
+                    batches[iface_name].append((lsu_packet, neighbor.ip_packed))
+                    break
+            else:
+                self.logger.error(f"Could not find interface for neighbor {neighbor_id}")
+
+        for iface_name, messages in batches.items():
+            sent = self.interfaces_ctx[iface_name].socket.send_many(messages)
+            self.logger.debug("[%s] Sent %d/%d retransmission LSUs",
+                              iface_name, sent, len(messages))
+
+    def _schedule_spf(self):
+        """
+        Request an SPF run from the SPF loop
 
-    async def _retransmission_loop(self):
+        Bursts of LSDB changes (LSUs, Full transitions, age-outs) collapse
+        into a single calculation.
         """
-        Check for LSAs needing retransmission (RFC 2328 Section 13.7)
+        self._spf_event.set()
+
+    async def _spf_loop(self):
+        """
+        Run SPF whenever the topology changes
+
+        Sleeps until _schedule_spf() is called, waits SPF_DELAY for the
+        rest of a burst to arrive, then calculates. SPF_HOLD enforces a
+        minimum gap between runs; requests made meanwhile are served by
+        the next run. There are no periodic wakeups while idle.
         """
         while self.running:
+            await self._spf_event.wait()
+            await asyncio.sleep(SPF_DELAY)
+            self._spf_event.clear()
             try:
-                # Check each neighbor's retransmission list
-                for neighbor_id, neighbor in list(self.neighbors.items()):
-                    # Only retransmit to Full neighbors
-                    if neighbor.get_state() != STATE_FULL:
-                        continue
-
-                    # Get LSAs needing retransmission
-                    lsas_to_retransmit = self.flooding_mgr.get_lsas_needing_retransmission(neighbor)
-
-                    if lsas_to_retransmit:
-                        self.logger.info(f"Retransmitting {len(lsas_to_retransmit)} LSAs to {neighbor_id}")
+                await self._run_spf()
+            except Exception as e:
+                self.logger.error("SPF loop error: %s", e, exc_info=True)
+            await asyncio.sleep(SPF_HOLD)
 
-                        # Build and send LSU with LSAs needing retransmission
-                        lsu_packet = self.flooding_mgr.build_ls_update(
-                            lsas_to_retransmit, self.area_id
-                        )
+    def _schedule_flood(self):
+        """
+        Request re-origination and flooding of our Router LSA
 
-                        if lsu_packet:
-                            self._send_to_neighbor(lsu_packet, neighbor)
-                            self.logger.debug(f"Sent retransmission LSU to {neighbor_id} "
-                                            f"with {len(lsas_to_retransmit)} LSAs")
+        Several adjacencies reaching Full close together (e.g. a mesh
+        coming up) share one regeneration and one flood.
+        """
+        self._flood_event.set()
 
-                # Check every 5 seconds (matches retransmit_interval)
-                await asyncio.sleep(5)
+    async def _flood_loop(self):
+        """
+        Re-originate and flood our Router LSA after Full transitions
 
+        Sleeps until _schedule_flood() is called, waits FLOOD_DELAY for
+        the rest of a burst, then regenerates the LSA once and floods it
+        only if its links actually changed.
+        """
+        while self.running:
+            await self._flood_event.wait()
+            await asyncio.sleep(FLOOD_DELAY)
+            self._flood_event.clear()
+            try:
+                if self._generate_router_lsa():
+                    await self._flood_our_lsas_to_all_neighbors()
             except Exception as e:
-                self.logger.error(f"Retransmission loop error: {e}")
-                await asyncio.sleep(1)
+                self.logger.error("Router LSA flood error: %s", e, exc_info=True)
 
     async def _run_spf(self):
         """
         Run SPF calculation and install routes into kernel
+
+        Dijkstra runs in a worker thread so Hello and receive processing keep
+        going during convergence. Only _spf_loop calls this, so runs never
+        overlap. Skipped when the LSDB has not changed since the last
+        calculation.
         """
+        lsdb_version = self.lsdb.version
+        if lsdb_version == self._spf_lsdb_version:
+            self.logger.debug("SPF skipped (LSDB unchanged, version %d)", lsdb_version)
+            return
+
         try:
-            self.spf_calc.calculate()
+            await asyncio.to_thread(self.spf_calc.calculate)
+            # Changes made while Dijkstra ran leave the versions unequal,
+            # so the next request recalculates
+            self._spf_lsdb_version = lsdb_version
             stats = self.spf_calc.get_statistics()
 
             self.logger.info(f"SPF complete: {stats['routes']} routes, "
@@ -1131,6 +1475,7 @@ class OSPFAgent:
 
             # Install routes into kernel if route manager is available
             if self.kernel_route_manager and stats['routes'] > 0:
+                kernel_routes = []
                 for prefix, route_info in self.spf_calc.routing_table.items():
                     # next_hop from SPF is the router ID, not the interface IP
                     # We need to resolve it to the actual interface IP via neighbor table
@@ -1147,7 +1492,8 @@ class OSPFAgent:
                         if next_hop_router_id in ctx.neighbors:
                             neighbor = ctx.neighbors[next_hop_router_id]
                             actual_gateway = neighbor.ip_address
-                            self.logger.debug(f"Resolved next-hop {next_hop_router_id} -> {actual_gateway} (interface {iface_name})")
+                            self.logger.debug("Resolved next-hop %s -> %s (interface %s)",
+                                              next_hop_router_id, actual_gateway, iface_name)
                             break
 
                     if not actual_gateway:
@@ -1158,7 +1504,8 @@ class OSPFAgent:
                             ip_obj = ipaddress.ip_address(next_hop_router_id)
                             # If it's a valid IP and not the same as our router ID, use it directly
                             actual_gateway = str(ip_obj)
-                            self.logger.debug(f"Using next-hop {next_hop_router_id} as IP address directly")
+                            self.logger.debug("Using next-hop %s as IP address directly",
+                                              next_hop_router_id)
                         except ValueError:
                             pass
 
@@ -1171,7 +1518,8 @@ class OSPFAgent:
                                         if hasattr(link, 'link_data') and link.link_data:
                                             # link_data often contains the interface IP
                                             actual_gateway = str(link.link_data)
-                                            self.logger.debug(f"Resolved next-hop {next_hop_router_id} -> {actual_gateway} via LSDB")
+                                            self.logger.debug("Resolved next-hop %s -> %s via LSDB",
+                                                              next_hop_router_id, actual_gateway)
                                             break
                                 if actual_gateway:
                                     break
@@ -1184,16 +1532,45 @@ class OSPFAgent:
                             actual_gateway = next_hop_router_id
 
                     if actual_gateway and actual_gateway != self.source_ip:
-                        success = self.kernel_route_manager.install_route(
-                            prefix, actual_gateway, metric=cost, protocol="ospf"
-                        )
-                        if not success:
-                            self.logger.warning(f"Failed to install route {prefix}: "
-                                              f"Error: Nexthop has invalid gateway.")
+                        kernel_routes.append((prefix, actual_gateway, cost))
+
+                # One batched kernel update; unchanged routes are skipped
+                installed = await self.kernel_route_manager.install_routes_async(
+                    kernel_routes, protocol="ospf"
+                )
+                if installed < len(kernel_routes):
+                    self.logger.warning(f"Installed {installed} of {len(kernel_routes)} "
+                                        f"OSPF routes into the kernel")
 
         except Exception as e:
             self.logger.error(f"SPF calculation error: {e}")
 
+    def _get_our_lsas(self) -> List[LSA]:
+        """
+        Get the LSAs we originated, cached until the LSDB changes
+
+        Returns:
+            List of self-originated LSAs
+        """
+        version = self.lsdb.version
+        if version != self._our_lsas_version:
+            self._our_lsas = self.lsdb.get_lsas_by_adv_router(self.router_id)
+            self._our_lsu = None
+            self._our_lsas_version = version
+        return self._our_lsas
+
+    def _get_our_lsu(self) -> Optional[bytes]:
+        """
+        Get an LSU carrying all of our LSAs, built once per LSDB version
+
+        Returns:
+            LSU packet bytes, or None if we have no LSAs
+        """
+        our_lsas = self._get_our_lsas()
+        if self._our_lsu is None and our_lsas:
+            self._our_lsu = self.flooding_mgr.build_ls_update(our_lsas, self.area_id)
+        return self._our_lsu
+
     async def _flood_our_lsas_to_neighbor(self, neighbor: OSPFNeighbor):
         """
         Flood our own LSAs to a newly Full neighbor
@@ -1203,21 +1580,19 @@ class OSPFAgent:
         """
         try:
             # Get all our own LSAs (where we are the advertising router)
-            our_lsas = [lsa for lsa in self.lsdb.get_all_lsas()
-                       if lsa.header.advertising_router == self.router_id]
+            our_lsas = self._get_our_lsas()
 
             if not our_lsas:
-                self.logger.debug(f"No LSAs to flood to {neighbor.router_id}")
+                self.logger.debug("No LSAs to flood to %s", neighbor.router_id)
                 return
 
             self.logger.info(f"Flooding {len(our_lsas)} of our LSAs to {neighbor.router_id}")
 
-            # Build LSU packet with our LSAs
-            lsu_packet = self.flooding_mgr.build_ls_update(our_lsas, self.area_id)
+            lsu_packet = self._get_our_lsu()
 
             if lsu_packet:
                 self._send_to_neighbor(lsu_packet, neighbor)
-                self.logger.debug(f"Sent LSU with {len(our_lsas)} LSAs to {neighbor.router_id}")
+                self.logger.debug("Sent LSU with %s LSAs to %s", len(our_lsas), neighbor.router_id)
 
         except Exception as e:
             self.logger.error(f"Error flooding LSAs to {neighbor.router_id}: {e}")
@@ -1228,70 +1603,131 @@ class OSPFAgent:
         """
         try:
             # Get all our own LSAs
-            our_lsas = [lsa for lsa in self.lsdb.get_all_lsas()
-                       if lsa.header.advertising_router == self.router_id]
+            our_lsas = self._get_our_lsas()
 
             if not our_lsas:
                 self.logger.debug("No LSAs to flood")
                 return
 
             # Get all Full neighbors from ALL interfaces (not just primary)
-            full_neighbors = []
+            full_neighbors = {}
             for iface_name, ctx in self.interfaces_ctx.items():
-                full_neighbors.extend([n for n in ctx.neighbors.values() if n.is_full()])
+                iface_full = ctx.neighbors_in_state(STATE_FULL)
+                if iface_full:
+                    full_neighbors[iface_name] = iface_full
 
             if not full_neighbors:
                 self.logger.debug("No Full neighbors to flood to")
                 return
 
-            self.logger.info(f"Flooding {len(our_lsas)} of our LSAs to {len(full_neighbors)} Full neighbors")
+            total_full = sum(len(neighbors) for neighbors in full_neighbors.values())
+            self.logger.info(f"Flooding {len(our_lsas)} of our LSAs to {total_full} Full neighbors")
 
-            # Build LSU packet
-            lsu_packet = self.flooding_mgr.build_ls_update(our_lsas, self.area_id)
+            lsu_packet = self._get_our_lsu()
 
             if lsu_packet:
-                # Send to each Full neighbor
-                for neighbor in full_neighbors:
-                    self._send_to_neighbor(lsu_packet, neighbor)
-                    self.logger.debug(f"Sent LSU to {neighbor.router_id}")
+                # One batched send per interface socket
+                for iface_name, neighbors in full_neighbors.items():
+                    self.interfaces_ctx[iface_name].socket.send_many(
+                        [(lsu_packet, n.ip_packed) for n in neighbors]
+                    )
 
         except Exception as e:
             self.logger.error(f"Error flooding LSAs to all neighbors: {e}")
 
-    def _generate_router_lsa(self):
+    def _generate_router_lsa(self, force: bool = False) -> bool:
         """
         Generate our own Router LSA and add to LSDB
         Includes P2P links to Full neighbors on ALL interfaces and stub link for our /32
-        """
-        from ospf.constants import LINK_TYPE_PTP
 
-        links = []
+        Args:
+            force: Re-originate even if the links have not changed (e.g. to
+                   supersede a stale copy of our LSA received from a neighbor)
 
-        # Add P2P links to all Full neighbors across ALL interfaces
-        for iface_name, ctx in self.interfaces_ctx.items():
-            for neighbor_id, neighbor in ctx.neighbors.items():
-                if neighbor.is_full():
-                    # Point-to-point link
-                    links.append({
-                        'link_id': neighbor.router_id,      # Neighbor's Router ID
-                        'link_data': ctx.source_ip,          # Our interface IP
-                        'link_type': LINK_TYPE_PTP,
-                        'metric': 10
-                    })
-                    self.logger.debug(f"[{iface_name}] Added P2P link to {neighbor.router_id} in Router LSA (via {ctx.source_ip})")
+        Returns:
+            True if a new instance was installed, False if it was unchanged
+        """
+        if not force and not self._router_lsa_dirty:
+            self.logger.debug("Router LSA unchanged, not re-originating")
+            return False
+
+        # P2P links to all Full neighbors across ALL interfaces, maintained
+        # incrementally by _on_neighbor_state_change
+        links = list(self._router_lsa_links.values())
 
         # Add stub link for our /32 loopback/host route
-        links.append({
-            'link_id': self.router_id,
-            'link_data': '255.255.255.255',  # /32 mask
-            'link_type': LINK_TYPE_STUB,
-            'metric': 1
-        })
+        links.append(RouterLSALink(self.router_id, '255.255.255.255', LINK_TYPE_STUB, 1))  # /32 mask
 
         # Install Router LSA
         self.lsdb.install_router_lsa(self.router_id, links)
+        self._router_lsa_dirty = False
+        self._schedule_spf()
 
         self.logger.info(f"Generated Router LSA for {self.router_id} with {len(links)} links across {len(self.interfaces_ctx)} interfaces")
+        return True
+
+    def _create_neighbor(self, ctx: OSPFInterfaceContext, neighbor_id: str,
+                         ip: str, priority: int) -> OSPFNeighbor:
+        """
+        Create a neighbor on an interface and track its state changes
+
+        Args:
+            ctx: Interface context the neighbor was heard on
+            neighbor_id: Neighbor router ID
+            ip: Neighbor IP address
+            priority: Neighbor priority
+
+        Returns:
+            The new neighbor
+        """
+        neighbor = OSPFNeighbor(neighbor_id, ip, priority, network_type=ctx.network_type)
+        neighbor.on_state_change = (
+            lambda nbr, old_state, new_state: self._on_neighbor_state_change(ctx, nbr, old_state, new_state)
+        )
+        ctx.add_neighbor(neighbor_id, neighbor)
+        return neighbor
+
+    def _on_neighbor_state_change(self, ctx: OSPFInterfaceContext, neighbor: OSPFNeighbor,
+                                  old_state: int, new_state: int):
+        """
+        Keep per-interface neighbor indexes in sync with neighbor FSMs
+
+        Args:
+            ctx: Interface context of the neighbor
+            neighbor: Neighbor whose state changed
+            old_state: Previous state
+            new_state: New state
+        """
+        if ctx.neighbors.get(neighbor.router_id) is neighbor:
+            ctx.neighbors_by_state[old_state].discard(neighbor.router_id)
+            ctx.neighbors_by_state[new_state].add(neighbor.router_id)
+
+            # Router LSA links follow Full adjacencies
+            link_key = (ctx.interface_name, neighbor.router_id)
+            if new_state == STATE_FULL:
+                link = RouterLSALink(
+                    link_id=neighbor.router_id,      # Neighbor's Router ID
+                    link_data=ctx.source_ip,         # Our interface IP
+                    link_type=LINK_TYPE_PTP,
+                    metric=10
+                )
+                if self._router_lsa_links.get(link_key) != link:
+                    self._router_lsa_links[link_key] = link
+                    self._router_lsa_dirty = True
+                    self.logger.debug("[%s] Added P2P link to %s in Router LSA (via %s)",
+                                      ctx.interface_name, neighbor.router_id, ctx.source_ip)
+            elif old_state == STATE_FULL:
+                if self._router_lsa_links.pop(link_key, None) is not None:
+                    self._router_lsa_dirty = True
+
+            # Killed or reset adjacency: nothing left to retransmit to it
+            if new_state < STATE_EXCHANGE <= old_state:
+                self.flooding_mgr.forget_neighbor(neighbor)
+
+        if new_state >= STATE_INIT:
+            ctx.active_neighbor_ids.add(neighbor.router_id)
+        else:
+            ctx.active_neighbor_ids.discard(neighbor.router_id)
 
     def _on_neighbor_discovered(self, neighbor_id: str, ip: str, priority: int, iface_name: str):
         """
@@ -1310,12 +1746,12 @@ class OSPFAgent:
         # Validate neighbor IP is in same subnet as interface
         # This prevents duplicate neighbors when OSPF packets leak across interfaces
         if not self._is_neighbor_in_subnet(ip, ctx):
-            self.logger.debug(f"[{iface_name}] Ignoring neighbor discovery for {neighbor_id} ({ip}) - not in subnet {ctx.source_ip}/{ctx.netmask}")
+            self.logger.debug("[%s] Ignoring neighbor discovery for %s (%s) - not in subnet %s/%s",
+                              iface_name, neighbor_id, ip, ctx.source_ip, ctx.netmask)
             return
 
         if neighbor_id not in ctx.neighbors:
-            neighbor = OSPFNeighbor(neighbor_id, ip, priority, network_type=ctx.network_type)
-            ctx.neighbors[neighbor_id] = neighbor
+            self._create_neighbor(ctx, neighbor_id, ip, priority)
             self.logger.info(f"[{iface_name}] New neighbor discovered: {neighbor_id} ({ip})")
 
     def _on_hello_received(self, neighbor_id: str, ip: str, bidirectional: bool, hello_pkt, iface_name: str):
@@ -1336,13 +1772,13 @@ class OSPFAgent:
         # Validate neighbor IP is in same subnet as interface
         # This prevents duplicate neighbors when multiple interfaces share physical NIC
         if not self._is_neighbor_in_subnet(ip, ctx):
-            self.logger.debug(f"[{iface_name}] Ignoring Hello from {neighbor_id} ({ip}) - not in subnet {ctx.source_ip}/{ctx.netmask}")
+            self.logger.debug("[%s] Ignoring Hello from %s (%s) - not in subnet %s/%s",
+                              iface_name, neighbor_id, ip, ctx.source_ip, ctx.netmask)
             return
 
         # Get or create neighbor
         if neighbor_id not in ctx.neighbors:
-            neighbor = OSPFNeighbor(neighbor_id, ip, hello_pkt.router_priority, network_type=ctx.network_type)
-            ctx.neighbors[neighbor_id] = neighbor
+            neighbor = self._create_neighbor(ctx, neighbor_id, ip, hello_pkt.router_priority)
         else:
             neighbor = ctx.neighbors[neighbor_id]
 
@@ -1350,6 +1786,7 @@ class OSPFAgent:
         old_state = neighbor.get_state()
         neighbor.handle_hello_received(bidirectional)
         new_state = neighbor.get_state()
+        self._arm_dead_timer(ctx, neighbor)
 
         if old_state != new_state:
             self.logger.info(f"[{iface_name}] Neighbor {neighbor_id}: "
@@ -1362,18 +1799,18 @@ class OSPFAgent:
                 # Send initial DBD packet
                 try:
                     asyncio.create_task(self._send_initial_dbd(neighbor, iface_name))
-                    self.logger.debug(f"[{iface_name}] Created task to send initial DBD to {neighbor_id}")
+                    self.logger.debug("[%s] Created task to send initial DBD to %s",
+                                      iface_name, neighbor_id)
                 except Exception as e:
                     self.logger.error(f"[{iface_name}] Failed to create DBD task: {e}")
 
             elif new_state == STATE_FULL:
                 self.logger.info(f"[{iface_name}] ✓ Adjacency FULL with {neighbor_id}")
-                # Regenerate our Router LSA (now includes all interfaces and neighbors)
-                self._generate_router_lsa()
-                # Flood our updated LSAs to ALL Full neighbors on ALL interfaces
-                asyncio.create_task(self._flood_our_lsas_to_all_neighbors())
+                # Regenerate our Router LSA (now includes all interfaces and
+                # neighbors) and flood it to ALL Full neighbors on ALL interfaces
+                self._schedule_flood()
                 # Run SPF
-                asyncio.create_task(self._run_spf())
+                self._schedule_spf()
 
     async def _process_dbd(self, data: bytes, neighbor_id: str, iface_name: str):
         """
@@ -1394,7 +1831,8 @@ class OSPFAgent:
         success, lsa_headers_needed, neighbor_dbd_complete = self.adjacency_mgr.process_dbd(data, neighbor)
 
         if not success:
-            self.logger.debug(f"Failed to process DBD from {neighbor_id} (transient during adjacency formation)")
+            self.logger.debug("Failed to process DBD from %s (transient during adjacency formation)",
+                              neighbor_id)
             return
 
         # Add needed LSAs to request list
@@ -1438,9 +1876,8 @@ class OSPFAgent:
 
             elif new_state == STATE_FULL:
                 self.logger.info(f"✓ Adjacency FULL with {neighbor_id}")
-                self._generate_router_lsa()
-                await self._flood_our_lsas_to_all_neighbors()
-                await self._run_spf()
+                self._schedule_flood()
+                self._schedule_spf()
 
         # Continue exchanging DBD packets if still in Exchange state
         elif new_state == STATE_EXCHANGE:
@@ -1456,9 +1893,8 @@ class OSPFAgent:
                 await self._send_lsr(neighbor)
             elif post_dbd_state == STATE_FULL:
                 self.logger.info(f"✓ Adjacency FULL with {neighbor_id} (direct from Exchange)")
-                self._generate_router_lsa()
-                await self._flood_our_lsas_to_all_neighbors()
-                await self._run_spf()
+                self._schedule_flood()
+                self._schedule_spf()
 
         # Handle duplicate DBD in Loading/Full (retransmission from master)
         elif new_state in (STATE_LOADING, STATE_FULL) and success:
@@ -1486,8 +1922,8 @@ class OSPFAgent:
 
         if lsu_packet:
             # Send LSU unicast to neighbor
-            ctx.socket.send(lsu_packet, dest=neighbor.ip_address)
-            self.logger.debug(f"[{iface_name}] Sent LSU to {neighbor_id} in response to LSR")
+            self._send_to_neighbor(lsu_packet, neighbor, iface_name)
+            self.logger.debug("[%s] Sent LSU to %s in response to LSR", iface_name, neighbor_id)
 
     async def _process_lsu(self, data: bytes, neighbor_id: str, iface_name: str):
         """
@@ -1498,6 +1934,8 @@ class OSPFAgent:
             neighbor_id: Neighbor router ID
             iface_name: Interface name packet was received on
         """
+        self._lsu_cache.clear()
+
         neighbor = self._get_neighbor(neighbor_id, iface_name)
         if not neighbor:
             self.logger.warning(f"[{iface_name}] Received LSU from unknown neighbor {neighbor_id}")
@@ -1511,7 +1949,7 @@ class OSPFAgent:
             # Send LSAck if needed (unicast to neighbor)
             if ack_packet:
                 self._send_to_neighbor(ack_packet, neighbor)
-                self.logger.debug(f"Sent LSAck to {neighbor_id}")
+                self.logger.debug("Sent LSAck to %s", neighbor_id)
 
             # Separate self-originated LSAs from others (RFC 2328 Section 13.4)
             self_originated_lsas = []
@@ -1526,40 +1964,38 @@ class OSPFAgent:
             if self_originated_lsas:
                 self.logger.info(f"Received {len(self_originated_lsas)} self-originated LSAs - re-originating")
                 # Our own LSA came back with potentially higher seq, regenerate
-                self._generate_router_lsa()
+                self._generate_router_lsa(force=True)
                 await self._flood_our_lsas_to_all_neighbors()
 
             # Flood external LSAs to other neighbors (RFC 2328 Section 13.3)
             if external_lsas:
                 self.logger.info(f"Flooding {len(external_lsas)} external LSAs to other neighbors")
-                for lsa in external_lsas:
-                    # Get all neighbors from ALL interfaces (not just primary)
-                    neighbor_list = []
-                    for iface_name, ctx in self.interfaces_ctx.items():
-                        neighbor_list.extend(ctx.neighbors.values())
-
-                    # Flood to all neighbors except sender
-                    lsu_packets = self.flooding_mgr.flood_lsa_to_neighbors(
-                        lsa, neighbor_list, self.area_id, exclude_neighbor=neighbor
+                # One LSU carrying every updated LSA, flooded to neighbors on
+                # ALL interfaces except sender with one batched send per socket
+                for ctx in self.interfaces_ctx.values():
+                    full_neighbors = ctx.neighbors_in_state(STATE_FULL)
+                    if not full_neighbors:
+                        continue
+                    lsu_packets = self.flooding_mgr.flood_lsas_to_neighbors(
+                        external_lsas, full_neighbors, self.area_id,
+                        exclude_neighbor=neighbor, lsu_cache=self._lsu_cache
                     )
-
-                    # Send LSU packets unicast to each neighbor
-                    for target_neighbor, lsu_packet in lsu_packets:
-                        self._send_to_neighbor(lsu_packet, target_neighbor)
-                        self.logger.debug(f"Flooded LSA to {target_neighbor.router_id}")
+                    if lsu_packets:
+                        ctx.socket.send_many(
+                            [(lsu_packet, target.ip_packed) for target, lsu_packet in lsu_packets]
+                        )
 
             # Run SPF if any LSAs were updated
             if updated_lsas:
-                await self._run_spf()
+                self._schedule_spf()
 
             # Only regenerate Router LSA if state TRANSITIONED to Full
             # (not on every LSU when already Full - that causes flooding loop)
             state_after_lsu = neighbor.get_state()
             if state_after_lsu == STATE_FULL and state_before_lsu != STATE_FULL:
                 self.logger.info(f"✓ Adjacency TRANSITIONED to FULL with {neighbor_id}")
-                self._generate_router_lsa()
-                await self._flood_our_lsas_to_all_neighbors()
-                await self._run_spf()
+                self._schedule_flood()
+                self._schedule_spf()
 
     async def _process_lsack(self, data: bytes, neighbor_id: str, iface_name: str):
         """
@@ -1578,7 +2014,7 @@ class OSPFAgent:
         # Process LSAck
         success = self.flooding_mgr.process_ls_ack(data, neighbor)
         if success:
-            self.logger.debug(f"LSAck processed from {neighbor_id}")
+            self.logger.debug("LSAck processed from %s", neighbor_id)
         else:
             self.logger.warning(f"Failed to process LSAck from {neighbor_id}")
 
@@ -1591,16 +2027,17 @@ class OSPFAgent:
             iface_name: Interface name where neighbor resides
         """
         try:
-            self.logger.info(f"[{iface_name}] Building initial DBD for {neighbor.router_id}...")
+            self.logger.info("[%s] Building initial DBD for %s...", iface_name, neighbor.router_id)
             # Build initial DBD packet
             dbd_packet = self.adjacency_mgr.build_initial_dbd_packet(neighbor, self.area_id, iface_name)
 
-            self.logger.info(f"[{iface_name}] Sending initial DBD to {neighbor.ip_address}...")
+            self.logger.info("[%s] Sending initial DBD to %s...", iface_name, neighbor.ip_address)
             # Send DBD unicast to neighbor using the correct interface socket
             self._send_to_neighbor(dbd_packet, neighbor, iface_name)
-            self.logger.info(f"[{iface_name}] Sent initial DBD to {neighbor.router_id} (ExStart)")
+            self.logger.info("[%s] Sent initial DBD to %s (ExStart)", iface_name, neighbor.router_id)
         except Exception as e:
-            self.logger.error(f"[{iface_name}] Error sending initial DBD to {neighbor.router_id}: {e}", exc_info=True)
+            self.logger.error("[%s] Error sending initial DBD to %s: %s", iface_name, neighbor.router_id, e,
+                              exc_info=True)
 
     async def _send_dbd(self, neighbor: OSPFNeighbor, iface_name: str = None):
         """
@@ -1613,7 +2050,7 @@ class OSPFAgent:
         # If we're master, increment sequence number for new DBD
         if neighbor.is_master:
             neighbor.dd_sequence_number += 1
-            self.logger.debug(f"Master incrementing sequence to {neighbor.dd_sequence_number}")
+            self.logger.debug("Master incrementing sequence to %s", neighbor.dd_sequence_number)
 
         # Get LSA headers to send
         lsa_headers, has_more = self.adjacency_mgr.get_lsa_headers_to_send(neighbor)
@@ -1625,16 +2062,16 @@ class OSPFAgent:
 
         # Send DBD unicast to neighbor using correct interface
         self._send_to_neighbor(dbd_packet, neighbor, iface_name)
-        self.logger.debug(f"Sent DBD to {neighbor.router_id} "
-                        f"(headers: {len(lsa_headers)}, more: {has_more})")
+        self.logger.debug("Sent DBD to %s (headers: %s, more: %s)",
+                          neighbor.router_id, len(lsa_headers), has_more)
 
         # Track our DBD completion
         if not has_more:
             neighbor.mark_our_dbd_complete()
-            self.logger.info(f"Sent final DBD to {neighbor.router_id} (M=0)")
+            self.logger.info("Sent final DBD to %s (M=0)", neighbor.router_id)
             # Check if exchange is complete (both sides finished)
             if neighbor.is_exchange_complete():
-                self.logger.info(f"Exchange complete with {neighbor.router_id}, transitioning state")
+                self.logger.info("Exchange complete with %s, transitioning state", neighbor.router_id)
                 neighbor.exchange_done()
 
     async def _send_lsr(self, neighbor: OSPFNeighbor):
@@ -1646,7 +2083,7 @@ class OSPFAgent:
         """
         # If no LSAs to request, transition directly to Full
         if not neighbor.ls_request_list:
-            self.logger.info(f"No LSAs to request from {neighbor.router_id}, transitioning to Full")
+            self.logger.info("No LSAs to request from %s, transitioning to Full", neighbor.router_id)
             neighbor.loading_done()
             return
 
@@ -1656,8 +2093,8 @@ class OSPFAgent:
         if lsr_packet:
             # Send LSR unicast to neighbor
             self._send_to_neighbor(lsr_packet, neighbor)
-            self.logger.info(f"Sent LSR to {neighbor.router_id} "
-                           f"requesting {len(neighbor.ls_request_list)} LSAs")
+            self.logger.info("Sent LSR to %s requesting %d LSAs",
+                             neighbor.router_id, len(neighbor.ls_request_list))
 
     def get_status(self) -> Dict:
         """
@@ -1666,13 +2103,11 @@ class OSPFAgent:
         Returns:
             Status dictionary
         """
-        # Get neighbors from ALL interfaces (multi-interface support)
-        all_neighbors = {}
-        for iface_name, ctx in self.interfaces_ctx.items():
-            for neighbor_id, neighbor in ctx.neighbors.items():
-                # Use neighbor.router_id as key to avoid duplicates across interfaces
-                # (same router seen on multiple interfaces should only count once)
-                all_neighbors[neighbor.router_id] = neighbor
+        # Neighbor router IDs from ALL interfaces (multi-interface support);
+        # the same router seen on multiple interfaces only counts once
+        contexts = self.interfaces_ctx.values()
+        all_neighbors = set().union(*(ctx.neighbors.keys() for ctx in contexts))
+        full_neighbors = set().union(*(ctx.neighbors_by_state.get(STATE_FULL, ()) for ctx in contexts))
 
         return {
             'router_id': self.router_id,
@@ -1680,24 +2115,90 @@ class OSPFAgent:
             'interface': self.interface,
             'ip': self.source_ip,
             'neighbors': len(all_neighbors),
-            'full_neighbors': sum(1 for n in all_neighbors.values() if n.is_full()),
+            'full_neighbors': len(full_neighbors),
             'lsdb_size': self.lsdb.get_size(),
-            'routes': len(self.spf_calc.routing_table)
+            'routes': len(self.spf_calc.routing_table),
+            'tx_dropped': self.tx_dropped
         }
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Log formatter that renders the timestamp at most once per second
+
+    With a second-resolution datefmt every record within the same second
+    shares one strftime() result instead of re-rendering it.
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        self._last_second: Optional[int] = None
+        self._last_time_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        # The default format includes milliseconds, so only cache explicit datefmts
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time_str = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_time_str
+
+
+# Console log format, shared by every setup_logging() call
+_LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+_LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
+_FORMATTER = CachedTimeFormatter(_LOG_FORMAT, _LOG_DATEFMT)
+
+# Background listener that owns the real log handler, and the root-logger
+# handler feeding it (see setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
 def setup_logging(log_level: str = "INFO"):
     """
     Setup logging configuration
 
+    Records are handed to a queue by the root logger and formatted/written
+    by a QueueListener thread, so the event loop never blocks on stderr.
+    Calling it again only updates the level.
+
     Args:
         log_level: Logging level
     """
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    global _log_listener, _log_queue_handler
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level.upper()))
+    if _log_listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(_FORMATTER)
+
+    log_queue = queue.SimpleQueue()
+    _log_queue_handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(_log_queue_handler)
+
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler,
+                                                   respect_handler_level=True)
+    _log_listener.start()
+
+
+def shutdown_logging():
+    """
+    Stop the logging listener thread, flushing any queued records
+    """
+    global _log_listener, _log_queue_handler
+    if _log_queue_handler is not None:
+        logging.getLogger().removeHandler(_log_queue_handler)
+        _log_queue_handler = None
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 async def run_server_only(args: argparse.Namespace):
@@ -1762,11 +2263,11 @@ async def run_server_only(args: argparse.Namespace):
         await webui_server.serve()
 
     except ImportError as e:
-        logger.error(f"Web UI dependencies not available: {e}")
+        logger.error("Web UI dependencies not available: %s", e)
         logger.error("Install with: pip install uvicorn fastapi")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
 
 
@@ -1800,6 +2301,8 @@ async def run_unified_agent(args: argparse.Namespace):
     bgp_speaker = None
     agentic_api_server = None
     agentic_bridge = None
+    redistributor = None
+    nd_protocol = None
     tasks = []
 
     # Determine what protocols to run
@@ -1842,18 +2345,40 @@ async def run_unified_agent(args: argparse.Namespace):
     if run_bgp:
         logger.info(f"  BGP: Enabled (AS {args.bgp_local_as}, {len(args.bgp_peers or [])} peers)")
 
+    # Install shutdown handlers before anything starts, so a SIGTERM from the
+    # service manager during startup still runs the cleanup below
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    # Set once on shutdown; long-sleeping loops (monitor_bgp) wait on it
+    shutdown_event = asyncio.Event()
+
+    def signal_handler(signum):
+        if shutdown_event.is_set():
+            return  # Shutdown already in progress
+        logger.info("Received %s, shutting down...", signal.Signals(signum).name)
+        shutdown_event.set()
+        main_task.cancel()
+
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+        loop.add_signal_handler(sig, signal_handler, sig)
+
     try:
         # Create kernel route manager for installing routes
         kernel_route_manager = KernelRouteManager()
 
         # Enable IP forwarding in kernel
         try:
-            import subprocess as _subprocess
-            _subprocess.run(["sysctl", "-w", "net.ipv4.ip_forward=1"],
-                           capture_output=True, timeout=5)
+            try:
+                _sysctl_write("/proc/sys/net/ipv4/ip_forward", b"1\n")
+            except OSError:
+                # No writable /proc/sys (non-Linux) - let sysctl(8) try
+                import subprocess as _subprocess
+                _subprocess.run(["sysctl", "-w", "net.ipv4.ip_forward=1"],
+                               stdout=_subprocess.DEVNULL, stderr=_subprocess.DEVNULL,
+                               timeout=5)
             logger.info("✓ IP forwarding enabled")
         except Exception as e:
-            logger.warning(f"Could not enable IP forwarding: {e}")
+            logger.warning("Could not enable IP forwarding: %s", e)
 
         # Setup forwarding logging for loopback routes
         kernel_route_manager.setup_forwarding_logging(
@@ -1907,7 +2432,9 @@ async def run_unified_agent(args: argparse.Namespace):
                 kernel_route_manager=kernel_route_manager,
                 interfaces=ospf_interfaces,  # Pass all interfaces!
                 interface_unicast_peers=interface_unicast_peers,
-                interface_ips=interface_ips  # Pass interface IPs for logical interfaces
+                interface_ips=interface_ips,  # Pass interface IPs for logical interfaces
+                router_id_int=getattr(args, 'router_id_int', None),
+                sock_bufsize=args.ospf_sock_bufsize
             )
             asi_app.set_ospf(ospf_agent)
             asi_app.area_id = args.area
@@ -2016,41 +2543,41 @@ async def run_unified_agent(args: argparse.Namespace):
 
             # Add BGP peers
             if args.bgp_peers:
+                passive_peers = set(args.bgp_passive or [])
+                rr_clients = set(args.bgp_rr_clients or [])
+                peer_as_list = args.bgp_peer_as_list or []
+                peers = []
+
                 for i, peer_ip in enumerate(args.bgp_peers):
-                    # Get corresponding peer AS
-                    if args.bgp_peer_as_list and i < len(args.bgp_peer_as_list):
-                        peer_as = args.bgp_peer_as_list[i]
-                    else:
-                        peer_as = args.bgp_local_as  # Default to iBGP
-
-                    # Check if passive
-                    passive = peer_ip in (args.bgp_passive or [])
-
-                    # Check if route reflector client
-                    rr_client = peer_ip in (args.bgp_rr_clients or [])
-
-                    peer_type = "iBGP" if peer_as == args.bgp_local_as else "eBGP"
-                    mode = "passive" if passive else "active"
-                    rr_status = " (RR client)" if rr_client else ""
-
-                    logger.info(f"Adding BGP peer {peer_ip}: {peer_type}, {mode}{rr_status}")
-
-                    bgp_speaker.add_peer(
-                        peer_ip=peer_ip,
-                        peer_as=peer_as,
-                        local_ip=local_bgp_ip,  # Use interface IP for next-hop
-                        passive=passive,
-                        route_reflector_client=rr_client,
-                        hold_time=args.bgp_hold_time,
-                        connect_retry_time=args.bgp_connect_retry,
-                        enable_flap_damping=args.bgp_enable_flap_damping,
-                        flap_damping_config=flap_config,
-                        enable_graceful_restart=args.bgp_enable_graceful_restart,
-                        graceful_restart_time=args.bgp_graceful_restart_time,
-                        enable_rpki_validation=args.bgp_enable_rpki,
-                        rpki_reject_invalid=args.bgp_rpki_reject_invalid,
-                        enable_flowspec=args.bgp_enable_flowspec
-                    )
+                    # Get corresponding peer AS (default to iBGP)
+                    peer_as = peer_as_list[i] if i < len(peer_as_list) else args.bgp_local_as
+                    passive = peer_ip in passive_peers
+                    rr_client = peer_ip in rr_clients
+
+                    logger.info("Adding BGP peer %s: %s, %s%s", peer_ip,
+                                "iBGP" if peer_as == args.bgp_local_as else "eBGP",
+                                "passive" if passive else "active",
+                                " (RR client)" if rr_client else "")
+
+                    peers.append({
+                        'peer_ip': peer_ip,
+                        'peer_as': peer_as,
+                        'local_ip': local_bgp_ip,  # Use interface IP for next-hop
+                        'passive': passive,
+                        'route_reflector_client': rr_client,
+                        'hold_time': args.bgp_hold_time,
+                        'connect_retry_time': args.bgp_connect_retry,
+                        'enable_flap_damping': args.bgp_enable_flap_damping,
+                        'flap_damping_config': flap_config,
+                        'enable_graceful_restart': args.bgp_enable_graceful_restart,
+                        'graceful_restart_time': args.bgp_graceful_restart_time,
+                        'enable_rpki_validation': args.bgp_enable_rpki,
+                        'rpki_reject_invalid': args.bgp_rpki_reject_invalid,
+                        'enable_flowspec': args.bgp_enable_flowspec,
+                    })
+
+                # Sessions are started together by bgp_speaker.start()
+                bgp_speaker.add_peers(peers)
 
             # Load RPKI ROAs if specified
             if args.bgp_enable_rpki and args.bgp_rpki_roa_file:
@@ -2075,7 +2602,8 @@ async def run_unified_agent(args: argparse.Namespace):
                         logger.error(f"  ✗ Failed to originate: {network}")
 
             # Add BGP monitoring task
-            tasks.append(asyncio.create_task(monitor_bgp(bgp_speaker, args.bgp_stats_interval)))
+            tasks.append(asyncio.create_task(
+                monitor_bgp(bgp_speaker, args.bgp_stats_interval, shutdown_event)))
 
         # Start Route Redistribution if multiple protocols are running
         redistributor = None
@@ -2186,15 +2714,15 @@ async def run_unified_agent(args: argparse.Namespace):
                             )
                             logger.info(f"  ✓ BFD session created for BGP peer {peer_ip}")
                         except Exception as e:
-                            logger.warning(f"  Could not create BFD session for BGP peer {peer_ip}: {e}")
+                            logger.warning("  Could not create BFD session for BGP peer %s: %s", peer_ip, e)
 
                 # Store BFD manager in app for web UI access
                 asi_app.bfd_manager = bfd_manager
 
             except ImportError as e:
-                logger.warning(f"BFD module not available: {e}")
+                logger.warning("BFD module not available: %s", e)
             except Exception as e:
-                logger.warning(f"Could not start BFD manager: {e}")
+                logger.warning("Could not start BFD manager: %s", e)
                 import traceback
                 logger.debug(traceback.format_exc())
 
@@ -2296,7 +2824,7 @@ async def run_unified_agent(args: argparse.Namespace):
                     logger.info(f"  ✓ Configured asi0 interface with {ipv6_addr}/{prefix_len}")
                     logger.info(f"  ✓ Added route for {overlay_prefix} via eth0")
                 except Exception as e:
-                    logger.warning(f"  Could not configure IPv6 overlay interface: {e}")
+                    logger.warning("  Could not configure IPv6 overlay interface: %s", e)
 
                 agent_id = os.environ.get('ASI_AGENT_ID', asi_id)
                 agent_name = os.environ.get('ASI_AGENT_NAME', f"agent-{args.router_id}")
@@ -2319,9 +2847,9 @@ async def run_unified_agent(args: argparse.Namespace):
 
                 logger.info(f"✓ IPv6 Neighbor Discovery started on ASI overlay")
             except ImportError as e:
-                logger.warning(f"Neighbor Discovery module not available: {e}")
+                logger.warning("Neighbor Discovery module not available: %s", e)
             except Exception as e:
-                logger.warning(f"Could not start Neighbor Discovery: {e}")
+                logger.warning("Could not start Neighbor Discovery: %s", e)
         elif ipv6_overlay and not nd_enabled:
             logger.info(f"IPv6 Overlay configured ({ipv6_overlay}) but ND disabled")
 
@@ -2380,9 +2908,9 @@ async def run_unified_agent(args: argparse.Namespace):
                 logger.info(f"✓ Web Dashboard started at http://{args.webui_host}:{args.webui_port}")
 
             except ImportError as e:
-                logger.warning(f"Web UI not available ({e}). Install with: pip install uvicorn")
+                logger.warning("Web UI not available (%s). Install with: pip install uvicorn", e)
             except Exception as e:
-                logger.warning(f"Could not start Web UI: {e}")
+                logger.warning("Could not start Web UI: %s", e)
 
         # Start LLDP daemon for neighbor discovery
         try:
@@ -2390,33 +2918,34 @@ async def run_unified_agent(args: argparse.Namespace):
             await start_lldp(asi_id)
             logger.info(f"✓ LLDP daemon started for neighbor discovery")
         except ImportError as e:
-            logger.warning(f"LLDP not available ({e})")
+            logger.warning("LLDP not available (%s)", e)
         except Exception as e:
-            logger.warning(f"Could not start LLDP daemon: {e}")
-
-        # Setup signal handlers for graceful shutdown
-        loop = asyncio.get_event_loop()
-
-        def signal_handler(signum):
-            logger.info(f"Received signal {signum}, shutting down...")
-            for task in tasks:
-                task.cancel()
-            if bgp_speaker:
-                asyncio.create_task(bgp_speaker.stop())
+            logger.warning("Could not start LLDP daemon: %s", e)
 
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
-
-        # Wait for all tasks
+        # Wait for all tasks (a shutdown signal cancels this gather)
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    except asyncio.CancelledError:
+        logger.info("Shutdown requested")
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         raise
     finally:
         # Cleanup
+        shutdown_event.set()
+        for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+            loop.remove_signal_handler(sig)
+
+        # Tasks not yet awaited when startup was interrupted
+        for task in tasks:
+            task.cancel()
+
+        if ospf_agent and ospf_agent.running:
+            logger.info("Stopping OSPF agent...")
+            await ospf_agent.stop()
+
         if redistributor:
             logger.info("Stopping route redistribution...")
             await redistributor.stop()
@@ -2444,89 +2973,275 @@ async def run_unified_agent(args: argparse.Namespace):
                 from agentic.discovery.neighbor_discovery import stop_neighbor_discovery
                 await stop_neighbor_discovery()
             except Exception as e:
-                logger.warning(f"Error stopping ND: {e}")
+                logger.warning("Error stopping ND: %s", e)
 
         logger.info("Shutdown complete")
 
 
-async def monitor_bgp(speaker: BGPSpeaker, interval: int):
+async def monitor_bgp(speaker: BGPSpeaker, interval: int,
+                      shutdown_event: Optional[asyncio.Event] = None):
     """
     Monitor BGP speaker and print statistics periodically
 
     Args:
         speaker: BGP speaker instance
         interval: Statistics interval in seconds
+        shutdown_event: Optional event that ends monitoring as soon as it is set
     """
     logger = logging.getLogger("BGPMonitor")
+    if shutdown_event is None:
+        shutdown_event = asyncio.Event()
+    agent = speaker.agent
+    last_state = None
 
-    while speaker.agent.running:
-        await asyncio.sleep(interval)
+    while agent.running:
+        try:
+            await asyncio.wait_for(shutdown_event.wait(), timeout=interval)
+            return
+        except asyncio.TimeoutError:
+            pass
+
+        # Nothing to report unless the Loc-RIB or a session state changed
+        state = (agent.loc_rib.version,
+                 tuple(session.is_established() for session in agent.sessions.values()))
+        if state == last_state:
+            logger.debug("BGP state unchanged, skipping statistics")
+            continue
+        last_state = state
 
         try:
             stats = speaker.get_statistics()
             logger.info("=" * 60)
-            logger.info(f"BGP Statistics:")
-            logger.info(f"  Total Peers:       {stats['total_peers']}")
-            logger.info(f"  Established Peers: {stats['established_peers']}")
-            logger.info(f"  Loc-RIB Routes:    {stats['loc_rib_routes']}")
+            logger.info("BGP Statistics:")
+            logger.info("  Total Peers:       %s", stats['total_peers'])
+            logger.info("  Established Peers: %s", stats['established_peers'])
+            logger.info("  Loc-RIB Routes:    %s", stats['loc_rib_routes'])
 
             if 'route_reflector' in stats:
                 rr_stats = stats['route_reflector']
-                logger.info(f"  RR Clients:        {rr_stats['clients']}")
+                logger.info("  RR Clients:        %s", rr_stats['clients'])
 
-            # Display routing table (like "show ip route bgp")
-            routes = speaker.agent.loc_rib.get_all_routes()
-            if routes:
+            # Display routing table (like "show ip route bgp"), skipping the
+            # per-route formatting entirely when INFO is filtered out
+            loc_rib = agent.loc_rib
+            route_count = loc_rib.size()
+            if route_count and logger.isEnabledFor(logging.INFO):
                 logger.info("")
                 logger.info("BGP Routing Table:")
-                logger.info(f"{'Network':<20} {'Next Hop':<16} {'Path':<20} {'Source':<10}")
+                logger.info("%-20s %-16s %-20s %-10s", "Network", "Next Hop", "Path", "Source")
                 logger.info("-" * 70)
 
-                # Sort routes by prefix for consistent display
-                sorted_routes = sorted(routes, key=lambda r: r.prefix)
-
-                for route in sorted_routes[:20]:  # Show first 20 routes
-                    # Extract next-hop from attributes
-                    next_hop = "N/A"
-                    if 3 in route.path_attributes:  # ATTR_NEXT_HOP
-                        nh_attr = route.path_attributes[3]
-                        if hasattr(nh_attr, 'next_hop'):
-                            next_hop = nh_attr.next_hop
-
-                    # Extract AS_PATH
-                    as_path = ""
-                    if 2 in route.path_attributes:  # ATTR_AS_PATH
-                        path_attr = route.path_attributes[2]
-                        if hasattr(path_attr, 'segments'):
-                            try:
-                                # Handle both object and tuple segments
-                                as_list = []
-                                for seg in path_attr.segments:
-                                    if hasattr(seg, 'asns'):
-                                        as_list.extend(str(asn) for asn in seg.asns)
-                                    elif isinstance(seg, tuple):
-                                        # Segment is (type, [asns])
-                                        as_list.extend(str(asn) for asn in seg[1])
-                                as_path = " ".join(as_list)
-                            except Exception:
-                                as_path = "?"
-
-                    logger.info(f"{route.prefix:<20} {next_hop:<16} {as_path:<20} {route.source:<10}")
-
-                if len(routes) > 20:
-                    logger.info(f"... and {len(routes) - 20} more routes")
+                # First 20 routes by prefix for consistent display
+                for route in loc_rib.get_first_routes(20):
+                    nh_attr = route.path_attributes.get(3)  # ATTR_NEXT_HOP
+                    next_hop = nh_attr.to_display_str() if nh_attr is not None else "N/A"
+
+                    # AS_PATH is rendered once, when the route is installed
+                    logger.info("%-20s %-16s %-20s %-10s",
+                                route.prefix, next_hop, route.as_path_str, route.source)
+
+                if route_count > 20:
+                    logger.info("... and %d more routes", route_count - 20)
         except Exception as e:
-            logger.error(f"Error getting BGP statistics: {e}")
+            logger.error("Error getting BGP statistics: %s", e)
 
 
-def main():
+def _sysctl_write(path: str, value: bytes):
     """
-    Main entry point
+    Set a kernel parameter by writing its /proc/sys file directly
+
+    Args:
+        path: /proc/sys path (e.g. "/proc/sys/net/ipv4/ip_forward")
+        value: Raw value to write
+
+    Raises:
+        OSError: If the file cannot be written
     """
-    parser = argparse.ArgumentParser(
-        description="Won't You Be My Neighbor - Unified Routing Agent (OSPF + BGP)",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    with open(path, "wb") as f:
+        f.write(value)
+
+
+def install_event_loop_policy():
+    """
+    Use uvloop's faster event loop when it is installed
+
+    uvloop ships with uvicorn[standard]; without it the default asyncio
+    event loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
+def _pack_ip(value: str) -> bytes:
+    """
+    Pack a dotted-quad IPv4 address
+
+    Args:
+        value: IPv4 address string
+
+    Returns:
+        4-byte packed address
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a valid IPv4 address
+    """
+    try:
+        return socket.inet_pton(socket.AF_INET, value)
+    except (OSError, TypeError):
+        raise argparse.ArgumentTypeError(f"invalid IPv4 address: {value!r}")
+
+
+def _pack_ip_u32(value: str) -> int:
+    """
+    Pack a dotted-quad IPv4 address as an unsigned 32-bit integer
+
+    Args:
+        value: IPv4 address string
+
+    Returns:
+        Address as an integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a valid IPv4 address
+    """
+    return struct.unpack("!I", _pack_ip(value))[0]
+
+
+def _pos_int(value: str) -> int:
+    """
+    Parse a positive 16-bit integer (OSPF HelloInterval)
+
+    Args:
+        value: Command-line string
+
+    Returns:
+        Integer in the range 1-65535
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer in range
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if not 1 <= number <= 65535:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 65535: {number}")
+    return number
+
+
+def _dead_interval_arg(value: str) -> int:
+    """
+    Parse a positive 32-bit integer (OSPF RouterDeadInterval, RFC 2328 A.3.2)
+
+    Args:
+        value: Command-line string
+
+    Returns:
+        Integer in the range 1-4294967295
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer in range
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if not 1 <= number <= 0xFFFFFFFF:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 4294967295: {number}")
+    return number
+
+
+def _bufsize_arg(value: str) -> int:
+    """
+    Parse a socket buffer size (0 keeps the kernel default)
+
+    Args:
+        value: Command-line string
+
+    Returns:
+        Non-negative integer that fits a C int
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer in range
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if not 0 <= number <= 0x7fffffff // 2:
+        raise argparse.ArgumentTypeError(f"must be between 0 and {0x7fffffff // 2}: {number}")
+    return number
+
+
+def _ipv4_arg(value: str) -> str:
+    """
+    Validate an IPv4 address argument
+
+    Args:
+        value: Command-line string
+
+    Returns:
+        Address in canonical dotted-quad form
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a valid IPv4 address
+    """
+    return socket.inet_ntop(socket.AF_INET, _pack_ip(value))
+
+
+def _ip_arg(value: str) -> str:
+    """
+    Validate an IPv4 or IPv6 address argument
+
+    Args:
+        value: Command-line string
+
+    Returns:
+        Address in canonical form, so later string comparisons (e.g.
+        --bgp-passive against --bgp-peer) match
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a valid address
+    """
+    if ':' not in value:
+        return _ipv4_arg(value)
+    try:
+        return socket.inet_ntop(socket.AF_INET6, socket.inet_pton(socket.AF_INET6, value))
+    except (OSError, TypeError):
+        raise argparse.ArgumentTypeError(f"invalid IP address: {value!r}")
+
+
+def _area_arg(value: str) -> str:
+    """
+    Validate an OSPF area ID given as dotted-quad or a decimal integer
+
+    Args:
+        value: Command-line string (e.g. "0.0.0.1" or "1")
+
+    Returns:
+        Area ID in canonical dotted-quad form
+
+    Raises:
+        argparse.ArgumentTypeError: If value is neither form
+    """
+    if value.isdigit():
+        number = int(value)
+        if number > 0xFFFFFFFF:
+            raise argparse.ArgumentTypeError(f"area ID out of range: {number}")
+        return socket.inet_ntop(socket.AF_INET, struct.pack("!I", number))
+    return _ipv4_arg(value)
+
+
+# Command-line choices
+_LOG_CHOICES = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+_NETTYPE_CHOICES = ('broadcast', 'point-to-multipoint', 'point-to-point', 'nbma')
+_OSPFV3_NETTYPE_CHOICES = ('broadcast', 'point-to-point', 'point-to-multipoint')
+_ISIS_LEVEL_CHOICES = (1, 2, 3)
+
+_EPILOG = """
 Examples:
 
   # OSPF only:
@@ -2570,39 +3285,85 @@ Notes:
   - OSPF requires root privileges for raw sockets
   - BGP uses TCP port 179 (requires root for ports < 1024)
   - At least one protocol (OSPF or BGP) must be specified
-        """
+"""
+
+
+def _print_full_help(parser: argparse.ArgumentParser) -> None:
+    """
+    Print help followed by the examples epilog
+
+    The epilog is kept off the parser and appended verbatim here, as
+    RawDescriptionHelpFormatter would print it.
+
+    Args:
+        parser: Parser from _build_parser()
+    """
+    sys.stdout.write(parser.format_help() + "\n" + _EPILOG.lstrip("\n"))
+
+
+class _FullHelpAction(argparse.Action):
+    """
+    -h/--help: print help including the examples epilog, then exit
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS,
+                 default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest,
+                         default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        _print_full_help(parser)
+        parser.exit()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line parser
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Won't You Be My Neighbor - Unified Routing Agent (OSPF + BGP)",
+        # -h/--help appends the examples epilog itself
+        add_help=False
     )
+    parser.add_argument("-h", "--help", action=_FullHelpAction,
+                        help="show this help message and exit")
 
     # Server-only mode (just WebUI wizard/monitor, no routing)
     parser.add_argument("--server-only", action="store_true",
                        help="Run only the WebUI server (wizard/monitor) without routing protocols")
 
     # Common arguments
-    parser.add_argument("--router-id", required=False, default=None,
+    parser.add_argument("--router-id", required=False, default=None, type=_ipv4_arg,
                        help="Router ID in IPv4 format (e.g., 10.255.255.99)")
     parser.add_argument("--log-level", default="INFO",
-                       choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       choices=_LOG_CHOICES,
                        help="Log level (default: INFO)")
 
     # OSPF arguments
     ospf_group = parser.add_argument_group('OSPF Options')
-    ospf_group.add_argument("--area", default="0.0.0.0",
-                       help="OSPF Area (default: 0.0.0.0)")
+    ospf_group.add_argument("--area", default="0.0.0.0", type=_area_arg,
+                       help="OSPF Area, dotted or decimal (default: 0.0.0.0)")
     ospf_group.add_argument("--interface", action="append", dest="interfaces",
                        help="Network interface for OSPF (e.g., eth0, en0). Can be specified multiple times for multi-interface OSPF.")
-    ospf_group.add_argument("--source-ip", default=None,
+    ospf_group.add_argument("--source-ip", default=None, type=_ipv4_arg,
                        help="Source IP address (optional, for multi-IP interfaces)")
-    ospf_group.add_argument("--hello-interval", type=int, default=10,
+    ospf_group.add_argument("--hello-interval", type=_pos_int, default=10,
                        help="OSPF Hello interval in seconds (default: 10)")
-    ospf_group.add_argument("--dead-interval", type=int, default=40,
+    ospf_group.add_argument("--dead-interval", type=_dead_interval_arg, default=40,
                        help="OSPF Dead interval in seconds (default: 40)")
     ospf_group.add_argument("--network-type", default="broadcast",
-                       choices=['broadcast', 'point-to-multipoint', 'point-to-point', 'nbma'],
+                       choices=_NETTYPE_CHOICES,
                        help="OSPF Network type (default: broadcast)")
-    ospf_group.add_argument("--unicast-peer", default=None,
+    ospf_group.add_argument("--unicast-peer", default=None, type=_ipv4_arg,
                        help="OSPF Unicast peer IP for point-to-point (applies to primary interface)")
     ospf_group.add_argument("--interface-unicast-peer", action="append",
                        help="Per-interface unicast peer (format: interface:peer_ip, e.g., eth0:10.0.1.2)")
+    ospf_group.add_argument("--ospf-sock-bufsize", type=_bufsize_arg, default=DEFAULT_SOCK_BUFSIZE,
+                       help=f"OSPF socket send/receive buffer size in bytes, 0 for the kernel default "
+                            f"(default: {DEFAULT_SOCK_BUFSIZE})")
 
     # OSPFv3 arguments (IPv6)
     ospfv3_group = parser.add_argument_group('OSPFv3 Options (IPv6)')
@@ -2616,7 +3377,7 @@ Notes:
                        action="append",
                        help="IPv6 global unicast address (can be specified multiple times)")
     ospfv3_group.add_argument("--ospfv3-network-type", default="broadcast",
-                       choices=['broadcast', 'point-to-point', 'point-to-multipoint'],
+                       choices=_OSPFV3_NETTYPE_CHOICES,
                        help="OSPFv3 Network type (default: broadcast)")
     ospfv3_group.add_argument("--ospfv3-hello-interval", type=int, default=10,
                        help="OSPFv3 Hello interval in seconds (default: 10)")
@@ -2629,19 +3390,19 @@ Notes:
     bgp_group = parser.add_argument_group('BGP Options')
     bgp_group.add_argument("--bgp-local-as", type=int, default=None,
                        help="BGP Local AS number (e.g., 65001)")
-    bgp_group.add_argument("--bgp-peer", dest="bgp_peers", action="append",
+    bgp_group.add_argument("--bgp-peer", dest="bgp_peers", action="append", type=_ip_arg,
                        help="BGP Peer IP address (can be specified multiple times)")
     bgp_group.add_argument("--bgp-peer-as", dest="bgp_peer_as_list", type=int, action="append",
                        help="BGP Peer AS number for corresponding --bgp-peer")
-    bgp_group.add_argument("--bgp-passive", dest="bgp_passive", action="append",
+    bgp_group.add_argument("--bgp-passive", dest="bgp_passive", action="append", type=_ip_arg,
                        help="Mark BGP peer as passive (wait for incoming connection)")
     bgp_group.add_argument("--bgp-route-reflector", action="store_true",
                        help="Enable BGP route reflection")
-    bgp_group.add_argument("--bgp-cluster-id", default=None,
+    bgp_group.add_argument("--bgp-cluster-id", default=None, type=_ipv4_arg,
                        help="BGP Route reflector cluster ID (default: router-id)")
-    bgp_group.add_argument("--bgp-rr-client", dest="bgp_rr_clients", action="append",
+    bgp_group.add_argument("--bgp-rr-client", dest="bgp_rr_clients", action="append", type=_ip_arg,
                        help="Mark BGP peer as route reflector client")
-    bgp_group.add_argument("--bgp-listen-ip", default="0.0.0.0",
+    bgp_group.add_argument("--bgp-listen-ip", default="0.0.0.0", type=_ip_arg,
                        help="BGP Listen IP address (default: 0.0.0.0)")
     bgp_group.add_argument("--bgp-listen-port", type=int, default=179,
                        help="BGP TCP port to listen on (default: 179)")
@@ -2683,7 +3444,7 @@ Notes:
                        help="IS-IS System ID in format AABB.CCDD.EEFF (e.g., 0000.0000.0001)")
     isis_group.add_argument("--isis-area", dest="isis_areas", action="append",
                        help="IS-IS Area address (e.g., 49.0001) - can be specified multiple times")
-    isis_group.add_argument("--isis-level", type=int, choices=[1, 2, 3], default=3,
+    isis_group.add_argument("--isis-level", type=int, choices=_ISIS_LEVEL_CHOICES, default=3,
                        help="IS-IS Level: 1 (L1), 2 (L2), or 3 (L1/L2) (default: 3)")
     isis_group.add_argument("--isis-interface", dest="isis_interfaces", action="append",
                        help="Enable IS-IS on interface (can be specified multiple times)")
@@ -2791,6 +3552,16 @@ Notes:
     bfd_group.add_argument("--bfd-detect-mult", type=int, default=3,
                        help="BFD detection time multiplier (default: 3, detection_time = mult × rx_interval)")
 
+    return parser
+
+
+def main():
+    """
+    Main entry point
+    """
+    install_event_loop_policy()
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Handle Web UI flag logic
@@ -2817,44 +3588,55 @@ Notes:
         try:
             asyncio.run(run_server_only(args))
         except KeyboardInterrupt:
-            print("\nShutting down...")
+            if sys.stderr.isatty():
+                sys.stderr.write("\nShutting down...\n")
             sys.exit(0)
-        except Exception as e:
-            print(f"Fatal error: {e}")
+        except Exception:
+            # Traceback goes through the queue listener, flushed in finally
+            logging.getLogger("ServerOnly").exception("Fatal error")
             sys.exit(1)
+        finally:
+            shutdown_logging()
         return
 
     # Validate configuration for routing mode (container/agent mode)
     if not args.router_id:
-        print("Error: --router-id is required for routing mode")
-        parser.print_help()
+        sys.stderr.write("Error: --router-id is required for routing mode\n")
+        _print_full_help(parser)
         sys.exit(1)
 
+    # Addresses were validated by argparse; pack the router ID once
+    args.router_id_int = _pack_ip_u32(args.router_id)
+
     # Check for OSPF interfaces (support both old and new arg names)
     has_ospf = (hasattr(args, 'interfaces') and args.interfaces) or (hasattr(args, 'interface') and args.interface)
 
     if not has_ospf and not args.bgp_local_as and not args.ospfv3_interface:
-        print("Error: Must specify either OSPFv2 (--interface), OSPFv3 (--ospfv3-interface), or BGP (--bgp-local-as) configuration")
-        parser.print_help()
+        sys.stderr.write("Error: Must specify either OSPFv2 (--interface), OSPFv3 (--ospfv3-interface), or BGP (--bgp-local-as) configuration\n")
+        _print_full_help(parser)
         sys.exit(1)
 
     if args.bgp_local_as and not args.bgp_peers:
-        print("Error: BGP requires at least one peer (--bgp-peer)")
+        sys.stderr.write("Error: BGP requires at least one peer (--bgp-peer)\n")
         sys.exit(1)
 
     if args.bgp_peer_as_list and len(args.bgp_peer_as_list) != len(args.bgp_peers or []):
-        print("Error: Number of --bgp-peer-as must match number of --bgp-peer")
+        sys.stderr.write("Error: Number of --bgp-peer-as must match number of --bgp-peer\n")
         sys.exit(1)
 
     # Run unified agent
     try:
         asyncio.run(run_unified_agent(args))
     except KeyboardInterrupt:
-        print("\nShutting down...")
+        if sys.stderr.isatty():
+            sys.stderr.write("\nShutting down...\n")
         sys.exit(0)
-    except Exception as e:
-        print(f"Fatal error: {e}")
+    except Exception:
+        # Traceback goes through the queue listener, flushed in finally
+        logging.getLogger("UnifiedAgent").exception("Fatal error")
         sys.exit(1)
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":